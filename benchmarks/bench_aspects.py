@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Aspect detection benchmark for the Nataly library.
+
+Compares AstroEngine.get_aspects (compiled AspectTable, pure-Python and NumPy
+kernels) with the per-pair orb lookup and conflict resolution loop it replaced,
+for a full chart and for a chart-vs-chart comparison.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart
+from nataly.constants import ASPECT_DATA, ASPECT_STRENGTH
+from nataly.aspects import np
+from bench_batch import make_records
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_CHARTS = 200
+
+
+def resolve_aspect_conflicts(valid_aspects):
+    """The previous conflict resolution: the strongest aspect within orb, the smallest orb within one strength."""
+    if not valid_aspects:
+        return None
+    return min(valid_aspects, key=lambda x: (ASPECT_STRENGTH.get(x[0], 99), abs(x[2])))
+
+
+def per_pair_aspects(engine, bodies1, bodies2=None):
+    """The previous get_aspects loop: orb lookup per pair and aspect, then conflict resolution."""
+    if bodies2 is None:
+        bodies2 = bodies1
+    results = []
+    processed_pairs = set()
+    for body1 in bodies1.values():
+        for body2 in bodies2.values():
+            if body1.name == body2.name:
+                continue
+            pair_key = tuple(sorted((body1.name, body2.name)))
+            if pair_key in processed_pairs:
+                continue
+            processed_pairs.add(pair_key)
+            angular_diff = engine._calculate_angular_difference(body1.longitude, body2.longitude)
+            valid_aspects = []
+            for aspect_name, aspect_data in ASPECT_DATA.items():
+                orb_diff = angular_diff - aspect_data["angle"]
+                if abs(orb_diff) <= engine._get_categorized_orb(aspect_name, body1.name, body2.name):
+                    valid_aspects.append((aspect_name, aspect_data, orb_diff))
+            best_aspect = resolve_aspect_conflicts(valid_aspects)
+            if best_aspect:
+                results.append((body1.name, body2.name, best_aspect[0], best_aspect[2]))
+    return results
+
+
+def bench(func, pairs):
+    start = time.perf_counter()
+    for bodies1, bodies2 in pairs:
+        func(bodies1, bodies2)
+    return (time.perf_counter() - start) / len(pairs)
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    charts = NatalChart.from_many(make_records(N_CHARTS), engine=engine)
+    print(f"=== Aspect detection ({len(charts[0].bodies_dict)} bodies per chart) ===")
+    for label, pairs in [
+        ("Full chart", [(c.bodies_dict, None) for c in charts]),
+        ("Chart vs chart", [(a.bodies_dict, b.bodies_dict) for a, b in zip(charts, charts[1:])]),
+    ]:
+        before = bench(lambda b1, b2: per_pair_aspects(engine, b1, b2), pairs)
+        after = bench(lambda b1, b2: engine.get_aspects(b1, b2, vectorized=False), pairs)
+        line = f"{label:<15} per-pair lookups: {before * 1e6:9.1f} us   table: {after * 1e6:8.1f} us ({before / after:.1f}x)"
+        if np is not None:
+            vectorized = bench(lambda b1, b2: engine.get_aspects(b1, b2, vectorized=True), pairs)
+            line += f"   numpy: {vectorized * 1e6:8.1f} us ({before / vectorized:.1f}x)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
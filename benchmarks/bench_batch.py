@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Batch chart benchmark for the Nataly library.
+
+Compares building charts one at a time, with a fresh AstroEngine per record
+or one engine shared by all records, with NatalChart.from_many, which finds
+the aspects of all charts together with NumPy. Every chart's aspects are
+read, which a NatalChart otherwise calculates on first access.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_CHARTS = 500
+
+
+def make_records(n):
+    """Builds n birth records spread over a century and the globe."""
+    start = datetime.datetime(1950, 1, 1)
+    return [
+        (f"Person {i}", start + datetime.timedelta(hours=i * 613.7), -50 + (i * 7) % 100, -170 + (i * 13) % 340)
+        for i in range(n)
+    ]
+
+
+def bench_one_at_a_time(records, engine=None):
+    start = time.perf_counter()
+    for name, dt_utc, lat, lon in records:
+        NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path, engine=engine).aspects
+    return time.perf_counter() - start
+
+
+def bench_from_many(records):
+    start = time.perf_counter()
+    for chart in NatalChart.from_many(records, ephe_path=ephe_path):
+        chart.aspects
+    return time.perf_counter() - start
+
+
+def main():
+    records = make_records(N_CHARTS)
+    print(f"=== Batch chart benchmark ({N_CHARTS} charts) ===")
+    single = bench_one_at_a_time(records)
+    print(f"One at a time, new engines:   {N_CHARTS / single:10.1f} charts/s")
+    engine = AstroEngine(ephe_path=ephe_path)
+    engine.aspect_table  # Compile the aspect table outside the timing
+    shared = bench_one_at_a_time(records, engine)
+    print(f"One at a time, shared engine: {N_CHARTS / shared:10.1f} charts/s")
+    batch = bench_from_many(records)
+    print(f"NatalChart.from_many:         {N_CHARTS / batch:10.1f} charts/s  ({single / batch:.2f}x, {shared / batch:.2f}x shared)")
+
+
+if __name__ == "__main__":
+    main()
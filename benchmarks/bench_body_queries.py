@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Body query benchmark for the Nataly library.
+
+NatalChart answers get_bodies_by_* and BodyFilter queries from an index of its
+bodies by type, sign, element, modality, house, dignity and retrograde status,
+built once per chart. This compares a dashboard-style round of queries against
+the same queries answered by scanning bodies_dict.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, BodyFilter
+from nataly.constants import SIGN_NAMES_BY_DEGREE
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_CHARTS = 200
+N_ROUNDS = 20
+
+FILTERS = [
+    BodyFilter(include_axes=False, include_retrograde=True),
+    BodyFilter(include_elements=["Fire", "Air"], exclude_houses=[12]),
+    BodyFilter(include_asteroids=False, include_dignities=["Rulership", "Exaltation"]),
+]
+
+
+def indexed_queries(chart):
+    chart.get_planets(), chart.get_luminaries(), chart.get_retrograde_bodies()
+    for sign in SIGN_NAMES_BY_DEGREE:
+        chart.get_bodies_in_sign(sign)
+    for house in range(1, 13):
+        chart.get_bodies_in_house(house)
+    chart.get_bodies_by_dignities(["Rulership", "Exaltation"])
+    for body_filter in FILTERS:
+        chart.get_bodies(body_filter)
+
+
+def scanned_queries(chart):
+    bodies = chart.bodies_dict.values()
+    [b for b in bodies if b.body_type in ["Planet", "Luminary"]]
+    [b for b in bodies if b.body_type == "Luminary"]
+    [b for b in bodies if b.is_retrograde]
+    for sign in SIGN_NAMES_BY_DEGREE:
+        [b for b in bodies if b.sign.name == sign]
+    for house in range(1, 13):
+        [b for b in bodies if b.house == house]
+    [b for b in bodies if b.dignity in ["Rulership", "Exaltation"]]
+    for body_filter in FILTERS:
+        [b for b in bodies if body_filter.matches(b)]
+
+
+def run(charts, queries):
+    start = time.perf_counter()
+    for _ in range(N_ROUNDS):
+        for chart in charts:
+            queries(chart)
+    return time.perf_counter() - start
+
+
+def main():
+    start = datetime.datetime(1950, 1, 1)
+    records = [("Person", start + datetime.timedelta(days=i * 13.7), 38.4167, 27.150) for i in range(N_CHARTS)]
+    engine = AstroEngine(ephe_path=ephe_path)
+    charts = [NatalChart(*record, engine=engine) for record in records]
+    print(f"=== {N_ROUNDS} query rounds over {N_CHARTS} charts ===")
+    scanned = run(charts, scanned_queries)
+    print(f"Scan bodies_dict: {scanned:.3f}s")
+    indexed = run(charts, indexed_queries)
+    print(f"Body index:       {indexed:.3f}s -> {scanned / indexed:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Lunar calendar benchmark for the Nataly library.
+
+Compares sampling the Moon, the Sun and the planets hour by hour (and only
+reaching hour resolution) with LunarCalendar's root-finding search for a
+50-year calendar of lunations, eclipses and void-of-course Moon periods.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+import swisseph as swe
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, LunarCalendar, LunationEvent, EclipseEvent, VoidOfCourseEvent
+from nataly.constants import PLANET_MAPPING_SWE
+from nataly.context import datetime_to_jd
+from nataly.lunar_calendar import VOID_OF_COURSE_BODIES
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+START = datetime.datetime(2000, 1, 1)
+END = datetime.datetime(2050, 1, 1)
+YEARS = END.year - START.year
+
+
+def hourly_samples(jd_start, days):
+    """Positions a sampling calendar needs: the Moon, the Sun and the planets every hour."""
+    ids = [PLANET_MAPPING_SWE[name] for name in ["Moon"] + VOID_OF_COURSE_BODIES]
+    for hour in range(int(days * 24)):
+        jd = jd_start + hour / 24
+        for planet_id in ids:
+            swe.calc_ut(jd, planet_id, swe.FLG_SPEED)
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    calendar = LunarCalendar(engine)
+    print(f"=== {YEARS}-year calendar ({START.year}-{END.year}) ===")
+
+    start = time.perf_counter()
+    hourly_samples(datetime_to_jd(START), 365.25)
+    sampled = (time.perf_counter() - start) * YEARS
+    print(f"Hourly sampling:       {sampled:.2f}s estimated (positions only, 1 h resolution)")
+
+    start = time.perf_counter()
+    counts = {LunationEvent: 0, EclipseEvent: 0, VoidOfCourseEvent: 0}
+    for event in calendar.iter_events(START, END):
+        counts[type(event)] += 1
+    elapsed = time.perf_counter() - start
+    print(f"LunarCalendar:         {elapsed:.2f}s -> {sampled / elapsed:.1f}x vs sampling")
+    print(f"  {counts[LunationEvent]} lunations, {counts[EclipseEvent]} eclipses, {counts[VoidOfCourseEvent]} void-of-course periods")
+
+    for label, stream in [
+        ("lunations", calendar.iter_lunations(START, END)),
+        ("eclipses", calendar.iter_eclipses(START, END)),
+        ("void of course", calendar.iter_void_of_course(START, END)),
+    ]:
+        start = time.perf_counter()
+        count = sum(1 for _ in stream)
+        print(f"  {label + ':':<16} {time.perf_counter() - start:.2f}s ({count})")
+
+
+if __name__ == "__main__":
+    main()
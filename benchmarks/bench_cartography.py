@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Astrocartography benchmark for the Nataly library.
+
+Compares a naive world grid at 1 degree resolution (one swe.houses call per
+place, checking which bodies sit near an angle) with AstroCartography, which
+derives the lines from right ascension, declination and sidereal time as
+NumPy arrays.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+import numpy as np
+import swisseph as swe
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, AstroCartography
+from nataly.context import datetime_to_jd
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+DT = datetime.datetime(1990, 2, 27, 7, 15)
+LATITUDES = np.arange(-89, 90, 1.0)
+LONGITUDES = np.arange(-180, 180, 1.0)
+ORB = 1.0
+SAMPLES = 2000
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    jd = datetime_to_jd(DT)
+    cells = len(LATITUDES) * len(LONGITUDES)
+    print(f"=== World grid at 1 degree ({cells} places) ===")
+
+    positions = [engine._calc_ut(jd, planet_id, swe.FLG_SPEED)[0][0] for planet_id in range(10)]
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    for _ in range(SAMPLES):
+        try:
+            _, ascmc = swe.houses(jd, float(rng.choice(LATITUDES)), float(rng.choice(LONGITUDES)), b'P')
+        except swe.Error:  # Placidus is undefined inside the polar circles
+            continue
+        angles = (ascmc[0], ascmc[1], ascmc[0] + 180, ascmc[1] + 180)
+        [(p, a) for p in positions for a in angles if abs((p - a + 180) % 360 - 180) <= ORB]
+    naive = (time.perf_counter() - start) / SAMPLES * cells
+    print(f"swe.houses per place:  {naive:.2f}s estimated")
+
+    start = time.perf_counter()
+    world = AstroCartography(DT, engine=engine)
+    lines = world.lines(lat_step=1.0)
+    elapsed_lines = time.perf_counter() - start
+    grid = world.distance_grid(LATITUDES, LONGITUDES)
+    angular = sum(int(np.count_nonzero(distances <= ORB)) for distances in grid.values())
+    elapsed = time.perf_counter() - start
+    segments = sum(len(polylines) for angles in lines.values() for polylines in angles.values())
+    print(f"AstroCartography:      {elapsed_lines * 1000:.1f}ms for {segments} polylines of {len(world.body_names)} bodies")
+    print(f"  + distance grid:     {elapsed:.3f}s total ({angular} angular body/places) -> {naive / elapsed:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Exact-aspect search benchmark for the Nataly library.
+
+Measures EventFinder queries per second ("when does transiting X make aspect Y
+to my Z") and compares one query with scanning a NatalChart per day, then
+times a 100-year ingress and station calendar for every body.
+"""
+
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, EventFinder
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_QUERIES = 200
+BODIES = ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
+ASPECTS = ["Conjunction", "Sextile", "Square", "Trine", "Opposition"]
+START = datetime.datetime(2025, 1, 1)
+END = datetime.datetime(2026, 1, 1)
+CALENDAR_START = datetime.datetime(1950, 1, 1)
+CALENDAR_END = datetime.datetime(2050, 1, 1)
+
+
+def daily_chart_scan(engine, body, target, angle):
+    """The previous approach: one chart per day, reporting the days the aspect perfects."""
+    days = []
+    previous = None
+    day = START
+    while day <= END:
+        lon = NatalChart("Transit", day, 0.0, 0.0, engine=engine).bodies_dict[body].longitude
+        diff = abs((lon - target + 180) % 360 - 180) - angle
+        if previous is not None and (previous < 0) != (diff < 0):
+            days.append(day)
+        previous = diff
+        day += datetime.timedelta(days=1)
+    return days
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    finder = EventFinder(engine)
+    rng = random.Random(7)
+    queries = [(rng.choice(BODIES), rng.uniform(0, 360), rng.choice(ASPECTS)) for _ in range(N_QUERIES)]
+
+    print(f"=== Exact aspect search over {(END - START).days} days ===")
+    start = time.perf_counter()
+    events = sum(len(finder.find_exact_aspects(body, target, aspect, START, END)) for body, target, aspect in queries)
+    elapsed = time.perf_counter() - start
+    print(f"EventFinder:      {N_QUERIES / elapsed:8.1f} queries/s ({events} exact events)")
+
+    start = time.perf_counter()
+    daily_chart_scan(engine, "Saturn", 100.0, 90.0)
+    scan = time.perf_counter() - start
+    print(f"Daily chart scan: {1 / scan:8.1f} queries/s (day resolution only) -> {scan * N_QUERIES / elapsed:.0f}x")
+
+    print(f"\n=== Ingress and station calendar, {CALENDAR_START.year}-{CALENDAR_END.year}, all bodies ===")
+    start = time.perf_counter()
+    counts = {}
+    for event in finder.iter_events(CALENDAR_START, CALENDAR_END):
+        kind = type(event).__name__
+        counts[kind] = counts.get(kind, 0) + 1
+    elapsed = time.perf_counter() - start
+    print(f"EventFinder.iter_events: {elapsed:.2f}s ({counts})")
+
+    start = time.perf_counter()
+    day = datetime.datetime(2025, 1, 1)
+    for _ in range(365):
+        engine.get_planets_and_houses(day, 0.0, 0.0)
+        day += datetime.timedelta(days=1)
+    sampled = time.perf_counter() - start
+    years = CALENDAR_END.year - CALENDAR_START.year
+    print(f"Daily get_planets_and_houses sampling: {sampled * years:.2f}s estimated for {years} years (misses events shorter than a day)")
+
+
+if __name__ == "__main__":
+    main()
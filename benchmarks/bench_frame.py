@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+ChartFrame benchmark for the Nataly library.
+
+Compares a population query (element distribution and the number of Fire
+bodies in the 10th house per chart) over NatalChart objects with the same
+query over a ChartFrame calculated straight into columns.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, BodyFilter, ChartFrame, NatalChart
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_CHARTS = 2000
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    start = datetime.datetime(1950, 1, 1)
+    records = [(f"Person {i}", start + datetime.timedelta(days=i * 13.7), -50 + (i * 7.3) % 100, -180 + (i * 13.7) % 360) for i in range(N_CHARTS)]
+    fire_tenth = BodyFilter(include_elements=["Fire"], include_houses=[10])
+    print(f"=== Population query over {N_CHARTS} charts ===")
+
+    begin = time.perf_counter()
+    charts = NatalChart.from_many(records, engine=engine)
+    built = time.perf_counter() - begin
+    fire = [chart.element_distribution["Fire"]["count"] for chart in charts]
+    counts = [len(chart.get_bodies(fire_tenth)) for chart in charts]
+    objects = time.perf_counter() - begin
+    print(f"NatalChart objects: {built:.3f}s build, {objects:.3f}s with query")
+
+    begin = time.perf_counter()
+    frame = ChartFrame.from_records(records, engine=engine)
+    built = time.perf_counter() - begin
+    frame_fire = frame.distribution("element")["Fire"]
+    frame_counts = frame.count(fire_tenth)
+    columns = time.perf_counter() - begin
+    print(f"ChartFrame:         {built:.3f}s build, {columns:.3f}s with query -> {objects / columns:.1f}x")
+    assert frame_fire.tolist() == fire and frame_counts.tolist() == counts
+
+
+if __name__ == "__main__":
+    main()
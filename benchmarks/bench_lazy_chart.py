@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Lazy chart benchmark for the Nataly library.
+
+NatalChart calculates its aspects, distributions and element-modality matrix
+on first access. This compares building charts that are only read for their
+bodies with building charts whose analyses are all read, which is what every
+construction used to cost.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_CHARTS = 1000
+
+
+def build(engine, records, read_analyses):
+    start = time.perf_counter()
+    for name, dt_utc, lat, lon in records:
+        chart = NatalChart(name, dt_utc, lat, lon, engine=engine)
+        chart.bodies_dict["Sun"].longitude
+        if read_analyses:
+            chart.aspects, chart.element_distribution, chart.element_modality_matrix
+    return time.perf_counter() - start
+
+
+def main():
+    start = datetime.datetime(1950, 1, 1)
+    records = [("Person", start + datetime.timedelta(days=i * 13.7), 38.4167, 27.150) for i in range(N_CHARTS)]
+    engine = AstroEngine(ephe_path=ephe_path)
+    print(f"=== {N_CHARTS} charts ===")
+    full = build(engine, records, True)
+    print(f"Positions and analyses: {full:.3f}s")
+    positions = build(engine, records, False)
+    print(f"Positions only:         {positions:.3f}s -> {full / positions:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Live chart benchmark for the Nataly library.
+
+Compares building a NatalChart for every frame of a live sky display with
+LiveChart.advance, which updates the chart in place and only re-matches the
+body pairs whose separation crossed an orb window edge. Both sides read the
+aspects, which a NatalChart otherwise calculates on first access.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, LiveChart, NatalChart
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_FRAMES = 1000
+FRAME_STEP = datetime.timedelta(seconds=5)
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    start = datetime.datetime(2024, 3, 20)
+    frames = [start + i * FRAME_STEP for i in range(1, N_FRAMES + 1)]
+    print(f"=== {N_FRAMES} frames, {FRAME_STEP.total_seconds():.0f}s apart ===")
+
+    begin = time.perf_counter()
+    for dt in frames:
+        NatalChart("Sky", dt, 41.0082, 28.9784, engine=engine).aspects
+    rebuilt = time.perf_counter() - begin
+    print(f"NatalChart per frame: {rebuilt:.3f}s")
+
+    live = LiveChart("Sky", start, 41.0082, 28.9784, engine=engine)
+    begin = time.perf_counter()
+    changes = 0
+    for dt in frames:
+        diff = live.advance(dt)
+        live.aspects
+        changes += len(diff.entered_aspects) + len(diff.left_aspects) + len(diff.sign_changes) + len(diff.house_changes)
+    advanced = time.perf_counter() - begin
+    print(f"LiveChart.advance:    {advanced:.3f}s -> {rebuilt / advanced:.1f}x ({changes} changes reported)")
+
+
+if __name__ == "__main__":
+    main()
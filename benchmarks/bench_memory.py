@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the Nataly library.
+
+Measures with tracemalloc the bytes held per NatalChart, and per chart's
+bodies, houses and aspects alone, while many charts are kept in memory.
+Every chart's aspects are calculated before it is measured. The same
+content is also measured as a baseline copied into plain dataclasses with
+a per-instance __dict__ and a Sign object of its own for every body and
+house, as the models were before they were slotted and interned.
+"""
+
+import datetime
+import gc
+from dataclasses import fields, make_dataclass
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart
+from nataly.models import Aspect, Body, House, Sign
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_CHARTS = 2000
+
+
+def held_bytes(build):
+    """Bytes still allocated after build() returns, while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return held, result
+
+
+def plain_class(cls):
+    """Dataclass with the fields of a model class but without __slots__."""
+    return make_dataclass(cls.__name__, [(f.name, f.type) for f in fields(cls)])
+
+
+PlainSign, PlainBody, PlainHouse, PlainAspect = (plain_class(cls) for cls in (Sign, Body, House, Aspect))
+
+
+def plain(obj, cls, **changes):
+    values = {f.name: getattr(obj, f.name) for f in fields(cls)}
+    values.update(changes)
+    return cls(**values)
+
+
+def unslotted(bodies_dict, houses, aspects):
+    """Baseline copies of a chart's bodies, houses and aspects: no slots, no shared signs."""
+    bodies = {
+        name: plain(body, PlainBody, sign=plain(body.sign, PlainSign))
+        for name, body in bodies_dict.items()
+    }
+    houses = [
+        plain(
+            house, PlainHouse, sign=plain(house.sign, PlainSign),
+            classic_ruler=house.classic_ruler and bodies[house.classic_ruler.name],
+            modern_ruler=house.modern_ruler and bodies[house.modern_ruler.name],
+        )
+        for house in houses
+    ]
+    aspects = [plain(a, PlainAspect, body1=bodies[a.body1.name], body2=bodies[a.body2.name]) for a in aspects]
+    return bodies, houses, aspects
+
+
+def unslotted_charts(charts):
+    for chart in charts:
+        chart._populate(chart.name, chart.datetime_utc, chart.latitude, chart.longitude, chart.engine,
+                        *unslotted(chart.bodies_dict, chart.houses, chart.aspects))
+    return charts
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    start = datetime.datetime(1950, 1, 1)
+    records = [("Person", start + datetime.timedelta(days=i * 13.7), 38.4167, 27.150) for i in range(N_CHARTS)]
+    # Warm up the aspect table and module-level state outside the measurement
+    NatalChart.from_many(records[:2], engine=engine)
+    print(f"=== {N_CHARTS} charts in memory ===")
+
+    print(f"{'':28}{'baseline':>10}{'current':>10}")
+
+    baseline, _ = held_bytes(lambda: unslotted_charts(NatalChart.from_many(records, engine=engine)))
+    current, _ = held_bytes(lambda: [chart for chart in NatalChart.from_many(records, engine=engine) if chart.aspects is not None])
+    print(f"{'NatalChart:':28}{baseline / N_CHARTS:10.0f}{current / N_CHARTS:10.0f} bytes per chart")
+
+    baseline, _ = held_bytes(lambda: [unslotted(*result) for result in engine.compute_batch(records, with_aspects=True)])
+    current, _ = held_bytes(lambda: engine.compute_batch(records, with_aspects=True))
+    print(f"{'Bodies, houses and aspects:':28}{baseline / N_CHARTS:10.0f}{current / N_CHARTS:10.0f} bytes per chart")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Orb switching benchmark for the Nataly library.
+
+Compares rebuilding a NatalChart for every change of orb configuration, with
+a new engine or with one engine kept per configuration, with
+NatalChart.with_orbs, which keeps bodies and houses and re-filters the
+chart's precomputed pair distances through the other orb table. Both sides
+read the aspects, which a NatalChart otherwise calculates on first access.
+The same comparison is run for LiveChart, whose with_orbs also copies the
+bodies and houses so each chart can be advanced on its own.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, LiveChart
+from nataly.config import ORB_CONFIGS
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_SWITCHES = 200
+
+
+def bench(chart_class, dt_utc, configs):
+    name = chart_class.__name__
+    start = time.perf_counter()
+    for orb_config in configs:
+        chart_class("User", dt_utc, 38.4167, 27.150, orb_config=orb_config, ephe_path=ephe_path).aspects
+    rebuilt = time.perf_counter() - start
+    print(f"{'New ' + name + ' per switch:':41}{rebuilt:.3f}s")
+
+    engines = {id(orb_config): AstroEngine(orb_config, ephe_path) for orb_config in configs}
+    start = time.perf_counter()
+    for orb_config in configs:
+        chart_class("User", dt_utc, 38.4167, 27.150, engine=engines[id(orb_config)]).aspects
+    reused = time.perf_counter() - start
+    print(f"{'New ' + name + ' per switch, same engines:':41}{reused:.3f}s")
+
+    chart = chart_class("User", dt_utc, 38.4167, 27.150, engine=AstroEngine(ephe_path=ephe_path))
+    start = time.perf_counter()
+    for orb_config in configs:
+        chart.with_orbs(orb_config).aspects
+    switched = time.perf_counter() - start
+    print(f"{name + '.with_orbs:':41}{switched:.3f}s -> {rebuilt / switched:.1f}x ({reused / switched:.1f}x with the same engines)")
+
+
+def main():
+    dt_utc = datetime.datetime(1990, 2, 27, 7, 15)
+    configs = [ORB_CONFIGS[name] for name in ("Default", "Classical")] * (N_SWITCHES // 2)
+    print(f"=== {N_SWITCHES} orb configuration switches ===")
+    bench(NatalChart, dt_utc, configs)
+    bench(LiveChart, dt_utc, configs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Parallel chart benchmark for the Nataly library.
+
+Measures NatalChart.from_many throughput on the serial AstroEngine and on a
+ParallelAstroEngine with an increasing number of worker processes. Charts
+build their Body, House and Aspect objects on first access in the calling
+process, so throughput is given for the batch alone and with every chart's
+aspects read.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import NatalChart, AstroEngine, ParallelAstroEngine
+from bench_batch import make_records
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_CHARTS = 2000
+
+
+def bench(engine, records, read_aspects):
+    start = time.perf_counter()
+    charts = NatalChart.from_many(records, engine=engine)
+    if read_aspects:
+        for chart in charts:
+            chart.aspects
+    return time.perf_counter() - start
+
+
+def cell(elapsed, serial=None):
+    text = f"{N_CHARTS / elapsed:8.1f} charts/s"
+    if serial is not None:
+        text += f" ({serial / elapsed:.2f}x)"
+    return f"{text:28}"
+
+
+def main():
+    records = make_records(N_CHARTS)
+    cpus = os.cpu_count() or 1
+    print(f"=== Parallel chart benchmark ({N_CHARTS} charts, {cpus} CPUs) ===")
+    print(f"{'':18}{'   batch':28}   aspects read")
+    serial = [bench(AstroEngine(ephe_path=ephe_path), records, read) for read in (False, True)]
+    print(f"{'Serial engine:':18}" + "".join(cell(t) for t in serial).rstrip())
+
+    workers = 1
+    while workers <= cpus:
+        with ParallelAstroEngine(ephe_path=ephe_path, max_workers=workers) as engine:
+            bench(engine, records[:workers * 4], False)  # Start the pool before timing
+            elapsed = [bench(engine, records, read) for read in (False, True)]
+        print(f"{f'{workers} worker(s):':18}" + "".join(cell(t, base) for t, base in zip(elapsed, serial)).rstrip())
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
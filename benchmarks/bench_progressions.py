@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Progression benchmark for the Nataly library.
+
+Compares building a NatalChart at birth + N days for every age (and matching
+every progressed and natal point pair) with ProgressionSeries, which
+sweeps the ephemeris once and matches all ages as arrays. Solar arc
+directions come from the same series.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, ProgressionSeries
+from bench_transits import cross_product_aspects
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+END_AGE = 90
+STEP_YEARS = 1 / 12
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    natal = NatalChart("User", datetime.datetime(1990, 2, 27, 7, 15), 38.4167, 27.150, engine=engine)
+    ages = [i * STEP_YEARS for i in range(int(END_AGE / STEP_YEARS) + 1)]
+    print(f"=== Monthly progressions to age {END_AGE} ({len(ages)} ages) ===")
+
+    sample = ages[::10]
+    start = time.perf_counter()
+    for age in sample:
+        chart = NatalChart("Progressed", natal.datetime_utc + datetime.timedelta(days=age), natal.latitude, natal.longitude, engine=engine)
+        cross_product_aspects(engine, chart.bodies_dict, natal.bodies_dict)
+    per_chart = (time.perf_counter() - start) / len(sample) * len(ages)
+    print(f"NatalChart per age:     {per_chart:.2f}s estimated")
+
+    start = time.perf_counter()
+    series = ProgressionSeries(natal, 0, END_AGE, STEP_YEARS)
+    built = time.perf_counter() - start
+    progressed = series.progressed_aspects()
+    matched = time.perf_counter() - start
+    directed = series.directed_aspects()
+    total = time.perf_counter() - start
+    print(f"ProgressionSeries:      {built:.2f}s sweep, {matched:.2f}s with progressed aspects -> {per_chart / matched:.1f}x")
+    print(f"  + solar arc aspects:  {total:.2f}s total ({sum(map(len, progressed))} progressed, {sum(map(len, directed))} directed aspects)")
+
+
+if __name__ == "__main__":
+    main()
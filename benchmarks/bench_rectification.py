@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Rectification benchmark for the Nataly library.
+
+Compares evaluating candidate birth times with get_planets_and_houses every
+second over a day with RectificationSearch, which recalculates only the
+angles, cusps and Moon per instant and bisects the window boundaries.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, RectificationSearch
+from nataly.context import datetime_to_jd
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+LAT, LON = 38.4167, 27.150
+START = datetime.datetime(1990, 2, 27)
+END = datetime.datetime(1990, 2, 28)
+CONSTRAINTS = ["AC in Virgo", "Jupiter in house 10", "Moon in house 8"]
+SAMPLES = 2000
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    seconds = int((END - START).total_seconds())
+    print(f"=== One day of candidate birth times, 1 s resolution ({seconds} instants) ===")
+
+    start = time.perf_counter()
+    for i in range(SAMPLES):
+        engine.get_planets_and_houses(START + datetime.timedelta(seconds=i * seconds / SAMPLES), LAT, LON)
+    full = (time.perf_counter() - start) / SAMPLES
+    print(f"get_planets_and_houses per second:   {full * seconds:.2f}s estimated ({full * 1e6:.0f} us per instant)")
+
+    start = time.perf_counter()
+    search = RectificationSearch(START, END, LAT, LON, engine=engine)
+    prepared = time.perf_counter() - start
+    jd = datetime_to_jd(START)
+    start = time.perf_counter()
+    for i in range(SAMPLES):
+        search.houses_at(jd + i / SAMPLES)
+        search.longitude_at("Moon", jd + i / SAMPLES)
+        search.longitude_at("Jupiter", jd + i / SAMPLES)
+    fast = (time.perf_counter() - start) / SAMPLES
+    print(f"RectificationSearch per second:      {prepared + fast * seconds:.2f}s estimated ({fast * 1e6:.0f} us per instant)")
+
+    start = time.perf_counter()
+    windows = search.find_windows(CONSTRAINTS)
+    elapsed = time.perf_counter() - start
+    print(f"find_windows (2 min scan, bisection): {prepared + elapsed:.3f}s -> {full * seconds / (prepared + elapsed):.0f}x vs full charts")
+    for begin, end in windows:
+        print(f"  {begin:%H:%M:%S} - {end:%H:%M:%S}  {', '.join(CONSTRAINTS)}")
+
+
+if __name__ == "__main__":
+    main()
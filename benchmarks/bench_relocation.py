@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Relocation benchmark for the Nataly library.
+
+Compares building a NatalChart for one instant at every location with
+NatalChart.relocate_many, which keeps the body positions and the aspects
+between them and recalculates only the houses, angles and angle aspects.
+Both sides read the aspects, which are calculated on first access.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_LOCATIONS = 500
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    dt_utc = datetime.datetime(1990, 2, 27, 7, 15)
+    chart = NatalChart("User", dt_utc, 38.4167, 27.150, engine=engine)
+    locations = [(-60 + (i * 7.3) % 120, -180 + (i * 13.7) % 360) for i in range(N_LOCATIONS)]
+    print(f"=== One chart at {N_LOCATIONS} locations ===")
+
+    start = time.perf_counter()
+    for lat, lon in locations:
+        NatalChart("User", dt_utc, lat, lon, engine=engine).aspects
+    full = time.perf_counter() - start
+    print(f"NatalChart per location: {full:.3f}s")
+
+    start = time.perf_counter()
+    for moved in chart.relocate_many(locations):
+        moved.aspects
+    relocated = time.perf_counter() - start
+    print(f"relocate_many:           {relocated:.3f}s -> {full / relocated:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
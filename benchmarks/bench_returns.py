@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Return finder benchmark for the Nataly library.
+
+Compares the brute-force search done in application code (building NatalCharts
+hour by hour around each expected return) with ReturnFinder for a year of
+lunar returns of many users.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, ReturnFinder
+from bench_batch import make_records
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_USERS = 50
+START = datetime.datetime(2025, 1, 1)
+END = datetime.datetime(2026, 1, 1)
+
+
+def brute_force_first_return(engine, natal):
+    """Hourly charts until the Moon passes its natal longitude (minute resolution would cost 60x more)."""
+    moon = natal.bodies_dict["Moon"].longitude
+    dt_utc, previous = START, None
+    while True:
+        lon = NatalChart("Scan", dt_utc, natal.latitude, natal.longitude, engine=engine).bodies_dict["Moon"].longitude
+        diff = (lon - moon + 180) % 360 - 180
+        if previous is not None and previous < 0 <= diff:
+            return dt_utc
+        previous, dt_utc = diff, dt_utc + datetime.timedelta(hours=1)
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    natals = NatalChart.from_many(make_records(N_USERS), engine=engine)
+    finder = ReturnFinder(engine)
+    print(f"=== Lunar returns {START.year} for {N_USERS} users ===")
+
+    start = time.perf_counter()
+    for natal in natals[:3]:
+        brute_force_first_return(engine, natal)
+    brute = (time.perf_counter() - start) / 3 * 13
+    print(f"Hourly chart scan:          {brute * N_USERS:.2f}s estimated (1 h resolution)")
+
+    start = time.perf_counter()
+    for natal in natals:
+        near = START
+        while near < END:
+            chart = finder.lunar_return(natal, near)
+            near = chart.datetime_utc + datetime.timedelta(days=27.3)
+    single = time.perf_counter() - start
+    print(f"lunar_return one by one:    {single:.2f}s")
+
+    start = time.perf_counter()
+    charts = finder.lunar_returns_batch(natals, START, END)
+    batch = time.perf_counter() - start
+    print(f"lunar_returns_batch:        {batch:.2f}s ({sum(len(c) for c in charts)} charts) -> {brute * N_USERS / batch:.0f}x vs scan")
+
+    start = time.perf_counter()
+    finder.return_jds("Moon", [n.bodies_dict["Moon"].longitude for n in natals], START, END)
+    print(f"return_jds (instants only): {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
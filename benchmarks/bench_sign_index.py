@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Sign index benchmark for the Nataly library.
+
+Builds a SignIndex, then compares Moon sign lookups for many birth instants
+with one ephemeris call per instant (the cheapest engine path, without full
+charts) and with full charts.
+"""
+
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import swisseph as swe
+
+from nataly import AstroEngine, NatalChart, SignIndex
+from nataly.aspects import np
+from nataly.context import datetime_to_jd
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+START = datetime.datetime(1900, 1, 1)
+END = datetime.datetime(2030, 1, 1)
+N_LOOKUPS = 1_000_000
+N_EPHEMERIS = 20_000
+N_CHARTS = 300
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    start = time.perf_counter()
+    index = SignIndex.build(START, END, ["Sun", "Moon", "Mercury", "Venus", "Mars"], engine=engine)
+    print(f"=== Sign index {START.year}-{END.year} built in {time.perf_counter() - start:.2f}s ===")
+
+    rng = random.Random(3)
+    jd_start, jd_end = datetime_to_jd(START), datetime_to_jd(END)
+    jds = [rng.uniform(jd_start, jd_end) for _ in range(N_LOOKUPS)]
+
+    start = time.perf_counter()
+    for jd in jds[:N_EPHEMERIS]:
+        engine._get_sign_from_longitude(swe.calc_ut(jd, swe.MOON, swe.FLG_SPEED)[0][0])
+    ephemeris = (time.perf_counter() - start) / N_EPHEMERIS
+    print(f"Ephemeris call per instant: {1 / ephemeris:12,.0f} lookups/s")
+
+    start = time.perf_counter()
+    for jd in jds[:N_CHARTS]:
+        NatalChart("Test", START + datetime.timedelta(days=jd - jd_start), 0.0, 0.0, engine=engine)
+    chart = (time.perf_counter() - start) / N_CHARTS
+    print(f"Full NatalChart:            {1 / chart:12,.0f} lookups/s")
+
+    start = time.perf_counter()
+    for jd in jds[:N_EPHEMERIS]:
+        index.sign_index_at("Moon", jd)
+    single = (time.perf_counter() - start) / N_EPHEMERIS
+    print(f"SignIndex.sign_index_at:    {1 / single:12,.0f} lookups/s ({ephemeris / single:.0f}x)")
+
+    if np is not None:
+        array = np.asarray(jds)
+        start = time.perf_counter()
+        index.sign_indexes("Moon", array)
+        bulk = (time.perf_counter() - start) / N_LOOKUPS
+        print(f"SignIndex.sign_indexes:     {1 / bulk:12,.0f} lookups/s ({ephemeris / bulk:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
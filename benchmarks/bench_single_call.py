@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Single ephemeris call benchmark for the Nataly library.
+
+Compares the per-chart time of AstroEngine.get_planets_and_houses with the
+default two calls per body against single_call=True.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine
+from bench_batch import make_records
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_CHARTS = 2000
+REPEAT = 5
+
+
+def bench(engine, records):
+    """Returns the best of REPEAT timings to reduce scheduling noise."""
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _, dt_utc, lat, lon in records:
+            engine.get_planets_and_houses(dt_utc, lat, lon)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    records = make_records(N_CHARTS)
+    print(f"=== Positions and houses per chart ({N_CHARTS} charts) ===")
+    two_calls = bench(AstroEngine(ephe_path=ephe_path), records)
+    print(f"Two calls per body: {two_calls / N_CHARTS * 1e6:8.1f} us/chart")
+    one_call = bench(AstroEngine(ephe_path=ephe_path, single_call=True), records)
+    print(f"Single call:        {one_call / N_CHARTS * 1e6:8.1f} us/chart  ({two_calls / one_call:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Synastry batch benchmark for the Nataly library.
+
+Compares one get_aspects(user, candidate) call per candidate with SynastryBatch
+aspect lists, streamed aspect lists and scores for the same candidates.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, SynastryBatch, stack_positions
+from bench_batch import make_records
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_CANDIDATES = 2000
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    candidates = [bodies for bodies, _ in engine.compute_batch(make_records(N_CANDIDATES + 1))]
+    user = candidates.pop()
+    names = list(user)
+    rows = stack_positions(candidates, names)
+
+    print(f"=== Synastry: 1 user vs {len(candidates)} candidates ({len(names)} bodies each) ===")
+    per_call, expected = timed(lambda: [engine.get_aspects(user, candidate) for candidate in candidates])
+    print(f"get_aspects per candidate:  {per_call:.3f}s")
+    for vectorized in (False, True):
+        batch = SynastryBatch(user, names, engine.orb_config, vectorized=vectorized)
+        label = "numpy" if vectorized else "python"
+        elapsed, results = timed(lambda: batch.aspects(rows))
+        assert [len(r) for r in results] == [len(e) for e in expected]
+        print(f"SynastryBatch.aspects ({label}): {elapsed:.3f}s ({per_call / elapsed:.1f}x)")
+        elapsed, _ = timed(lambda: sum(1 for _ in batch.iter_aspects(iter(rows), chunk_size=256)))
+        print(f"SynastryBatch.iter_aspects ({label}): {elapsed:.3f}s ({per_call / elapsed:.1f}x)")
+        elapsed, _ = timed(lambda: batch.scores(rows))
+        print(f"SynastryBatch.scores ({label}): {elapsed:.3f}s ({per_call / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
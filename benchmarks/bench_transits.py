@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Transit timeline benchmark for the Nataly library.
+
+Compares the daily transit job done per subscriber (one transit chart per
+subscriber and step, matched against every natal body through the engine's
+orb table) with one TransitTimeline evaluated against every subscriber.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, TransitTimeline
+from bench_batch import make_records
+
+# Path to directory containing Swiss Ephemeris .se1 files
+ephe_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ephe'))
+
+N_SUBSCRIBERS = 100
+N_DAYS = 30
+
+
+def cross_product_aspects(engine, bodies1, bodies2):
+    """Aspects of every bodies1 x bodies2 pair, one pair at a time through the engine's orb table."""
+    table = engine.aspect_table
+    aspects = []
+    for body1 in bodies1.values():
+        for body2 in bodies2.values():
+            separation = engine._calculate_angular_difference(body1.longitude, body2.longitude)
+            buckets = table.candidates[table.index_of(body1.name)][table.index_of(body2.name)]
+            for k, angle, orb_limit in buckets[int(separation)]:
+                if abs(separation - angle) <= orb_limit:
+                    aspects.append((body1.name, body2.name, table.aspect_names[k]))
+                    break
+    return aspects
+
+
+def per_subscriber(engine, natals, times, bodies):
+    results = []
+    for natal in natals:
+        steps = []
+        for dt_utc in times:
+            transit = NatalChart("Transit", dt_utc, 0.0, 0.0, engine=engine, bodies=bodies)
+            steps.append(cross_product_aspects(engine, transit.bodies_dict, natal.bodies_dict))
+        results.append(steps)
+    return results
+
+
+def main():
+    engine = AstroEngine(ephe_path=ephe_path)
+    natals = NatalChart.from_many(make_records(N_SUBSCRIBERS), engine=engine)
+    start = datetime.datetime(2024, 1, 1)
+    end = start + datetime.timedelta(days=N_DAYS - 1)
+
+    print(f"=== Transits: {N_SUBSCRIBERS} subscribers x {N_DAYS} daily steps ===")
+    t0 = time.perf_counter()
+    timeline = TransitTimeline(start, end, engine=engine)
+    t1 = time.perf_counter()
+    shared = list(timeline.evaluate(natals))
+    t2 = time.perf_counter()
+    before = per_subscriber(engine, natals, timeline.times, timeline.body_names)
+    t3 = time.perf_counter()
+
+    assert [[[a[:3] for a in step] for step in steps] for steps in shared] == before
+    print(f"Per subscriber:   {t3 - t2:.3f}s")
+    print(f"TransitTimeline:  {t2 - t0:.3f}s (build {t1 - t0:.3f}s, evaluate {t2 - t1:.3f}s) -> {(t3 - t2) / (t2 - t0):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,21 @@
 import os
 from .chart import NatalChart
 from .engine import AstroEngine
-from .models import Body, House, Aspect, Sign, BodyFilter, OrbConfig
+from .parallel import ParallelAstroEngine
+from .context import JDContext
+from .cache import EphemerisCache
+from .synastry import SynastryBatch, stack_positions
+from .transits import TransitTimeline
+from .events import EventFinder
+from .sign_index import SignIndex
+from .returns import ReturnFinder
+from .lunar_calendar import LunarCalendar
+from .progressions import ProgressionSeries
+from .rectification import RectificationSearch, RectificationConstraint
+from .cartography import AstroCartography
+from .live import LiveChart
+from .frame import ChartFrame
+from .models import Body, House, Aspect, AspectEvent, IngressEvent, StationEvent, LunationEvent, EclipseEvent, VoidOfCourseEvent, ChartDiff, Sign, BodyFilter, OrbConfig
 from .constants import (
     SIGNS, BODY_SYMBOLS, ALL_BODY_NAMES,
     ASPECT_DATA, DIGNITY_RULES,
@@ -33,9 +47,32 @@ __all__ = [
     # Core classes
     "NatalChart",
     "AstroEngine", 
+    "ParallelAstroEngine",
+    "JDContext",
+    "EphemerisCache",
+    "SynastryBatch",
+    "stack_positions",
+    "TransitTimeline",
+    "EventFinder",
+    "SignIndex",
+    "ReturnFinder",
+    "LunarCalendar",
+    "ProgressionSeries",
+    "RectificationSearch",
+    "RectificationConstraint",
+    "AstroCartography",
+    "LiveChart",
+    "ChartFrame",
     "Body",
     "House",
     "Aspect",
+    "AspectEvent",
+    "IngressEvent",
+    "StationEvent",
+    "LunationEvent",
+    "EclipseEvent",
+    "VoidOfCourseEvent",
+    "ChartDiff",
     "Sign",
     "BodyFilter",
     "OrbConfig",
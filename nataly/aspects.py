@@ -0,0 +1,284 @@
+# nataly/aspects.py
+# Orb configuration compiled into lookup tables for aspect detection.
+
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python kernel is used without it
+    np = None
+
+from .constants import (
+    ALL_BODY_NAMES, ASPECT_DATA, ASPECT_STRENGTH,
+    ORB_BODY_GROUPS, ORB_ASPECT_GROUPS
+)
+
+# Reverse lookups built once from the orb group definitions.
+_BODY_ORB_GROUP = {}
+for _group_key, _group_list in ORB_BODY_GROUPS.items():
+    for _name in _group_list:
+        _BODY_ORB_GROUP.setdefault(_name, _group_key)
+_ASPECT_ORB_TYPE = {}
+for _orb_type, _aspect_names in ORB_ASPECT_GROUPS.items():
+    for _name in _aspect_names:
+        _ASPECT_ORB_TYPE.setdefault(_name, _orb_type)
+
+
+def get_categorized_orb(orb_config: dict, aspect_name: str, p1_name: str, p2_name: str) -> float:
+    """Determine appropriate orb for a planet pair and aspect from an orb configuration."""
+    group1 = _BODY_ORB_GROUP.get(p1_name)
+    group2 = _BODY_ORB_GROUP.get(p2_name)
+    # Prefer the more restrictive group (if one is 'other', use the more specific)
+    group = group1 or group2 or 'orb_other_bodies'
+    if group1 and group2:
+        # If one is orb_other_bodies, prefer the other
+        if group1 == 'orb_other_bodies':
+            group = group2
+        elif group2 == 'orb_other_bodies':
+            group = group1
+        else:
+            group = group1  # default to group1
+    # Map aspect to orb type, falling back to 'major'
+    orb_type = _ASPECT_ORB_TYPE.get(aspect_name, 'major')
+    config = orb_config.get(group, {})
+    return config.get(orb_type, 0)
+
+
+def orb_config_key(orb_config) -> tuple:
+    """Hashable snapshot of an orb configuration's values, to notice edits made in place."""
+    if isinstance(orb_config, dict):
+        return tuple((key, orb_config_key(value)) for key, value in orb_config.items())
+    return orb_config
+
+
+class AspectTable:
+    """
+    Orb configuration compiled into a dense (body x body x aspect) orb table.
+
+    Aspects are stored in ASPECT_STRENGTH order. When several aspects of a pair are
+    within orb the strongest one is kept, so the first aspect within orb in this
+    order is the resolved aspect.
+    """
+
+    def __init__(self, orb_config: dict, body_names: Optional[List[str]] = None):
+        """
+        Compile the orb table.
+
+        Args:
+            orb_config: Orb configuration dict (see ORB_CONFIGS)
+            body_names: Bodies to precompute rows for (defaults to ALL_BODY_NAMES);
+                        other names are added on first use
+        """
+        self.orb_config = orb_config
+        self.config_key = orb_config_key(orb_config)
+        # Aspects without a strength rank are never selected.
+        self.aspect_names = sorted(
+            (name for name in ASPECT_DATA if name in ASPECT_STRENGTH),
+            key=lambda name: ASPECT_STRENGTH[name]
+        )
+        self.aspect_angles = [float(ASPECT_DATA[name]["angle"]) for name in self.aspect_names]
+        self.aspect_symbols = [ASPECT_DATA[name]["symbol"] for name in self.aspect_names]
+        self.body_index: Dict[str, int] = {}
+        self.orbs: List[List[Tuple[float, ...]]] = []
+        # Per pair, for each whole degree of separation (0-180), the aspects (k, angle, orb)
+        # whose orb window overlaps that degree, in strength order
+        self.candidates: List[List[List[tuple]]] = []
+        self._candidates_by_orbs: Dict[Tuple[float, ...], List[tuple]] = {}
+        self._orb_array = None
+        self._bucket_arrays = None
+        for name in (body_names if body_names is not None else ALL_BODY_NAMES):
+            self.index_of(name)
+
+    def index_of(self, name: str) -> int:
+        """Return the table index of a body, compiling its rows on first use."""
+        index = self.body_index.get(name)
+        if index is None:
+            index = len(self.orbs)
+            self.body_index[name] = index
+            self._orb_array = self._bucket_arrays = None
+            names = list(self.body_index)
+            for i, other in enumerate(names[:-1]):
+                self.orbs[i].append(self._compile_orbs(other, name))
+                self.candidates[i].append(self._compile_candidates(self.orbs[i][-1]))
+            self.orbs.append([self._compile_orbs(name, other) for other in names])
+            self.candidates.append([self._compile_candidates(orbs) for orbs in self.orbs[-1]])
+        return index
+
+    def _compile_orbs(self, name1: str, name2: str) -> Tuple[float, ...]:
+        return tuple(get_categorized_orb(self.orb_config, aspect, name1, name2) for aspect in self.aspect_names)
+
+    def _compile_candidates(self, orbs: Tuple[float, ...]) -> List[tuple]:
+        """Bucket the aspects of one orb row by whole degree of separation."""
+        buckets = self._candidates_by_orbs.get(orbs)
+        if buckets is None:
+            buckets = [
+                tuple(
+                    (k, angle, orb) for k, (angle, orb) in enumerate(zip(self.aspect_angles, orbs))
+                    if angle - orb <= degree + 1 and angle + orb >= degree
+                )
+                for degree in range(181)
+            ]
+            self._candidates_by_orbs[orbs] = buckets
+        return buckets
+
+    @property
+    def orb_array(self):
+        """The orb table as a NumPy array of shape (bodies, bodies, aspects)."""
+        if self._orb_array is None:
+            self._orb_array = np.array(self.orbs, dtype=float).reshape(len(self.orbs), len(self.orbs), len(self.aspect_names))
+        return self._orb_array
+
+    @property
+    def bucket_arrays(self):
+        """
+        The degree buckets as NumPy arrays of shape (bodies, bodies, 181, width).
+
+        Returns:
+            (aspect index, angle, orb) arrays; buckets are padded to the widest one
+            with a negative orb, which never matches
+        """
+        if self._bucket_arrays is None:
+            size = len(self.orbs)
+            width = max([len(bucket) for buckets in self._candidates_by_orbs.values() for bucket in buckets] or [1])
+            compiled = {}
+            for orbs, buckets in self._candidates_by_orbs.items():
+                ks, angles, limits = np.zeros((181, width), dtype=np.intp), np.zeros((181, width)), np.full((181, width), -1.0)
+                for degree, bucket in enumerate(buckets):
+                    for b, (k, angle, orb) in enumerate(bucket):
+                        ks[degree, b], angles[degree, b], limits[degree, b] = k, angle, orb
+                compiled[orbs] = (ks, angles, limits)
+            arrays = (
+                np.zeros((size, size, 181, width), dtype=np.intp),
+                np.zeros((size, size, 181, width)),
+                np.full((size, size, 181, width), -1.0),
+            )
+            for i, row in enumerate(self.orbs):
+                for j, orbs in enumerate(row):
+                    for array, values in zip(arrays, compiled[orbs]):
+                        array[i, j] = values
+            self._bucket_arrays = arrays
+        return self._bucket_arrays
+
+
+def visited_pairs(names1: List[str], names2: List[str], same_bodies: bool = False) -> List[Tuple[int, int]]:
+    """
+    List the (row, column) body pairs checked by AstroEngine.get_aspects, in order.
+
+    Pairs of the same body are skipped and each unordered pair of names is only
+    kept where it is first reached; with same_bodies only pairs above the diagonal
+    are used.
+    """
+    if same_bodies:
+        return [(i, j) for i in range(len(names1)) for j in range(i + 1, len(names2))]
+    pairs = []
+    processed_pairs = set()
+    for i, name1 in enumerate(names1):
+        for j, name2 in enumerate(names2):
+            if name1 == name2:
+                continue
+            pair_key = (name1, name2) if name1 < name2 else (name2, name1)
+            if pair_key in processed_pairs:
+                continue
+            processed_pairs.add(pair_key)
+            pairs.append((i, j))
+    return pairs
+
+
+def _pair_mask(size: int, idx1, idx2, same_bodies: bool):
+    """Boolean (N, M) mask of the pairs listed by visited_pairs, from AspectTable indexes."""
+    rows = np.arange(len(idx1))
+    if same_bodies:
+        return rows[:, None] < np.arange(len(idx2))[None, :]
+    pair_mask = idx1[:, None] != idx2[None, :]
+    # A pair also present in reverse order is kept only where it is reached first
+    row_of = np.full(size, -1, dtype=np.intp)
+    row_of[idx1[::-1]] = rows[::-1]
+    in_second = np.zeros(size, dtype=bool)
+    in_second[idx2] = True
+    reverse_row = row_of[idx2]
+    duplicate = in_second[idx1][:, None] & (reverse_row[None, :] >= 0) & (reverse_row[None, :] < rows[:, None])
+    return pair_mask & ~duplicate
+
+
+def find_aspects_vectorized(table: AspectTable, names1: List[str], lons1: List[float], names2: List[str], lons2: List[float], same_bodies: bool = False) -> List[Tuple[int, int, int, float]]:
+    """
+    Find the resolved aspect of every body pair with NumPy array operations.
+
+    Pairs are visited like AstroEngine.get_aspects: pairs of the same body are
+    skipped, each unordered pair of names is kept only at its first position in
+    row-major order, and with same_bodies only pairs above the diagonal are used.
+
+    Returns:
+        (row, column, aspect index, orb_diff) tuples in row-major order
+    """
+    idx1 = np.array([table.index_of(name) for name in names1], dtype=np.intp)
+    idx2 = np.array([table.index_of(name) for name in names2], dtype=np.intp)
+    n1, n2 = len(idx1), len(idx2)
+    if n1 == 0 or n2 == 0:
+        return []
+
+    diff = np.abs(np.asarray(lons1, dtype=float)[:, None] - np.asarray(lons2, dtype=float)[None, :])
+    diff = np.minimum(diff, 360 - diff)
+    angles = np.asarray(table.aspect_angles)
+    orb_diff = diff[:, :, None] - angles
+    within = np.abs(orb_diff) <= table.orb_array[idx1[:, None], idx2[None, :]]
+
+    pair_mask = _pair_mask(len(table.orbs), idx1, idx2, same_bodies)
+
+    # The first aspect within orb in strength order is the resolved aspect
+    hit_mask = pair_mask & within.any(axis=2)
+    hit_rows, hit_cols = np.nonzero(hit_mask)
+    ks = within[hit_rows, hit_cols].argmax(axis=1)
+    orbs = orb_diff[hit_rows, hit_cols, ks]
+    return list(zip(hit_rows.tolist(), hit_cols.tolist(), ks.tolist(), orbs.tolist()))
+
+
+# Charts matched per set of array operations in find_aspects_batch, bounding its temporary arrays
+BATCH_CHUNK_CHARTS = 256
+
+
+def find_aspects_batch(table: AspectTable, names: List[str], lons) -> tuple:
+    """
+    Find the resolved aspects within each of many charts of the same bodies.
+
+    The body pairs are taken once and the separations of all charts are
+    matched together, instead of one find_aspects_vectorized call per chart.
+
+    Args:
+        table: Compiled aspect table
+        names: Body names shared by every chart
+        lons: (charts, bodies) array of longitudes
+
+    Returns:
+        (offsets, rows, columns, aspect indexes, orb_diffs) arrays. The aspects of
+        chart c are entries offsets[c] to offsets[c + 1], the same
+        (row, column, aspect index, orb_diff) tuples find_aspects_vectorized
+        returns with same_bodies
+    """
+    lons = np.asarray(lons, dtype=float).reshape(-1, len(names))
+    n_charts = len(lons)
+    hits = [np.zeros(0, dtype=np.intp)] + [np.zeros(0, dtype=np.int16)] * 3 + [np.zeros(0)]
+    if len(names) >= 2 and n_charts:
+        idx = np.array([table.index_of(name) for name in names], dtype=np.intp)
+        pair_rows, pair_cols = np.nonzero(_pair_mask(len(table.orbs), idx, idx, True))
+        orb_limits = table.orb_array[idx[pair_rows], idx[pair_cols]]
+        angles = np.asarray(table.aspect_angles)
+        parts = []
+        for first in range(0, n_charts, BATCH_CHUNK_CHARTS):
+            diff = np.abs(lons[first:first + BATCH_CHUNK_CHARTS, pair_rows] - lons[first:first + BATCH_CHUNK_CHARTS, pair_cols])
+            diff = np.minimum(diff, 360 - diff)
+            orb_diff = diff[:, :, None] - angles
+            within = np.abs(orb_diff) <= orb_limits
+
+            # The first aspect within orb in strength order is the resolved aspect
+            hit_charts, hit_pairs = np.nonzero(within.any(axis=2))
+            ks = within[hit_charts, hit_pairs].argmax(axis=1)
+            # Small index types keep the columns cheap to send between processes
+            parts.append((
+                hit_charts + first, pair_rows[hit_pairs].astype(np.int16), pair_cols[hit_pairs].astype(np.int16),
+                ks.astype(np.int16), orb_diff[hit_charts, hit_pairs, ks]
+            ))
+        hits = [np.concatenate(column) for column in zip(*parts)]
+    offsets = np.zeros(n_charts + 1, dtype=np.intp)
+    np.cumsum(np.bincount(hits[0], minlength=n_charts), out=offsets[1:])
+    return (offsets,) + tuple(hits[1:])
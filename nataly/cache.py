@@ -0,0 +1,94 @@
+# nataly/cache.py
+# Bounded LRU cache for raw Swiss Ephemeris results.
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+import swisseph as swe
+
+from .context import JDContext
+
+
+class EphemerisCache:
+    """
+    LRU cache for body positions and house cusps, keyed by quantized Julian day.
+
+    Instants closer together than jd_resolution share one entry, so requests for
+    the same moment (e.g. "now", the day's noon or a popular event date) only reach
+    the Swiss Ephemeris once until they are evicted.
+    """
+
+    def __init__(self, maxsize: int = 100000, jd_resolution: float = 1e-6, coord_resolution: float = 1e-6):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before the least recently used is evicted
+            jd_resolution: Julian day quantum in days (1e-6 days is about 0.09 seconds)
+            coord_resolution: Geographic latitude/longitude quantum in degrees for house keys
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.jd_resolution = jd_resolution
+        self.coord_resolution = coord_resolution
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def _quantize_jd(self, jd: float) -> int:
+        return round(jd / self.jd_resolution)
+
+    def _quantize_coord(self, value: float) -> int:
+        return round(value / self.coord_resolution)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss."""
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        value = compute()
+        entries[key] = value
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def calc_ut(self, jd_ut: float, body_id: int, flags: int) -> tuple:
+        """Cached swe.calc_ut(jd_ut, body_id, flags)."""
+        key = ("calc_ut", self._quantize_jd(jd_ut), body_id, flags)
+        return self.get_or_compute(key, lambda: swe.calc_ut(jd_ut, body_id, flags))
+
+    def houses(self, jd_ut: float, lat: float, lon: float, house_system: bytes = b'P') -> tuple:
+        """Cached swe.houses(jd_ut, lat, lon, house_system)."""
+        key = ("houses", self._quantize_jd(jd_ut), self._quantize_coord(lat), self._quantize_coord(lon), house_system)
+        return self.get_or_compute(key, lambda: swe.houses(jd_ut, lat, lon, house_system))
+
+    def context(self, jd_ut: float) -> JDContext:
+        """Cached JDContext.from_jd(jd_ut)."""
+        key = ("context", self._quantize_jd(jd_ut))
+        return self.get_or_compute(key, lambda: JDContext.from_jd(jd_ut))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics and the current size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
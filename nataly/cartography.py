@@ -0,0 +1,176 @@
+# nataly/cartography.py
+# Astrocartography: where on Earth each body sits on an angle, vectorized over the globe.
+
+import datetime
+from typing import Dict, Iterable, List, Optional
+
+import swisseph as swe
+
+from .aspects import np
+from .constants import PLANET_MAPPING_SWE
+from .context import datetime_to_jd
+from .engine import AstroEngine
+from .events import EventFinder
+
+CARTOGRAPHY_ANGLES = ("AC", "MC", "IC", "DC")
+
+
+def _wrap_longitude(lon):
+    """Wrap geographic longitudes to [-180, 180)."""
+    return (lon + 180.0) % 360.0 - 180.0
+
+
+def _split_polyline(lons, lats) -> List:
+    """Cut a line into (N, 2) [longitude, latitude] pieces at gaps (NaN) and antimeridian jumps."""
+    pieces = []
+    valid = ~np.isnan(lons)
+    breaks = np.flatnonzero(np.abs(np.diff(lons)) > 180.0) + 1
+    cut = np.zeros(len(lons), dtype=bool)
+    cut[breaks] = True
+    start = None
+    for i in range(len(lons) + 1):
+        ends = i == len(lons) or not valid[i] or cut[i]
+        if ends and start is not None:
+            if i - start > 1:
+                pieces.append(np.column_stack([lons[start:i], lats[start:i]]))
+            start = None
+        if i < len(lons) and valid[i] and start is None:
+            start = i
+    return pieces
+
+
+class AstroCartography:
+    """
+    Planet lines of one instant: the places where each body is on the AC, MC, IC or DC.
+
+    The lines follow analytically from each body's right ascension and
+    declination and the Greenwich sidereal time: a body culminates (MC) where the
+    local sidereal time equals its right ascension, and rises (AC) or sets (DC)
+    where its hour angle is -H0 or +H0 with cos H0 = -tan(latitude) tan(declination).
+    Every formula works on NumPy arrays of latitudes and longitudes, so a whole
+    grid needs no swe.houses call.
+    """
+
+    def __init__(self, dt_utc: datetime.datetime, bodies: Optional[Iterable[str]] = None, engine: Optional[AstroEngine] = None, ephe_path: str = './nataly/ephe'):
+        """
+        Calculate the equatorial positions of the bodies.
+
+        Args:
+            dt_utc: Instant of the chart (UTC)
+            bodies: Body names (defaults to every body with an ephemeris of its own, see EventFinder)
+            engine: AstroEngine providing the ephemeris path and cache
+            ephe_path: Path to ephemeris files, when no engine is given
+        """
+        if np is None:
+            raise ImportError("NumPy is required for astrocartography (pip install numpy)")
+        finder = EventFinder(engine, ephe_path)
+        self.engine = finder.engine
+        self.dt_utc = dt_utc
+        jd = datetime_to_jd(dt_utc)
+        self.body_names = finder._default_bodies() if bodies is None else list(bodies)
+        # Greenwich apparent sidereal time in degrees
+        self.sidereal_time = swe.sidtime(jd) * 15.0
+
+        equatorial = {}
+        for name in self.body_names:
+            if name == "South Node":
+                continue
+            planet_id = PLANET_MAPPING_SWE.get(name)
+            if planet_id is None or name in self.engine.chart_angles:
+                raise ValueError(f"Cannot draw lines for '{name}'; it has no ephemeris of its own")
+            equ_output, _ = self.engine._calc_ut(jd, planet_id, swe.FLG_SPEED | swe.FLG_EQUATORIAL)
+            equatorial[name] = (equ_output[0], equ_output[1])
+        if "South Node" in self.body_names:
+            ra, dec = equatorial.get("True Node") or self.engine._calc_ut(jd, swe.TRUE_NODE, swe.FLG_SPEED | swe.FLG_EQUATORIAL)[0][:2]
+            equatorial["South Node"] = ((ra + 180.0) % 360.0, -dec)
+        self.right_ascensions = np.array([equatorial[name][0] for name in self.body_names], dtype=float)
+        self.declinations = np.array([equatorial[name][1] for name in self.body_names], dtype=float)
+
+    def meridian_longitudes(self):
+        """Geographic longitude of each body's MC line, shape (bodies,); the IC line is 180 degrees away."""
+        return _wrap_longitude(self.right_ascensions - self.sidereal_time)
+
+    def horizon_longitudes(self, latitudes):
+        """
+        Geographic longitudes of the AC and DC lines at each latitude.
+
+        Args:
+            latitudes: Latitudes in degrees, any array shape
+
+        Returns:
+            (rising, setting) arrays of shape (bodies,) + latitudes.shape; NaN where
+            the body does not rise or set (circumpolar or never visible)
+        """
+        latitudes = np.asarray(latitudes, dtype=float)
+        dec = np.radians(self.declinations).reshape((-1,) + (1,) * latitudes.ndim)
+        cos_h0 = -np.tan(np.radians(latitudes)) * np.tan(dec)
+        with np.errstate(invalid='ignore'):
+            h0 = np.degrees(np.arccos(np.where(np.abs(cos_h0) <= 1.0, cos_h0, np.nan)))
+        meridian = self.meridian_longitudes().reshape(dec.shape)
+        return _wrap_longitude(meridian - h0), _wrap_longitude(meridian + h0)
+
+    def line_longitudes(self, latitudes) -> Dict[str, object]:
+        """Geographic longitude of every line at each latitude, by angle (see horizon_longitudes)."""
+        latitudes = np.asarray(latitudes, dtype=float)
+        meridian = self.meridian_longitudes().reshape((-1,) + (1,) * latitudes.ndim)
+        meridian = np.broadcast_to(meridian, meridian.shape[:1] + latitudes.shape)
+        rising, setting = self.horizon_longitudes(latitudes)
+        return {"AC": rising, "MC": meridian, "IC": _wrap_longitude(meridian + 180.0), "DC": setting}
+
+    def lines(self, lat_step: float = 1.0, max_latitude: float = 85.0) -> Dict[str, Dict[str, List]]:
+        """
+        Polylines of every body and angle.
+
+        Args:
+            lat_step: Latitude spacing of the points in degrees
+            max_latitude: Lines are drawn between -max_latitude and +max_latitude
+
+        Returns:
+            {body: {angle: [polyline, ...]}} where each polyline is an (N, 2) array
+            of [longitude, latitude] points; lines are cut at the antimeridian and
+            where the body stops rising and setting
+        """
+        if lat_step <= 0:
+            raise ValueError(f"lat_step must be positive, got {lat_step}")
+        latitudes = np.arange(-max_latitude, max_latitude + lat_step / 2.0, lat_step)
+        longitudes = self.line_longitudes(latitudes)
+        return {
+            name: {angle: _split_polyline(longitudes[angle][i], latitudes) for angle in CARTOGRAPHY_ANGLES}
+            for i, name in enumerate(self.body_names)
+        }
+
+    def distance_grid(self, latitudes, longitudes) -> Dict[str, object]:
+        """
+        East-west distance of every grid point from every line.
+
+        Args:
+            latitudes: 1-D array of grid latitudes
+            longitudes: 1-D array of grid longitudes
+
+        Returns:
+            {angle: array of shape (bodies, latitudes, longitudes)} with the absolute
+            difference in geographic longitude (0-180 degrees) to the line at the
+            same latitude; NaN where the line does not reach that latitude
+        """
+        latitudes = np.asarray(latitudes, dtype=float)
+        longitudes = np.asarray(longitudes, dtype=float)
+        return {
+            angle: np.abs(_wrap_longitude(longitudes[None, None, :] - line[:, :, None]))
+            for angle, line in self.line_longitudes(latitudes).items()
+        }
+
+    def angular_bodies(self, latitude: float, longitude: float, orb: float = 2.0) -> List[tuple]:
+        """
+        Bodies on an angle at one place.
+
+        Returns:
+            (body, angle, distance) tuples within orb degrees of geographic longitude,
+            closest first
+        """
+        grid = self.distance_grid([latitude], [longitude])
+        found = [
+            (name, angle, float(grid[angle][i, 0, 0]))
+            for angle in CARTOGRAPHY_ANGLES for i, name in enumerate(self.body_names)
+            if grid[angle][i, 0, 0] <= orb
+        ]
+        return sorted(found, key=lambda item: item[2])
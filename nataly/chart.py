@@ -3,14 +3,87 @@
 
 import datetime
 from collections import defaultdict
-from typing import List, Dict, Optional, Union, Any
+from typing import List, Dict, Optional, Union, Any, Iterable
 
 from .engine import AstroEngine
+from .context import JDContext
 from .constants import (
      MODALITIES, ELEMENTS, 
     ALL_BODY_NAMES, VALID_BODY_TYPES, BODY_TYPES, ASTROLOGICAL_BODY_GROUPS
 )
-from .models import Body, BodyFilter
+from .models import Body, House, Aspect, BodyFilter, BODY_TYPE_FILTER_FLAGS
+
+# Body attribute behind each index of _BodyIndex
+_INDEX_KEYS = {
+    'name': lambda b: b.name,
+    'body_type': lambda b: b.body_type,
+    'sign': lambda b: b.sign.name,
+    'element': lambda b: b.sign.element,
+    'modality': lambda b: b.sign.modality,
+    'house': lambda b: b.house,
+    'dignity': lambda b: b.dignity,
+    'retrograde': lambda b: b.is_retrograde,
+}
+
+# BodyFilter include/exclude fields and the index each one reads
+_FILTER_INDEXES = (
+    ('name', 'include_bodies', 'exclude_bodies'),
+    ('sign', 'include_signs', 'exclude_signs'),
+    ('element', 'include_elements', 'exclude_elements'),
+    ('modality', 'include_modalities', 'exclude_modalities'),
+    ('house', 'include_houses', 'exclude_houses'),
+    ('dignity', 'include_dignities', 'exclude_dignities'),
+)
+
+
+class _BodyIndex:
+    """Bodies of a chart (in bodies_dict order) grouped by each attribute in _INDEX_KEYS."""
+
+    def __init__(self, bodies: Iterable[Body]):
+        self.bodies = list(bodies)
+        self.groups = {key: {} for key in _INDEX_KEYS}
+        self.positions = {key: defaultdict(set) for key in _INDEX_KEYS}
+        for position, body in enumerate(self.bodies):
+            for key, attribute in _INDEX_KEYS.items():
+                value = attribute(body)
+                self.groups[key].setdefault(value, []).append(body)
+                self.positions[key][value].add(position)
+
+    def get(self, key: str, value: Any) -> List[Body]:
+        """Bodies whose attribute equals value."""
+        return list(self.groups[key].get(value, ()))
+
+    def positions_in(self, key: str, values: Iterable) -> set:
+        """Positions of the bodies whose attribute is in values."""
+        found = set()
+        for value, positions in self.positions[key].items():
+            if value in values:
+                found |= positions
+        return found
+
+    def get_in(self, key: str, values: Iterable) -> List[Body]:
+        """Bodies whose attribute is in values."""
+        return self.select(self.positions_in(key, values))
+
+    def select(self, positions: Iterable[int]) -> List[Body]:
+        bodies = self.bodies
+        return [bodies[i] for i in sorted(positions)]
+
+    def filter(self, f: BodyFilter) -> List[Body]:
+        """Bodies matching f, the same as testing each body with BodyFilter.matches."""
+        positions = set(range(len(self.bodies)))
+        for body_type, flag in BODY_TYPE_FILTER_FLAGS.items():
+            if not getattr(f, flag):
+                positions -= self.positions['body_type'].get(body_type, set())
+        for key, include, exclude in _FILTER_INDEXES:
+            if getattr(f, include):
+                positions &= self.positions_in(key, getattr(f, include))
+            if getattr(f, exclude):
+                positions -= self.positions_in(key, getattr(f, exclude))
+        if f.include_retrograde is not None:
+            positions -= self.positions['retrograde'].get(not f.include_retrograde, set())
+        return self.select(positions)
+
 
 class NatalChart:
     """
@@ -18,8 +91,8 @@ class NatalChart:
     analyses for a single birth chart.
     """
     
-    def __init__(self, person_name: str, dt_utc: datetime.datetime, lat: float, lon: float, orb_config=None, ephe_path: str = './nataly/ephe'):
-        if ephe_path is None:
+    def __init__(self, person_name: str, dt_utc: datetime.datetime, lat: float, lon: float, orb_config=None, ephe_path: str = './nataly/ephe', engine: Optional[AstroEngine] = None, context: Optional[JDContext] = None, bodies: Optional[Iterable[str]] = None):
+        if ephe_path is None and engine is None:
             raise ValueError(
                 "ephe_path must be provided! Set ephe_path to the directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)."
             )
@@ -33,60 +106,288 @@ class NatalChart:
             lon: Longitude of birth location
             orb_config: OrbConfig object or dict for orb settings
             ephe_path: Path to ephemeris files
+            engine: Existing AstroEngine to reuse (orb_config and ephe_path are then ignored)
+            context: JDContext for dt_utc, to share it between charts for the same instant
+            bodies: Body names and/or ASTROLOGICAL_BODY_GROUPS keys to calculate
+                    (e.g. ["luminaries", "chart_angles"]); defaults to all bodies
+        """
+        if engine is None:
+            engine = AstroEngine(orb_config, ephe_path)
+        bodies_dict, houses = engine.get_planets_and_houses(dt_utc, lat, lon, context, bodies)
+        self._populate(person_name, dt_utc, lat, lon, engine, bodies_dict, houses)
+
+    @classmethod
+    def from_many(cls, records: Iterable[tuple], orb_config=None, ephe_path: str = './nataly/ephe', engine: Optional[AstroEngine] = None, bodies: Optional[Iterable[str]] = None) -> List['NatalChart']:
+        """
+        Creates many NatalChart objects sharing a single AstroEngine.
+
+        The charts keep the raw batch results (see AstroEngine._compute_chart_batch)
+        and build their Body, House and Aspect objects on first access. With
+        NumPy the aspects of all charts are matched together.
+
+        Args:
+            records: Iterable of (person_name, dt_utc, lat, lon) records
+            orb_config: OrbConfig object or dict for orb settings
+            ephe_path: Path to ephemeris files
+            engine: Existing AstroEngine to reuse (orb_config, ephe_path and bodies are then ignored)
+            bodies: Body names and/or ASTROLOGICAL_BODY_GROUPS keys to calculate
+
+        Returns:
+            List of NatalChart objects in input order
+        """
+        if engine is None:
+            engine = AstroEngine(orb_config, ephe_path, bodies=bodies)
+        records = list(records)
+        charts = []
+        results = engine._compute_chart_batch([(dt_utc, lat, lon) for _, dt_utc, lat, lon in records])
+        for (person_name, dt_utc, lat, lon), block in zip(records, results):
+            chart = cls.__new__(cls)
+            chart._populate(person_name, dt_utc, lat, lon, engine, None, None, block=block)
+            charts.append(chart)
+        return charts
+
+    def relocate(self, lat: float, lon: float, person_name: Optional[str] = None) -> 'NatalChart':
+        """
+        Creates the chart of the same instant at another location.
+
+        Body positions are reused; only the houses, angles, house placements,
+        aspects of the angles and distributions are recalculated. Like those of
+        any chart, the aspects are calculated on first access, taking over the
+        aspects between bodies from this chart.
+
+        Args:
+            lat: Latitude of the new location
+            lon: Longitude of the new location
+            person_name: Name of the relocated chart (defaults to this chart's name)
+        """
+        return self.relocate_many([(lat, lon)], person_name)[0]
+
+    def relocate_many(self, locations: Iterable[tuple], person_name: Optional[str] = None) -> List['NatalChart']:
+        """
+        Creates the charts of the same instant at many locations (see relocate).
+
+        Args:
+            locations: Iterable of (lat, lon) pairs
+            person_name: Name of the relocated charts (defaults to this chart's name)
+
+        Returns:
+            List of NatalChart objects in input order
+        """
+        engine = self.engine
+        context = engine._get_context(self.datetime_utc)
+        charts = []
+        for lat, lon in locations:
+            bodies_dict, houses = engine.get_relocated_bodies_and_houses(self.bodies_dict, self.datetime_utc, lat, lon, context)
+            chart = type(self).__new__(type(self))
+            chart._populate(person_name or self.name, self.datetime_utc, lat, lon, engine, bodies_dict, houses)
+            chart._relocated_from = self
+            charts.append(chart)
+        return charts
+
+    def with_orbs(self, orb_config) -> 'NatalChart':
+        """
+        Creates the same chart under another orb configuration.
+
+        Bodies, houses, the body index and distributions are shared with this chart and the pair
+        distances are calculated once per chart, so only the orb table lookups of
+        the aspects are repeated.
+
+        Args:
+            orb_config: OrbConfig object or dict for orb settings (e.g. ORB_CONFIGS["Classical"])
+        """
+        engine = self.engine.with_orb_config(orb_config)
+        distances = self.pair_distances
+        chart = type(self).__new__(type(self))
+        chart.__dict__.update(self.__dict__)
+        chart.engine = engine
+        chart.aspects = engine.get_aspects_from_distances(self.bodies_dict, distances)
+        return chart
+
+    @property
+    def pair_distances(self) -> List[tuple]:
+        """Angular separation of every pair of bodies, calculated on first use (see AstroEngine.get_pair_distances)."""
+        if self._pair_distances is None:
+            self._pair_distances = self.engine.get_pair_distances(self.bodies_dict)
+        return self._pair_distances
+
+    def _populate(self, person_name: str, dt_utc: datetime.datetime, lat: float, lon: float, engine: AstroEngine, bodies_dict: Optional[Dict[str, Body]], houses: Optional[List[House]], aspects: Optional[List[Aspect]] = None, block: Optional[tuple] = None):
+        """
+        Sets chart attributes; the analyses derived from positions and houses run on first access.
+
+        With block, a (_ChartBlock, index) pair from AstroEngine._compute_chart_batch,
+        bodies_dict and houses are None and are built from the block on first access.
         """
         self.name = person_name
         self.datetime_utc = dt_utc
         self.latitude = lat
         self.longitude = lon
 
-        engine = AstroEngine(orb_config, ephe_path)
+        self.engine = engine
         self.planets_names = ALL_BODY_NAMES
         self.chart_angles = list(ASTROLOGICAL_BODY_GROUPS["chart_angles"])
         
-        self.bodies_dict, self.houses = engine.get_planets_and_houses(dt_utc, lat, lon)
-        # Calculate aspects between all celestial bodies
-        self.aspects = engine.get_aspects(self.bodies_dict)
-
-        self.planets = [b for b in self.bodies_dict.values() if b.name in self.planets_names]
-        self.axes = {b.name: b for b in self.bodies_dict.values() if b.name in self.chart_angles}
-        self.ascendant = self.axes.get("AC")
-        self.midheaven = self.axes.get("MC")
-
-        self._calculate_distributions()
-        # Calculate element-modality matrix
-        self._calculate_element_modality_matrix()
+        # Batch results the bodies, houses and aspects are built from on first access
+        self._block = block
+        self._set_models(bodies_dict, houses)
+        self._pair_distances = None
+        self._body_index = None
+        # Aspects, distributions and the element-modality matrix are calculated on first access
+        self._aspects = aspects
+        # Chart this one was relocated from; its aspects between unmoved bodies are reused
+        self._relocated_from = None
+        self._distributions = None
+        self._element_modality_matrix = None
+
+    def _set_models(self, bodies_dict: Optional[Dict[str, Body]], houses: Optional[List[House]]):
+        self._bodies_dict, self._houses = bodies_dict, houses
+        if bodies_dict is None:
+            self._planets = self._axes = self._ascendant = self._midheaven = None
+            return
+        self._planets = [b for b in bodies_dict.values() if b.name in self.planets_names]
+        self._axes = {b.name: b for b in bodies_dict.values() if b.name in self.chart_angles}
+        self._ascendant = self._axes.get("AC")
+        self._midheaven = self._axes.get("MC")
+
+    def _models(self):
+        """Build the bodies and houses from the chart's batch results on first access."""
+        if self._bodies_dict is None:
+            block, index = self._block
+            self._set_models(*self.engine._build_bodies_and_houses(*block.raw(index)))
+            self._release_block()
+
+    def _release_block(self):
+        """Drop the batch results once the bodies, houses and aspects are all built."""
+        if self._aspects is not None and self._bodies_dict is not None:
+            self._block = None
+
+    @property
+    def bodies_dict(self) -> Dict[str, Body]:
+        self._models()
+        return self._bodies_dict
+
+    @property
+    def houses(self) -> List[House]:
+        self._models()
+        return self._houses
+
+    @property
+    def planets(self) -> List[Body]:
+        self._models()
+        return self._planets
+
+    @property
+    def axes(self) -> Dict[str, Body]:
+        self._models()
+        return self._axes
+
+    @property
+    def ascendant(self) -> Optional[Body]:
+        self._models()
+        return self._ascendant
+
+    @property
+    def midheaven(self) -> Optional[Body]:
+        self._models()
+        return self._midheaven
+
+    @property
+    def aspects(self) -> List[Aspect]:
+        """Aspects between all celestial bodies, calculated on first access."""
+        if self._aspects is None:
+            rows = None if self._block is None else self._block[0].aspect_rows(self._block[1])
+            if rows is not None:
+                self._aspects = self.engine._aspects_from_rows(self.bodies_dict, rows)
+            elif self._relocated_from is not None:
+                self._aspects = self.engine.get_relocated_aspects(self._relocated_from.aspects, self.bodies_dict)
+                self._relocated_from = None
+            else:
+                self._aspects = self.engine.get_aspects(self.bodies_dict)
+            self._release_block()
+        return self._aspects
+
+    @aspects.setter
+    def aspects(self, aspects: List[Aspect]):
+        self._aspects = aspects
+        self._relocated_from = None
+        self._release_block()
+
+    def _distribution(self, kind: str) -> Dict[str, Dict[str, Any]]:
+        if self._distributions is None:
+            self._calculate_distributions()
+        return self._distributions[kind]
+
+    @property
+    def element_distribution(self) -> Dict[str, Dict[str, Any]]:
+        """Bodies and their count per element, calculated on first access."""
+        return self._distribution('element')
+
+    @property
+    def modality_distribution(self) -> Dict[str, Dict[str, Any]]:
+        """Bodies and their count per modality, calculated on first access."""
+        return self._distribution('modality')
+
+    @property
+    def polarity_distribution(self) -> Dict[str, Dict[str, Any]]:
+        """Bodies and their count per polarity, calculated on first access."""
+        return self._distribution('polarity')
+
+    @property
+    def quadrant_distribution(self) -> Dict[str, Dict[str, Any]]:
+        """Bodies and their count per quadrant, calculated on first access."""
+        return self._distribution('quadrant')
+
+    @property
+    def hemisphere_distribution(self) -> Dict[str, Dict[str, Any]]:
+        """Bodies and their count per hemisphere, calculated on first access."""
+        return self._distribution('hemisphere')
+
+    @property
+    def element_modality_matrix(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Planets and their count per element and modality, calculated on first access."""
+        if self._element_modality_matrix is None:
+            self._calculate_element_modality_matrix()
+        return self._element_modality_matrix
+
+    def _reset_analyses(self):
+        """Drop the distributions and the matrix so they are recalculated from the bodies on next access."""
+        self._distributions = None
+        self._element_modality_matrix = None
 
     def _calculate_distributions(self):
         """Calculates distributions for elements, modalities, polarities, quadrants, and hemispheres."""
         bodies_for_distribution = self.planets + ([self.ascendant] if self.ascendant else [])
-        self.element_distribution = defaultdict(lambda: {'count': 0, 'bodies': []})
-        self.modality_distribution = defaultdict(lambda: {'count': 0, 'bodies': []})
-        self.polarity_distribution = defaultdict(lambda: {'count': 0, 'bodies': []})
-        self.quadrant_distribution = defaultdict(lambda: {'count': 0, 'bodies': []})
-        self.hemisphere_distribution = defaultdict(lambda: {'count': 0, 'bodies': []})
+        self._distributions = {
+            kind: defaultdict(lambda: {'count': 0, 'bodies': []})
+            for kind in ('element', 'modality', 'polarity', 'quadrant', 'hemisphere')
+        }
+        element_distribution = self._distributions['element']
+        modality_distribution = self._distributions['modality']
+        polarity_distribution = self._distributions['polarity']
+        quadrant_distribution = self._distributions['quadrant']
+        hemisphere_distribution = self._distributions['hemisphere']
 
         for body in bodies_for_distribution:
             if body and body.sign:
-                self.element_distribution[body.sign.element]['bodies'].append(body)
-                self.modality_distribution[body.sign.modality]['bodies'].append(body)
-                self.polarity_distribution[body.sign.polarity]['bodies'].append(body)
+                element_distribution[body.sign.element]['bodies'].append(body)
+                modality_distribution[body.sign.modality]['bodies'].append(body)
+                polarity_distribution[body.sign.polarity]['bodies'].append(body)
             if body.name not in self.chart_angles:
-                if 1 <= body.house <= 3: self.quadrant_distribution['1st ◵']['bodies'].append(body)
-                elif 4 <= body.house <= 6: self.quadrant_distribution['2nd ◶']['bodies'].append(body)
-                elif 7 <= body.house <= 9: self.quadrant_distribution['3rd ◷']['bodies'].append(body)
-                elif 10 <= body.house <= 12: self.quadrant_distribution['4th ◴']['bodies'].append(body)
-                if body.house in [1, 2, 3, 10, 11, 12]: self.hemisphere_distribution['East ←']['bodies'].append(body)
-                else: self.hemisphere_distribution['West →']['bodies'].append(body)
-                if 1 <= body.house <= 6: self.hemisphere_distribution['North ↓']['bodies'].append(body)
-                else: self.hemisphere_distribution['South ↑']['bodies'].append(body)
+                if 1 <= body.house <= 3: quadrant_distribution['1st ◵']['bodies'].append(body)
+                elif 4 <= body.house <= 6: quadrant_distribution['2nd ◶']['bodies'].append(body)
+                elif 7 <= body.house <= 9: quadrant_distribution['3rd ◷']['bodies'].append(body)
+                elif 10 <= body.house <= 12: quadrant_distribution['4th ◴']['bodies'].append(body)
+                if body.house in [1, 2, 3, 10, 11, 12]: hemisphere_distribution['East ←']['bodies'].append(body)
+                else: hemisphere_distribution['West →']['bodies'].append(body)
+                if 1 <= body.house <= 6: hemisphere_distribution['North ↓']['bodies'].append(body)
+                else: hemisphere_distribution['South ↑']['bodies'].append(body)
         
-        for dist in [self.element_distribution, self.modality_distribution, self.polarity_distribution, self.quadrant_distribution, self.hemisphere_distribution]:
+        for dist in [element_distribution, modality_distribution, polarity_distribution, quadrant_distribution, hemisphere_distribution]:
             for key in dist:
                 dist[key]['count'] = len(dist[key]['bodies'])
 
     def _calculate_element_modality_matrix(self):
         """Calculates the 2D distribution of planets by element and modality."""
-        self.element_modality_matrix = {
+        self._element_modality_matrix = matrix = {
             el: {mod: {'count': 0, 'bodies': []} for mod in MODALITIES}
             for el in ELEMENTS
         }
@@ -97,14 +398,21 @@ class NatalChart:
             if body and body.sign:
                 element = body.sign.element
                 modality = body.sign.modality
-                if element in self.element_modality_matrix and modality in self.element_modality_matrix[element]:
-                    self.element_modality_matrix[element][modality]['bodies'].append(body)
-                    self.element_modality_matrix[element][modality]['count'] += 1
+                if element in matrix and modality in matrix[element]:
+                    matrix[element][modality]['bodies'].append(body)
+                    matrix[element][modality]['count'] += 1
 
     def get_body_by_name(self, name: str) -> Optional[Body]:
         """Returns a celestial body or axis object by its name from the central dictionary."""
         return self.bodies_dict.get(name)
 
+    @property
+    def body_index(self) -> _BodyIndex:
+        """Index of the bodies by name, type, sign, element, modality, house, dignity and retrograde status, built on first access."""
+        if self._body_index is None:
+            self._body_index = _BodyIndex(self.bodies_dict.values())
+        return self._body_index
+
     def get_bodies_by_type(self, body_type: BODY_TYPES) -> List[Body]:
         """
         Returns all celestial bodies of a specific type.
@@ -119,7 +427,7 @@ class NatalChart:
         if body_type not in VALID_BODY_TYPES:
             raise ValueError(f"Invalid body_type: {body_type}. Valid types are: {VALID_BODY_TYPES}")
         
-        return [b for b in self.bodies_dict.values() if b.body_type == body_type]
+        return self.body_index.get('body_type', body_type)
 
     def get_planets(self, include_luminaries: bool = True) -> List[Body]:
         """
@@ -132,29 +440,29 @@ class NatalChart:
             List of Body objects (planets + optionally luminaries)
         """
         if include_luminaries:
-            return [b for b in self.bodies_dict.values() if b.body_type in ["Planet", "Luminary"]]
+            return self.body_index.get_in('body_type', ("Planet", "Luminary"))
         else:
-            return [b for b in self.bodies_dict.values() if b.body_type == "Planet"]
+            return self.body_index.get('body_type', "Planet")
 
     def get_luminaries(self) -> List[Body]:
         """Returns all luminaries (Sun and Moon)."""
-        return [b for b in self.bodies_dict.values() if b.body_type == "Luminary"]
+        return self.body_index.get('body_type', "Luminary")
 
     def get_asteroids(self) -> List[Body]:
         """Returns all asteroids."""
-        return [b for b in self.bodies_dict.values() if b.body_type == "Asteroid"]
+        return self.body_index.get('body_type', "Asteroid")
 
     def get_axes(self) -> List[Body]:
         """Returns all chart axes."""
-        return [b for b in self.bodies_dict.values() if b.body_type == "Axis"]
+        return self.body_index.get('body_type', "Axis")
 
     def get_lunar_nodes(self) -> List[Body]:
         """Returns all lunar nodes."""
-        return [b for b in self.bodies_dict.values() if b.body_type == "LunarNode"]
+        return self.body_index.get('body_type', "LunarNode")
 
     def get_lilith_bodies(self) -> List[Body]:
         """Returns all Lilith bodies."""
-        return [b for b in self.bodies_dict.values() if b.body_type == "Lilith"]
+        return self.body_index.get('body_type', "Lilith")
 
     def get_bodies(self, filter_config: Optional[Union[BodyFilter, Dict[str, Any]]] = None) -> List[Body]:
         """
@@ -173,59 +481,59 @@ class NatalChart:
         if isinstance(filter_config, dict):
             filter_config = BodyFilter(**filter_config)
         
-        return [b for b in self.bodies_dict.values() if filter_config.matches(b)]
+        return self.body_index.filter(filter_config)
 
     def get_bodies_by_names(self, names: List[str]) -> List[Body]:
         """Returns celestial bodies by their names."""
-        return [b for b in self.bodies_dict.values() if b.name in names]
+        return self.body_index.get_in('name', names)
 
     def get_bodies_by_signs(self, signs: List[str]) -> List[Body]:
         """Returns celestial bodies in specific signs."""
-        return [b for b in self.bodies_dict.values() if b.sign.name in signs]
+        return self.body_index.get_in('sign', signs)
 
     def get_bodies_by_elements(self, elements: List[str]) -> List[Body]:
         """Returns celestial bodies in specific elements."""
-        return [b for b in self.bodies_dict.values() if b.sign.element in elements]
+        return self.body_index.get_in('element', elements)
 
     def get_bodies_by_modalities(self, modalities: List[str]) -> List[Body]:
         """Returns celestial bodies in specific modalities."""
-        return [b for b in self.bodies_dict.values() if b.sign.modality in modalities]
+        return self.body_index.get_in('modality', modalities)
 
     def get_bodies_by_houses(self, houses: List[int]) -> List[Body]:
         """Returns celestial bodies in specific houses."""
-        return [b for b in self.bodies_dict.values() if b.house in houses]
+        return self.body_index.get_in('house', houses)
 
     def get_bodies_by_dignities(self, dignities: List[str]) -> List[Body]:
         """Returns celestial bodies with specific dignities."""
-        return [b for b in self.bodies_dict.values() if b.dignity in dignities]
+        return self.body_index.get_in('dignity', dignities)
 
     def get_retrograde_bodies(self) -> List[Body]:
         """Returns all retrograde celestial bodies."""
-        return [b for b in self.bodies_dict.values() if b.is_retrograde]
+        return self.body_index.get('retrograde', True)
 
     def get_direct_bodies(self) -> List[Body]:
         """Returns all direct (non-retrograde) celestial bodies."""
-        return [b for b in self.bodies_dict.values() if not b.is_retrograde]
+        return self.body_index.get('retrograde', False)
 
     def get_bodies_in_house(self, house_number: int) -> List[Body]:
         """Returns all celestial bodies in a specific house."""
-        return [b for b in self.bodies_dict.values() if b.house == house_number]
+        return self.body_index.get('house', house_number)
 
     def get_bodies_in_sign(self, sign_name: str) -> List[Body]:
         """Returns all celestial bodies in a specific sign."""
-        return [b for b in self.bodies_dict.values() if b.sign.name == sign_name]
+        return self.body_index.get('sign', sign_name)
 
     def get_bodies_in_element(self, element: str) -> List[Body]:
         """Returns all celestial bodies in a specific element."""
-        return [b for b in self.bodies_dict.values() if b.sign.element == element]
+        return self.body_index.get('element', element)
 
     def get_bodies_in_modality(self, modality: str) -> List[Body]:
         """Returns all celestial bodies in a specific modality."""
-        return [b for b in self.bodies_dict.values() if b.sign.modality == modality]
+        return self.body_index.get('modality', modality)
 
     def get_bodies_with_dignity(self, dignity: str) -> List[Body]:
         """Returns all celestial bodies with a specific dignity."""
-        return [b for b in self.bodies_dict.values() if b.dignity == dignity]
+        return self.body_index.get('dignity', dignity)
 
     def __repr__(self):
         """String representation of the NatalChart."""
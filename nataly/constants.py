@@ -118,6 +118,13 @@ ASPECT_DATA = {
     "Biquintile":     {"angle": 144,  "symbol": "bQ"},
 }
 
+# Aspect strength used to resolve several aspects within orb for one pair (1 = strongest).
+ASPECT_STRENGTH = {
+    "Conjunction": 1, "Opposition": 2, "Trine": 3, "Square": 4, "Sextile": 5,
+    "Quincunx": 6, "Semisquare": 7, "Sesquiquadrate": 8, "Semisextile": 9,
+    "Quintile": 10, "Biquintile": 11
+}
+
 # =====================
 # ZODIAC SIGN DEGREES
 # =====================
@@ -208,6 +215,11 @@ BODY_TYPE_MAPPINGS = {
 }
 VALID_BODY_TYPES = list(set(BODY_TYPE_MAPPINGS.values()))
 
+# Bodies whose positions are derived from another body, which must be calculated first.
+BODY_DEPENDENCIES = {
+    "South Node": ["True Node"],
+}
+
 SIGN_NAMES_BY_DEGREE = [
     "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra", 
     "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
@@ -0,0 +1,70 @@
+# nataly/context.py
+# Julian-day quantities shared by every calculation made for one instant.
+
+import datetime
+from dataclasses import dataclass
+from typing import Optional
+
+import swisseph as swe
+
+
+def datetime_to_jd(dt_utc: datetime.datetime) -> float:
+    """
+    Convert a UTC datetime to a Julian day number (UT).
+
+    Timezone-aware datetimes are converted to UTC first; naive datetimes are
+    taken to be UTC already.
+    """
+    if dt_utc.tzinfo is not None:
+        dt_utc = dt_utc.astimezone(datetime.timezone.utc)
+    hour = dt_utc.hour + dt_utc.minute / 60.0 + (dt_utc.second + dt_utc.microsecond / 1e6) / 3600.0
+    return swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, hour)
+
+
+# Julian day of 2000-01-01 12:00 UTC (J2000.0)
+_J2000 = 2451545.0
+_J2000_DATETIME = datetime.datetime(2000, 1, 1, 12)
+
+
+def jd_to_datetime(jd_ut: float, tzinfo: Optional[datetime.tzinfo] = None) -> datetime.datetime:
+    """
+    Convert a Julian day number (UT) to a UTC datetime, the inverse of datetime_to_jd.
+
+    The result is naive unless tzinfo is given, in which case it is converted to tzinfo.
+    """
+    dt_utc = _J2000_DATETIME + datetime.timedelta(days=jd_ut - _J2000)
+    if tzinfo is not None:
+        dt_utc = dt_utc.replace(tzinfo=datetime.timezone.utc).astimezone(tzinfo)
+    return dt_utc
+
+
+@dataclass
+class JDContext:
+    """
+    Time-dependent values for one instant, computed once and shared by body,
+    house and declination calculations (and by several charts for the same moment).
+    All angles are in degrees, delta_t is in days.
+    """
+    jd_ut: float
+    jd_et: float
+    delta_t: float
+    true_obliquity: float
+    mean_obliquity: float
+    nutation_longitude: float
+    nutation_obliquity: float
+
+    @classmethod
+    def from_jd(cls, jd_ut: float) -> 'JDContext':
+        """Create a context from a Julian day number (UT)."""
+        delta_t = swe.deltat(jd_ut)
+        ecl_nut, _ = swe.calc_ut(jd_ut, swe.ECL_NUT)
+        return cls(
+            jd_ut=jd_ut, jd_et=jd_ut + delta_t, delta_t=delta_t,
+            true_obliquity=ecl_nut[0], mean_obliquity=ecl_nut[1],
+            nutation_longitude=ecl_nut[2], nutation_obliquity=ecl_nut[3]
+        )
+
+    @classmethod
+    def from_datetime(cls, dt_utc: datetime.datetime) -> 'JDContext':
+        """Create a context from a UTC datetime."""
+        return cls.from_jd(datetime_to_jd(dt_utc))
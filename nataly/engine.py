@@ -4,36 +4,198 @@
 import swisseph as swe
 import os
 import math
-from typing import List, Dict
+import copy
+from bisect import bisect_right
+from typing import List, Dict, Iterable, Tuple, Optional
 
 from .models import Body, House, Aspect, get_sign
 from .constants import (
-    SIGN_NAMES_BY_DEGREE, DIGNITY_RULES, ASPECT_DATA,
+    SIGN_NAMES_BY_DEGREE, DIGNITY_RULES,
     ALL_BODY_NAMES, ANGLES_SYMBOLS, ASTROLOGICAL_BODY_GROUPS,
     PLANET_MAPPING_SWE,
-    BODY_TYPE_MAPPINGS, ORB_BODY_GROUPS, ORB_ASPECT_GROUPS
+    BODY_TYPE_MAPPINGS, BODY_DEPENDENCIES
 )
 from .config import create_orb_config
+from .context import JDContext, datetime_to_jd
+from .cache import EphemerisCache
+from .aspects import AspectTable, get_categorized_orb, find_aspects_vectorized, find_aspects_batch, orb_config_key, np
+
+# Body pair count from which get_aspects uses the NumPy kernel when NumPy is installed.
+VECTORIZED_MIN_PAIRS = 300
+
+# Engines with other orb configurations kept by AstroEngine.with_orb_config, besides the original.
+ORB_ENGINE_CACHE_SIZE = 8
+
+# Swiss Ephemeris keeps the ephemeris path as process-global C state, so it only
+# needs to be set again when a different path is requested.
+_active_ephe_path = None
+
+
+def _set_ephe_path_once(ephe_path: str):
+    """Set the Swiss Ephemeris path unless it is already the active one."""
+    global _active_ephe_path
+    if ephe_path != _active_ephe_path:
+        swe.set_ephe_path(ephe_path)
+        _active_ephe_path = ephe_path
+
+
+def resolve_body_selection(bodies: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Resolve a body selection into the body names to calculate.
+
+    Args:
+        bodies: Body names and/or ASTROLOGICAL_BODY_GROUPS keys (e.g. ["luminaries", "AC"]).
+                None selects every body.
+
+    Returns:
+        Body names in ALL_BODY_NAMES order, including the bodies that selected
+        derived points depend on (e.g. True Node for South Node)
+    """
+    if bodies is None:
+        return list(ALL_BODY_NAMES)
+    if isinstance(bodies, str):
+        bodies = [bodies]
+    selected = set()
+    for item in bodies:
+        if item in ASTROLOGICAL_BODY_GROUPS:
+            selected.update(ASTROLOGICAL_BODY_GROUPS[item])
+        elif item in ALL_BODY_NAMES:
+            selected.add(item)
+        else:
+            raise ValueError(f"Invalid body or body group: {item}. Valid bodies are: {ALL_BODY_NAMES}, valid groups are: {list(ASTROLOGICAL_BODY_GROUPS)}")
+    for name in list(selected):
+        selected.update(BODY_DEPENDENCIES.get(name, []))
+    return [name for name in ALL_BODY_NAMES if name in selected]
+
+class _ChartBlock:
+    """
+    Raw results of charts with the same bodies, stored by column.
+
+    With NumPy the positions, house cusps and aspect rows are arrays, so a
+    worker process sends a few buffers to the parent instead of a tuple tree
+    per chart. Charts from NatalChart.from_many keep their block and index
+    and build their Body, House and Aspect objects from it on first access.
+    """
+
+    def __init__(self, names: Tuple[str, ...], positions, house_cusps, obliquities, aspects=None):
+        """
+        Args:
+            names: Body names of every chart in the block
+            positions: (charts, bodies, 4) positions (see _calculate_raw_positions)
+            house_cusps: (charts, cusps) house cusp longitudes
+            obliquities: True obliquity of each chart
+            aspects: Columns from find_aspects_batch, a list of aspect rows per
+                     chart without NumPy, or None to leave the aspects to each chart
+        """
+        self.names = names
+        self.positions = positions
+        self.house_cusps = house_cusps
+        self.obliquities = obliquities
+        self.aspects = aspects
+        self.columnar = np is not None
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def raw(self, n: int) -> tuple:
+        """(positions, house_cusps, obliquity) of chart n, as _calculate_raw_positions returns them."""
+        positions, house_cusps, obliquity = self.positions[n], self.house_cusps[n], self.obliquities[n]
+        if self.columnar:
+            positions, house_cusps, obliquity = positions.tolist(), house_cusps.tolist(), float(obliquity)
+        return dict(zip(self.names, map(tuple, positions))), house_cusps, obliquity
+
+    def aspect_rows(self, n: int) -> Optional[List[Tuple[int, int, int, float]]]:
+        """Aspect rows of chart n (see AstroEngine._aspect_rows), or None when not calculated."""
+        if self.aspects is None or not self.columnar:
+            return None if self.aspects is None else self.aspects[n]
+        offsets, rows, columns, ks, orbs = self.aspects
+        first, last = offsets[n], offsets[n + 1]
+        return list(zip(rows[first:last].tolist(), columns[first:last].tolist(), ks[first:last].tolist(), orbs[first:last].tolist()))
+
 
 class AstroEngine:
     """Core class that performs all astrological calculations and returns structured data models."""
 
-    def __init__(self, orb_config=None, ephe_path='./nataly/ephe'):
+    def __init__(self, orb_config=None, ephe_path='./nataly/ephe', single_call: bool = False, bodies: Optional[Iterable[str]] = None, cache: Optional[EphemerisCache] = None):
         """
         Initialize the astrological engine.
 
         Args:
             orb_config: OrbConfig object or dict for orb settings
             ephe_path: Path to ephemeris files
+            single_call: If True, make one ephemeris call per body and derive the
+                         declination from the ecliptic position and the true obliquity
+                         instead of a second equatorial call
+            bodies: Body names and/or ASTROLOGICAL_BODY_GROUPS keys to calculate
+                    (defaults to all bodies)
+            cache: EphemerisCache for body positions, house cusps and JDContexts
+                   (no caching by default)
         """
         if orb_config is None:
             orb_config = create_orb_config()
+        self._aspect_table = None
         self.orb_config = orb_config
         self.ephe_path = ephe_path
-        swe.set_ephe_path(self.ephe_path)
-        
-        
+        self.single_call = single_call
+        self.body_names = resolve_body_selection(bodies)
+        self.cache = cache
+        _set_ephe_path_once(self.ephe_path)
+
         self.chart_angles = list(ASTROLOGICAL_BODY_GROUPS["chart_angles"])
+        # Engines derived by with_orb_config, shared by every engine of the family
+        self._orb_engines = {}
+
+    @property
+    def orb_config(self):
+        """Orb configuration; edits made inside it take effect when it is assigned again."""
+        return self._orb_config
+
+    @orb_config.setter
+    def orb_config(self, orb_config):
+        self._orb_config = orb_config
+        # Snapshot of the values, taken only here so aspect_table stays a plain lookup
+        self._orb_key = orb_config_key(orb_config)
+        if self._aspect_table is not None and self._aspect_table.config_key != self._orb_key:
+            self._aspect_table = None
+
+    @property
+    def aspect_table(self) -> AspectTable:
+        """Orb configuration compiled for aspect detection, rebuilt when orb_config is assigned other values."""
+        if self._aspect_table is None:
+            self._aspect_table = AspectTable(self.orb_config)
+        return self._aspect_table
+
+    def with_orb_config(self, orb_config) -> 'AstroEngine':
+        """
+        Get an engine with another orb configuration and this engine's ephemeris settings and cache.
+
+        Derived engines are kept (up to ORB_ENGINE_CACHE_SIZE of them), so switching
+        back and forth between orb configurations reuses their compiled aspect tables.
+
+        Args:
+            orb_config: OrbConfig object or dict for orb settings
+        """
+        if orb_config is None:
+            orb_config = create_orb_config()
+        if orb_config is self.orb_config:
+            return self
+        engines = self._orb_engines
+        if not engines:
+            engines[id(self.orb_config)] = self
+        engine = engines.get(id(orb_config))
+        # Each engine holds its orb_config, so a matching id is the same object
+        if engine is None:
+            engine = self._derive(orb_config)
+            if len(engines) > ORB_ENGINE_CACHE_SIZE:
+                del engines[next(key for key in engines if engines[key] is not self)]
+            engines[id(orb_config)] = engine
+        return engine
+
+    def _derive(self, orb_config) -> 'AstroEngine':
+        """Shallow copy of this engine with another orb configuration."""
+        engine = copy.copy(self)
+        engine.orb_config = orb_config
+        return engine
 
     def _get_sign_from_longitude(self, longitude: float):
         """Get zodiac sign from longitude as a Sign object using get_sign."""
@@ -55,6 +217,15 @@ class AstroEngine:
                 return i + 1
         return 12
 
+    def _get_houses_from_longitudes(self, longitudes: Iterable[float], house_cusps: List[float]) -> List[int]:
+        """House numbers of many longitudes, as _get_house_from_longitude gives them."""
+        ac_longitude = house_cusps[0]
+        starts = [(cusp - ac_longitude + 360) % 360 for cusp in house_cusps]
+        if any(end <= start for start, end in zip(starts, starts[1:])):
+            return [self._get_house_from_longitude(longitude, house_cusps) for longitude in longitudes]
+        # Cusps in zodiacal order from the AC: binary search on the offsets
+        return [bisect_right(starts, (longitude - ac_longitude + 360) % 360) for longitude in longitudes]
+
     def _get_dignity(self, body_name: str, sign_name: str) -> str:
         """Get planetary dignity (domicile, exaltation, detriment, fall)."""
         for dignity, rules in DIGNITY_RULES.items():
@@ -72,55 +243,68 @@ class AstroEngine:
 
     def _get_categorized_orb(self, aspect_name: str, p1_name: str, p2_name: str) -> float:
         """Determine appropriate orb for a planet pair and aspect."""
-        # Use canonical orb config keys from ORB_BODY_GROUPS and ORB_CONFIGS
-        # Determine which group each body belongs to
-        def get_orb_group(name):
-            for group_key, group_list in ORB_BODY_GROUPS.items():
-                if name in group_list:
-                    return group_key
-            return None
-        group1 = get_orb_group(p1_name)
-        group2 = get_orb_group(p2_name)
-        # Prefer the more restrictive group (if one is 'other', use the more specific)
-        group = group1 or group2 or 'orb_other_bodies'
-        # Fallback to orb_other_bodies if not found
-        if group1 and group2:
-            # If one is orb_other_bodies, prefer the other
-            if group1 == 'orb_other_bodies':
-                group = group2
-            elif group2 == 'orb_other_bodies':
-                group = group1
-            else:
-                group = group1  # default to group1
-        # Map aspect to orb type
-        if aspect_name in ORB_ASPECT_GROUPS['major']:
-            orb_type = 'major'
-        elif aspect_name in ORB_ASPECT_GROUPS['sextile']:
-            orb_type = 'sextile'
-        elif aspect_name in ORB_ASPECT_GROUPS['adjustment']:
-            orb_type = 'adjustment'
-        elif aspect_name in ORB_ASPECT_GROUPS['tension']:
-            orb_type = 'tension'
-        elif aspect_name in ORB_ASPECT_GROUPS['creative']:
-            orb_type = 'creative'
-        else:
-            orb_type = 'major'  # fallback
-        config = self.orb_config.get(group, {})
-        return config.get(orb_type, 0)
+        return get_categorized_orb(self.orb_config, aspect_name, p1_name, p2_name)
 
     def _calculate_angular_difference(self, lon1: float, lon2: float) -> float:
         """Calculate the shortest angular distance between two longitudes."""
         diff = abs(lon1 - lon2)
         return min(diff, 360 - diff)
 
-    def get_planets_and_houses(self, dt_utc, lat, lon) -> (Dict[str, Body], List[House]):
-        """Calculate planetary positions and house cusps."""
-        jd_utc = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, dt_utc.hour + dt_utc.minute/60.0)
-        raw_house_cusps, ascmc = swe.houses(jd_utc, lat, lon, b'P')
+    def _get_context(self, dt_utc) -> JDContext:
+        """Build the JDContext for dt_utc, through the cache when one is configured."""
+        if self.cache is None:
+            return JDContext.from_datetime(dt_utc)
+        return self.cache.context(datetime_to_jd(dt_utc))
+
+    def _calc_ut(self, jd_ut: float, planet_id: int, flags: int) -> tuple:
+        """swe.calc_ut, through the cache when one is configured."""
+        if self.cache is None:
+            return swe.calc_ut(jd_ut, planet_id, flags)
+        return self.cache.calc_ut(jd_ut, planet_id, flags)
+
+    def _houses(self, jd_ut: float, lat: float, lon: float) -> tuple:
+        """swe.houses with Placidus cusps, through the cache when one is configured."""
+        if self.cache is None:
+            return swe.houses(jd_ut, lat, lon, b'P')
+        return self.cache.houses(jd_ut, lat, lon, b'P')
+
+    def get_planets_and_houses(self, dt_utc, lat, lon, context: Optional[JDContext] = None, bodies: Optional[Iterable[str]] = None) -> (Dict[str, Body], List[House]):
+        """
+        Calculate planetary positions and house cusps.
+
+        Args:
+            dt_utc: Date and time in UTC
+            lat: Latitude of the location
+            lon: Longitude of the location
+            context: JDContext for dt_utc, to share it between charts for the same instant
+            bodies: Body names and/or ASTROLOGICAL_BODY_GROUPS keys to calculate
+                    instead of the engine's selection
+        """
+        body_names = self.body_names if bodies is None else resolve_body_selection(bodies)
+        return self._build_bodies_and_houses(*self._calculate_raw_positions(dt_utc, lat, lon, context, body_names))
+
+    def _calculate_raw_positions(self, dt_utc, lat, lon, context: Optional[JDContext] = None, body_names: Optional[List[str]] = None) -> (Dict[str, tuple], List[float], float):
+        """
+        Run the ephemeris calculations for a chart without building model objects.
+
+        Returns:
+            Tuple of (positions, house_cusps, obliquity) where positions maps each body
+            name to a (longitude, speed, latitude, declination) tuple and obliquity is
+            the mean obliquity used for house cusp declinations.
+        """
+        if context is None:
+            context = self._get_context(dt_utc)
+        jd_utc = context.jd_ut
+        raw_house_cusps, ascmc = self._houses(jd_utc, lat, lon)
         house_cusps = list(raw_house_cusps)
-        bodies_dict = {}
+        positions = {}
+        if body_names is None:
+            body_names = self.body_names
+        if self.single_call:
+            obl_rad = math.radians(context.true_obliquity)
+            sin_obl, cos_obl = math.sin(obl_rad), math.cos(obl_rad)
 
-        for name in ALL_BODY_NAMES:
+        for name in body_names:
             planet_id = PLANET_MAPPING_SWE.get(name)
             lon_val, speed = 0.0, 0.0
 
@@ -131,40 +315,58 @@ class AstroEngine:
                 elif name == "DC": lon_val = (ascmc[0] + 180) % 360
                 else: continue
             elif name == "South Node":
-                if "True Node" in bodies_dict:
-                    lon_val = (bodies_dict["True Node"].longitude + 180) % 360
-                    speed = bodies_dict["True Node"].speed
+                if "True Node" in positions:
+                    node_lon, node_speed, lat_val, decl_val = positions["True Node"]
+                    lon_val = (node_lon + 180) % 360
+                    speed = node_speed
                 else: continue
             elif planet_id is not None:
                 try:
                     # Get ecliptic coordinates (longitude, latitude, distance, speeds)
-                    ecl_output, _ = swe.calc_ut(jd_utc, planet_id, swe.FLG_SPEED)
+                    ecl_output, _ = self._calc_ut(jd_utc, planet_id, swe.FLG_SPEED)
                     lon_val, speed = ecl_output[0], ecl_output[3]
                     lat_val = ecl_output[1]  # Latitude
-                    
-                    # Get equatorial coordinates (right ascension, declination, distance, speeds)
-                    equ_output, _ = swe.calc_ut(jd_utc, planet_id, swe.FLG_SPEED | swe.FLG_EQUATORIAL)
-                    decl_val = equ_output[1]  # Declination (index 1 in equatorial output)
+
+                    if self.single_call:
+                        # Ecliptic to equatorial: sin(dec) = sin(lat)cos(obl) + cos(lat)sin(obl)sin(lon)
+                        lat_rad, lon_rad = math.radians(lat_val), math.radians(lon_val)
+                        decl_val = math.degrees(math.asin(
+                            math.sin(lat_rad) * cos_obl + math.cos(lat_rad) * sin_obl * math.sin(lon_rad)
+                        ))
+                    else:
+                        # Get equatorial coordinates (right ascension, declination, distance, speeds)
+                        equ_output, _ = self._calc_ut(jd_utc, planet_id, swe.FLG_SPEED | swe.FLG_EQUATORIAL)
+                        decl_val = equ_output[1]  # Declination (index 1 in equatorial output)
                         
                 except Exception: continue
             else: continue
 
+            # Set default values for angles (no latitude/declination)
+            lat_val = 0.0 if name in self.chart_angles else lat_val
+            decl_val = 0.0 if name in self.chart_angles else decl_val
+            positions[name] = (lon_val, speed, lat_val, decl_val)
+
+        return positions, house_cusps, context.mean_obliquity
+
+    def _build_bodies_and_houses(self, positions: Dict[str, tuple], house_cusps: List[float], obliquity: float) -> (Dict[str, Body], List[House]):
+        """Build Body and House objects from raw ephemeris positions and house cusps."""
+        bodies_dict = {}
+        house_numbers = self._get_houses_from_longitudes([position[0] for position in positions.values()], house_cusps)
+        for (name, (lon_val, speed, lat_val, decl_val)), house in zip(positions.items(), house_numbers):
             sign = self._get_sign_from_longitude(lon_val)
-            house = self._get_house_from_longitude(lon_val, house_cusps)
             dignity = self._get_dignity(name, sign.name)
             body_type = self._get_body_type(name)
 
-            # Set default values for angles (no latitude/declination)
-            lat_val = 0.0 if name in self.chart_angles else lat_val
-            decl_val = 0.0 if name in self.chart_angles else decl_val
-            
             bodies_dict[name] = Body(
                 name=name, body_type=body_type, longitude=lon_val, speed=speed,
                 is_retrograde=speed < 0 and name not in self.chart_angles,
                 sign=sign, house=house, dignity=dignity,
                 latitude=lat_val, declination=decl_val
             )
+        return bodies_dict, self._build_houses(house_cusps, bodies_dict, obliquity)
 
+    def _build_houses(self, house_cusps: List[float], bodies_dict: Dict[str, Body], obliquity: float) -> List[House]:
+        """Build House objects with their rulers from house cusps and the chart's bodies."""
         houses_list = []
         for i in range(12):
             cusp_lon = house_cusps[i]
@@ -172,39 +374,8 @@ class AstroEngine:
             classic_ruler = bodies_dict.get(sign.classic_ruler)
             modern_ruler = bodies_dict.get(sign.modern_ruler) if sign.modern_ruler else None
             
-            # Calculate declination for house cusps using proper astrological method
-            # House cusp declination is calculated differently than body declination
-            # For Placidus houses, we need to use the house cusp longitude and geographic latitude
-            # The correct formula for house cusp declination is more complex
-            
-            # Get the obliquity of the ecliptic at the given time
-            year = dt_utc.year
-            month = dt_utc.month
-            day = dt_utc.day
-            
-            # Calculate Julian Day Number for the date
-            jd_date = swe.julday(year, month, day, 12.0)  # Noon on the date
-            
-            # Calculate T (Julian centuries since J2000.0)
-            T = (jd_date - 2451545.0) / 36525.0
-            
-            # IAU 2006 formula for mean obliquity
-            obliquity_arcsec = 84381.406 - 46.836769 * T - 0.0001831 * T * T + 0.00200340 * T * T * T - 0.000000576 * T * T * T * T - 0.0000000434 * T * T * T * T * T
-            obliquity = obliquity_arcsec / 3600.0  # Convert arcseconds to degrees
-            
-            # For house cusp declination, we need to use the proper astrological formula
-            # This is different from body declination calculation
-            # House cusp declination depends on the house system and geographic location
-            
-            # Convert to radians
-            lat_rad = math.radians(lat)
-            obl_rad = math.radians(obliquity)
-            lon_rad = math.radians(cusp_lon)
-            
-            # Calculate house cusp declination using the correct formula
             # House cusps are points on the ecliptic (latitude = 0)
             # For ecliptic points, declination = obliquity * sin(longitude)
-            # This is the correct formula for house cusp declination
             cusp_declination = obliquity * math.sin(math.radians(cusp_lon))
             
             houses_list.append(House(
@@ -214,130 +385,343 @@ class AstroEngine:
                 modern_ruler_house=modern_ruler.house if modern_ruler else None,
                 declination=cusp_declination
             ))
-        return bodies_dict, houses_list
+        return houses_list
 
-    def get_aspects(self, bodies1: Dict[str, Body], bodies2: Dict[str, Body] = None) -> List[Aspect]:
+    def get_relocated_bodies_and_houses(self, bodies_dict: Dict[str, Body], dt_utc, lat, lon, context: Optional[JDContext] = None) -> (Dict[str, Body], List[House]):
+        """
+        Move a chart's bodies to another location at the same instant.
+
+        Body positions are kept; only the house cusps, the chart angles and the
+        house placements are recalculated, with one swe.houses call.
+
+        Args:
+            bodies_dict: Bodies of the chart to relocate (left unchanged)
+            dt_utc: Date and time of the chart in UTC
+            lat: Latitude of the new location
+            lon: Longitude of the new location
+            context: JDContext for dt_utc, to share it between relocations
+        """
+        if context is None:
+            context = self._get_context(dt_utc)
+        raw_house_cusps, ascmc = self._houses(context.jd_ut, lat, lon)
+        house_cusps = list(raw_house_cusps)
+        angles = {
+            "AC": ascmc[0], "MC": ascmc[1],
+            "IC": (ascmc[1] + 180) % 360, "DC": (ascmc[0] + 180) % 360,
+        }
+        longitudes = [angles.get(name, body.longitude) for name, body in bodies_dict.items()]
+        house_numbers = self._get_houses_from_longitudes(longitudes, house_cusps)
+        relocated = {}
+        for (name, body), lon_val, house in zip(bodies_dict.items(), longitudes, house_numbers):
+            sign, dignity = body.sign, body.dignity
+            if name in angles:
+                sign = self._get_sign_from_longitude(lon_val)
+                dignity = self._get_dignity(name, sign.name)
+            relocated[name] = Body(
+                name=name, body_type=body.body_type, longitude=lon_val, speed=body.speed,
+                is_retrograde=body.is_retrograde, sign=sign, house=house, dignity=dignity,
+                latitude=body.latitude, declination=body.declination
+            )
+        return relocated, self._build_houses(house_cusps, relocated, context.mean_obliquity)
+
+    def get_relocated_aspects(self, aspects: List[Aspect], bodies_dict: Dict[str, Body]) -> List[Aspect]:
+        """
+        Aspects of a relocated chart, equal to get_aspects(bodies_dict).
+
+        Aspects between bodies that did not move are taken over from the
+        original chart; only the pairs involving a chart angle are recalculated.
+
+        Args:
+            aspects: Aspects of the original chart
+            bodies_dict: Relocated bodies (see get_relocated_bodies_and_houses)
+        """
+        moved = set(self.chart_angles)
+        index = {name: i for i, name in enumerate(bodies_dict)}
+        entries = [
+            (index[a.body1.name], index[a.body2.name], Aspect(
+                body1=bodies_dict[a.body1.name], body2=bodies_dict[a.body2.name],
+                aspect_type=a.aspect_type, symbol=a.symbol, orb=a.orb, is_applying=a.is_applying
+            ))
+            for a in aspects if a.body1.name not in moved and a.body2.name not in moved
+        ]
+        table = self.aspect_table
+        items = list(bodies_dict.values())
+        table_indexes = [table.index_of(body.name) for body in items]
+        for i, body in enumerate(items):
+            if body.name not in moved:
+                continue
+            for j, other in enumerate(items):
+                # Pairs between two angles are visited once, from the earlier one
+                if j == i or other.name == body.name or (j < i and other.name in moved):
+                    continue
+                # Keep the chart order (earlier body first), as get_aspects does
+                a, b = (i, j) if i < j else (j, i)
+                body1, body2 = items[a], items[b]
+                diff = abs(body1.longitude - body2.longitude)
+                angular_diff = min(diff, 360 - diff)
+                for k, angle, orb_limit in table.candidates[table_indexes[a]][table_indexes[b]][int(angular_diff)]:
+                    orb_diff = angular_diff - angle
+                    if abs(orb_diff) <= orb_limit:
+                        entries.append((a, b, Aspect(
+                            body1=body1, body2=body2,
+                            aspect_type=table.aspect_names[k], symbol=table.aspect_symbols[k],
+                            orb=orb_diff, is_applying=orb_diff < 0
+                        )))
+                        break
+        entries.sort(key=lambda entry: (entry[0], entry[1]))
+        return [aspect for _, _, aspect in entries]
+
+    def compute_batch(self, inputs: Iterable[tuple], with_aspects: bool = False) -> List[tuple]:
+        """
+        Calculate planetary positions and house cusps for many charts in one call.
+
+        The engine, its orb configuration and the ephemeris setup are shared by
+        every record, so only the per-chart ephemeris work is repeated.
+
+        Args:
+            inputs: Iterable of (name, dt_utc, lat, lon) records
+            with_aspects: If True, also calculate the aspects between the bodies of each chart
+
+        Returns:
+            List of (bodies_dict, houses) tuples in input order, or
+            (bodies_dict, houses, aspects) tuples when with_aspects is True
+        """
+        results = []
+        for raw in self.compute_raw_batch([(dt_utc, lat, lon) for _, dt_utc, lat, lon in inputs]):
+            bodies_dict, houses = self._build_bodies_and_houses(*raw)
+            if with_aspects:
+                results.append((bodies_dict, houses, self.get_aspects(bodies_dict)))
+            else:
+                results.append((bodies_dict, houses))
+        return results
+
+    def _compute_chart_batch(self, records: List[tuple]) -> List[tuple]:
+        """
+        Raw results of many charts for NatalChart.from_many, without model objects.
+
+        With NumPy the aspects of all charts with the same bodies are found
+        together (see find_aspects_batch); without it they are left to each
+        chart's first access.
+
+        Returns:
+            (block, index) pairs in input order (see _ChartBlock)
+        """
+        return self._place_blocks(len(records), self._chart_blocks(self.compute_raw_batch(records), np is not None))
+
+    def _chart_blocks(self, raw_batch: List[tuple], with_aspects: bool) -> List[Tuple[List[int], _ChartBlock]]:
+        """
+        Group raw chart results (see compute_raw_batch) into blocks of charts with the same bodies.
+
+        Returns:
+            (positions in raw_batch, block) pairs
+        """
+        groups = {}
+        for n, (positions, _, _) in enumerate(raw_batch):
+            groups.setdefault(tuple(positions), []).append(n)
+        blocks = []
+        for names, members in groups.items():
+            positions = [list(raw_batch[n][0].values()) for n in members]
+            house_cusps = [list(raw_batch[n][1]) for n in members]
+            obliquities = [raw_batch[n][2] for n in members]
+            aspects = None
+            if np is not None:
+                positions = np.array(positions, dtype=float).reshape(len(members), len(names), -1)
+                house_cusps, obliquities = np.array(house_cusps, dtype=float), np.array(obliquities, dtype=float)
+                if with_aspects:
+                    aspects = find_aspects_batch(self.aspect_table, list(names), positions[:, :, 0])
+            elif with_aspects:
+                aspects = [self._aspect_rows(list(names), [position[0] for position in row]) for row in positions]
+            blocks.append((members, _ChartBlock(names, positions, house_cusps, obliquities, aspects)))
+        return blocks
+
+    @staticmethod
+    def _place_blocks(count: int, blocks: Iterable[Tuple[List[int], _ChartBlock]]) -> List[Tuple[_ChartBlock, int]]:
+        """(block, index) of each of count charts in input order, from _chart_blocks results."""
+        placed = [None] * count
+        for members, block in blocks:
+            for m, n in enumerate(members):
+                placed[n] = (block, m)
+        return placed
+
+    def compute_raw_batch(self, records: List[tuple]) -> List[tuple]:
+        """
+        Run the ephemeris calculations for many charts without building model objects.
+
+        Args:
+            records: List of (dt_utc, lat, lon) records
+
+        Returns:
+            List of (positions, house_cusps, obliquity) tuples in input order
+            (see _calculate_raw_positions)
+        """
+        results = []
+        contexts = {}
+        for dt_utc, lat, lon in records:
+            # Records for the same instant (e.g. relocations) share one JDContext
+            context = contexts.get(dt_utc)
+            if context is None:
+                context = contexts[dt_utc] = self._get_context(dt_utc)
+            results.append(self._calculate_raw_positions(dt_utc, lat, lon, context))
+        return results
+
+    def get_aspects(self, bodies1: Dict[str, Body], bodies2: Dict[str, Body] = None, vectorized: Optional[bool] = None) -> List[Aspect]:
         """
         Calculates aspects using proper astrological orb limits and applying/separating logic.
+
+        Args:
+            bodies1: Bodies of the first chart
+            bodies2: Bodies of the second chart (defaults to bodies1)
+            vectorized: Use the NumPy kernel (True), the pure-Python kernel (False) or
+                        pick automatically (None); both return identical aspects
         """
+        same_bodies = bodies2 is None or bodies2 is bodies1
         if bodies2 is None:
             bodies2 = bodies1
         
+        table = self.aspect_table
+        aspect_names, aspect_symbols = table.aspect_names, table.aspect_symbols
+        if vectorized is None:
+            n_pairs = len(bodies1) * (len(bodies1) - 1) // 2 if same_bodies else len(bodies1) * len(bodies2)
+            vectorized = np is not None and n_pairs >= VECTORIZED_MIN_PAIRS
+        if vectorized:
+            if np is None:
+                raise ImportError("NumPy is required for vectorized aspect calculation (pip install numpy)")
+            b1_items, b2_items = list(bodies1.values()), list(bodies2.values())
+            return [
+                Aspect(
+                    body1=b1_items[i], body2=b2_items[j],
+                    aspect_type=aspect_names[k], symbol=aspect_symbols[k],
+                    orb=orb_diff, is_applying=orb_diff < 0
+                )
+                for i, j, k, orb_diff in find_aspects_vectorized(
+                    table,
+                    [b.name for b in b1_items], [b.longitude for b in b1_items],
+                    [b.name for b in b2_items], [b.longitude for b in b2_items],
+                    same_bodies
+                )
+            ]
+
         aspects = []
         processed_pairs = set()
         b1_items, b2_items = list(bodies1.values()), list(bodies2.values())
+        b2_indexes = [table.index_of(body.name) for body in b2_items]
 
-        for body1 in b1_items:
-            for body2 in b2_items:
-                if body1.name == body2.name:
+        for i, body1 in enumerate(b1_items):
+            candidate_rows = table.candidates[table.index_of(body1.name)]
+            # Within one set of bodies every pair is reached first with body1 before body2
+            start = i + 1 if same_bodies else 0
+            for body2, index2 in zip(b2_items[start:], b2_indexes[start:]):
+                name1, name2 = body1.name, body2.name
+                if name1 == name2:
                     continue
                 
-                pair_key = tuple(sorted((body1.name, body2.name)))
-                if pair_key in processed_pairs:
-                    continue
-                processed_pairs.add(pair_key)
+                if not same_bodies:
+                    pair_key = (name1, name2) if name1 < name2 else (name2, name1)
+                    if pair_key in processed_pairs:
+                        continue
+                    processed_pairs.add(pair_key)
 
-                angular_diff = self._calculate_angular_difference(body1.longitude, body2.longitude)
-                
-                # Find all aspects within proper orb limits
-                valid_aspects = []
-                for aspect_name, aspect_data in ASPECT_DATA.items():
-                    orb_diff = angular_diff - aspect_data["angle"]
-                    orb_limit = self._get_categorized_orb(aspect_name, body1.name, body2.name)
-                    
-                    # Check if aspect is within orb limit
+                diff = abs(body1.longitude - body2.longitude)
+                angular_diff = min(diff, 360 - diff)
+                # The first aspect within orb in strength order is the resolved aspect
+                for k, angle, orb_limit in candidate_rows[index2][int(angular_diff)]:
+                    orb_diff = angular_diff - angle
                     if abs(orb_diff) <= orb_limit:
-                        valid_aspects.append((aspect_name, aspect_data, orb_diff))
-                
-                # Apply aspect conflict prevention
-                best_aspect = self._resolve_aspect_conflicts(valid_aspects, body1, body2)
-                
-                if best_aspect:
-                    aspect_name, aspect_data, orb_diff = best_aspect
-                    
-                    # Use orb_diff directly without applying/separating logic
-                    # The sign of orb_diff indicates the direction from exact aspect
-                    actual_orb = orb_diff
-                    
-                    # Determine applying/separating based on orb sign
-                    # Positive orb_diff means we're past the exact aspect (separating)
-                    # Negative orb_diff means we're before the exact aspect (applying)
-                    is_applying = orb_diff < 0
-                    
-                    aspects.append(Aspect(
-                        body1=body1,
-                        body2=body2,
-                        aspect_type=aspect_name,
-                        symbol=aspect_data["symbol"],
-                        orb=actual_orb,
-                        is_applying=is_applying
-                    ))
+                        # The sign of orb_diff indicates the direction from exact aspect:
+                        # negative means applying, positive means separating
+                        aspects.append(Aspect(
+                            body1=body1,
+                            body2=body2,
+                            aspect_type=aspect_names[k],
+                            symbol=aspect_symbols[k],
+                            orb=orb_diff,
+                            is_applying=orb_diff < 0
+                        ))
+                        break
         return aspects
 
-    def _resolve_aspect_conflicts(self, valid_aspects: List[tuple], body1: Body, body2: Body) -> tuple:
+    def _aspect_rows(self, names: List[str], longitudes: List[float]) -> List[Tuple[int, int, int, float]]:
         """
-        Resolve aspect conflicts using Astrodienst logic.
-        Prevents weak aspects when stronger ones are present.
+        Aspects of one chart as plain tuples, without Body or Aspect objects.
+
+        Returns:
+            (i, j, aspect index, orb_diff) tuples with indexes into names and
+            aspect_table.aspect_names, in the order get_aspects returns them
         """
-        if not valid_aspects:
-            return None
-        
-        # Sort by aspect strength (major aspects first)
-        aspect_strength = {
-            "Conjunction": 1, "Opposition": 2, "Trine": 3, "Square": 4, "Sextile": 5,
-            "Quincunx": 6, "Semisquare": 7, "Sesquiquadrate": 8, "Semisextile": 9,
-            "Quintile": 10, "Biquintile": 11
-        }
-        
-        # Group aspects by strength
-        aspect_groups = {}
-        for aspect_name, aspect_data, orb_diff in valid_aspects:
-            strength = aspect_strength.get(aspect_name, 99)
-            if strength not in aspect_groups:
-                aspect_groups[strength] = []
-            aspect_groups[strength].append((aspect_name, aspect_data, orb_diff))
-        
-        # Check for conflicts and return the strongest aspect
-        for strength in sorted(aspect_strength.values()):
-            if strength in aspect_groups:
-                aspects_in_group = aspect_groups[strength]
-                
-                # If multiple aspects in same strength group, choose the one with smallest orb
-                if len(aspects_in_group) > 1:
-                    aspects_in_group.sort(key=lambda x: abs(x[2]))
-                
-                # Check if this aspect conflicts with stronger aspects
-                aspect_name = aspects_in_group[0][0]
-                if not self._has_aspect_conflict(aspect_name, aspect_groups, strength):
-                    return aspects_in_group[0]
-        
-        return None
+        table = self.aspect_table
+        if np is not None and len(names) * (len(names) - 1) // 2 >= VECTORIZED_MIN_PAIRS:
+            return find_aspects_vectorized(table, names, longitudes, names, longitudes, True)
+        rows = []
+        indexes = [table.index_of(name) for name in names]
+        for i, lon1 in enumerate(longitudes):
+            candidate_rows = table.candidates[indexes[i]]
+            for j in range(i + 1, len(longitudes)):
+                if names[i] == names[j]:
+                    continue
+                diff = abs(lon1 - longitudes[j])
+                angular_diff = min(diff, 360 - diff)
+                for k, angle, orb_limit in candidate_rows[indexes[j]][int(angular_diff)]:
+                    orb_diff = angular_diff - angle
+                    if abs(orb_diff) <= orb_limit:
+                        rows.append((i, j, k, orb_diff))
+                        break
+        return rows
 
-    def _has_aspect_conflict(self, aspect_name: str, aspect_groups: dict, current_strength: int) -> bool:
+    def _aspects_from_rows(self, bodies_dict: Dict[str, Body], rows: List[Tuple[int, int, int, float]]) -> List[Aspect]:
+        """Aspect objects of one chart from its aspect rows (see _aspect_rows)."""
+        table = self.aspect_table
+        aspect_names, aspect_symbols = table.aspect_names, table.aspect_symbols
+        items = list(bodies_dict.values())
+        return [
+            Aspect(
+                body1=items[i], body2=items[j],
+                aspect_type=aspect_names[k], symbol=aspect_symbols[k],
+                orb=orb_diff, is_applying=orb_diff < 0
+            )
+            for i, j, k, orb_diff in rows
+        ]
+
+    def get_pair_distances(self, bodies_dict: Dict[str, Body]) -> List[Tuple[int, int, float]]:
         """
-        Check if an aspect conflicts with stronger aspects.
-        Only prevents very weak aspects when major ones exist.
+        Angular separation of every pair of bodies of one chart.
+
+        Returns:
+            (i, j, separation) tuples with i < j indexes into bodies_dict and the
+            separation in degrees (0-180), in the order get_aspects visits the pairs
         """
-        # Define aspect conflicts (only prevent very weak aspects when major ones exist)
-        conflicts = {
-            "Semisextile": ["Conjunction", "Opposition", "Trine", "Square", "Sextile"],
-            "Quincunx": ["Conjunction", "Opposition", "Trine", "Square", "Sextile"],
-            "Quintile": ["Conjunction", "Opposition", "Trine", "Square", "Sextile"],
-            "Biquintile": ["Conjunction", "Opposition", "Trine", "Square", "Sextile"]
-        }
-        
-        if aspect_name not in conflicts:
-            return False
-        
-        # Check if any conflicting stronger aspect exists
-        for conflict_aspect in conflicts[aspect_name]:
-            conflict_strength = {
-                "Conjunction": 1, "Opposition": 2, "Trine": 3, "Square": 4, "Sextile": 5,
-                "Quincunx": 6, "Semisquare": 7, "Sesquiquadrate": 8, "Semisextile": 9,
-                "Quintile": 10, "Biquintile": 11
-            }.get(conflict_aspect, 99)
-            
-            if conflict_strength < current_strength and conflict_strength in aspect_groups:
-                return True
-        
-        return False
\ No newline at end of file
+        longitudes = [body.longitude for body in bodies_dict.values()]
+        distances = []
+        for i, lon1 in enumerate(longitudes):
+            for j in range(i + 1, len(longitudes)):
+                diff = abs(lon1 - longitudes[j])
+                distances.append((i, j, min(diff, 360 - diff)))
+        return distances
+
+    def get_aspects_from_distances(self, bodies_dict: Dict[str, Body], distances: List[Tuple[int, int, float]]) -> List[Aspect]:
+        """
+        Aspects of one chart from its precomputed pair distances, equal to get_aspects(bodies_dict).
+
+        Only the orb table is consulted, so re-filtering a chart under another orb
+        configuration needs no longitude arithmetic.
+
+        Args:
+            bodies_dict: Bodies of the chart
+            distances: Pair distances of the same bodies (see get_pair_distances)
+        """
+        table = self.aspect_table
+        aspect_names, aspect_symbols = table.aspect_names, table.aspect_symbols
+        items = list(bodies_dict.values())
+        rows = [table.candidates[table.index_of(body.name)] for body in items]
+        indexes = [table.index_of(body.name) for body in items]
+        aspects = []
+        for i, j, angular_diff in distances:
+            for k, angle, orb_limit in rows[i][indexes[j]][int(angular_diff)]:
+                orb_diff = angular_diff - angle
+                if abs(orb_diff) <= orb_limit:
+                    aspects.append(Aspect(
+                        body1=items[i], body2=items[j],
+                        aspect_type=aspect_names[k], symbol=aspect_symbols[k],
+                        orb=orb_diff, is_applying=orb_diff < 0
+                    ))
+                    break
+        return aspects
@@ -0,0 +1,398 @@
+# nataly/events.py
+# Root-finding search for the exact times of astrological events.
+
+import datetime
+import heapq
+import math
+from dataclasses import replace
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import swisseph as swe
+
+from .constants import ASPECT_DATA, PLANET_MAPPING_SWE, SIGN_NAMES_BY_DEGREE
+from .context import datetime_to_jd, jd_to_datetime
+from .engine import AstroEngine
+from .models import AspectEvent, IngressEvent, StationEvent, Body
+
+# Largest scan step per body in days. Each step is kept below half of the body's
+# shortest direct or retrograde phase, so at most one station falls between two
+# samples, and below 90 degrees of motion, so wrap-arounds are never taken for
+# crossings. Bodies not listed use DEFAULT_COARSE_STEP.
+COARSE_STEP_DAYS = {
+    "Sun": 20.0, "Moon": 2.0, "Mercury": 5.0, "Venus": 10.0, "Mars": 15.0,
+    "Jupiter": 30.0, "Saturn": 30.0, "Uranus": 30.0, "Neptune": 30.0, "Pluto": 30.0,
+    "Ceres": 15.0, "Pallas": 15.0, "Juno": 15.0, "Vesta": 15.0,
+    "Chiron": 30.0, "Pholus": 30.0, "Mean Node": 30.0,
+    # The true node changes direction every few days; see MAX_ACCELERATION
+    "True Node": 2.0, "South Node": 2.0,
+}
+DEFAULT_COARSE_STEP = 5.0
+
+# Bound on the rate of change of the speed (degrees/day^2) of bodies whose direct
+# and retrograde phases can be shorter than any useful coarse step. Their scan
+# never steps further than the speed could take to reach zero, so paired stations
+# cannot fall inside one step. The true node's speed changes by at most about 0.07
+# degrees/day^2, apart from isolated one-sample spikes at ephemeris segment seams.
+MAX_ACCELERATION = {"True Node": 0.1, "South Node": 0.1}
+# Shortest step of that bounded scan; phases shorter than this (true node phases
+# as short as 0.001 days occur) cancel out, as in a brute-force scan at this step.
+MIN_BOUNDED_STEP_DAYS = 0.01
+
+# Refinement stops when the bracketing interval is shorter than this (days, ~0.01 s)
+TIME_TOLERANCE = 1e-7
+
+# Adaptive stepping: while the speed is heading towards zero, the step shrinks to
+# STATION_SAFETY times the time it needs to get there at its current rate of
+# change, but not below MIN_STEP_DAYS.
+STATION_SAFETY = 0.5
+MIN_STEP_DAYS = 0.05
+
+
+def _signed_difference(angle: float) -> float:
+    """Wrap an angle difference to (-180, 180]."""
+    angle = (angle + 180.0) % 360.0 - 180.0
+    return 180.0 if angle == -180.0 else angle
+
+
+def _refine_root_newton(func: Callable[[float], Tuple[float, float]], a: float, fa: float, b: float, fb: float, tolerance: float = TIME_TOLERANCE) -> float:
+    """
+    Find a root of func inside [a, b] when func returns (value, derivative).
+
+    Newton steps are taken while they stay inside the bracket, which shrinks on
+    every iteration; otherwise the bracket is bisected.
+    """
+    x = b - fb * (b - a) / (fb - fa)  # start from the secant through the bracket
+    if fa > 0:
+        a, b = b, a  # keep func(a) < 0 < func(b)
+    for _ in range(100):
+        fx, dfx = func(x)
+        if fx == 0.0:
+            return x
+        if fx < 0:
+            a = x
+        else:
+            b = x
+        newton = x - fx / dfx if dfx else None
+        if newton is not None and min(a, b) <= newton <= max(a, b):
+            step, x = abs(newton - x), newton
+        else:
+            step, x = abs(b - a) / 2.0, (a + b) / 2.0
+        if step < tolerance:
+            return x
+    return x
+
+
+def _refine_root(func: Callable[[float], float], a: float, fa: float, b: float, fb: float, tolerance: float = TIME_TOLERANCE) -> float:
+    """
+    Find a root of func inside [a, b], where fa and fb have opposite signs.
+
+    Uses the Illinois variant of the secant (regula falsi) method, which keeps
+    the root bracketed and converges superlinearly.
+    """
+    for _ in range(100):
+        c = b - fb * (b - a) / (fb - fa)
+        fc = func(c)
+        if fc == 0.0:
+            return c
+        if (fc < 0) != (fb < 0):
+            a, fa = b, fb
+        else:
+            fa /= 2.0
+        b, fb = c, fc
+        if abs(b - a) < tolerance:
+            break
+    return b
+
+
+def _opposite_sign(sign: str) -> str:
+    return SIGN_NAMES_BY_DEGREE[(SIGN_NAMES_BY_DEGREE.index(sign) + 6) % 12]
+
+
+def _with_south_node(events: Iterator[Union[IngressEvent, StationEvent]]) -> Iterator[Union[IngressEvent, StationEvent]]:
+    """Follow each True Node event with the same event of the South Node, 180 degrees away."""
+    for event in events:
+        yield event
+        longitude = (event.longitude + 180.0) % 360.0
+        if isinstance(event, IngressEvent):
+            yield replace(event, body="South Node", sign=_opposite_sign(event.sign), previous_sign=_opposite_sign(event.previous_sign), longitude=longitude)
+        else:
+            yield replace(event, body="South Node", sign=_opposite_sign(event.sign), longitude=longitude)
+
+
+class EventFinder:
+    """
+    Search engine for the exact times of transit events within a date range.
+
+    Zero crossings are bracketed with coarse steps sized to each body's motion
+    (COARSE_STEP_DAYS, shortened near stations) and refined with Newton steps
+    using the ephemeris speed, safeguarded by bisection. Stations between two
+    samples are located first with secant iteration, so retrograde loops yield every crossing; the
+    stations themselves and sign ingresses come from the same scan.
+    """
+
+    def __init__(self, engine: Optional[AstroEngine] = None, ephe_path: str = './nataly/ephe'):
+        """
+        Initialize the finder.
+
+        Args:
+            engine: AstroEngine providing the ephemeris path and cache
+            ephe_path: Path to ephemeris files, when no engine is given
+        """
+        self.engine = engine if engine is not None else AstroEngine(ephe_path=ephe_path)
+
+    def _motion(self, body: str) -> Callable[[float], Tuple[float, float]]:
+        """Return a function of the Julian day giving the body's (longitude, speed)."""
+        if body == "South Node":
+            node = self._motion("True Node")
+
+            def south_node(jd: float) -> Tuple[float, float]:
+                lon, speed = node(jd)
+                return (lon + 180.0) % 360.0, speed
+            return south_node
+        planet_id = PLANET_MAPPING_SWE.get(body)
+        if planet_id is None or body in self.engine.chart_angles:
+            raise ValueError(f"Cannot search events for '{body}'; it has no ephemeris of its own")
+        calc_ut = self.engine._calc_ut
+
+        def motion(jd: float) -> Tuple[float, float]:
+            ecl_output, _ = calc_ut(jd, planet_id, swe.FLG_SPEED)
+            return ecl_output[0], ecl_output[3]
+        return motion
+
+    def _scan(self, motion: Callable[[float], Tuple[float, float]], jd_start: float, jd_end: float, step: float, max_acceleration: Optional[float] = None) -> Iterator[Tuple[float, float, float, float, float]]:
+        """
+        Walk a time range in adaptive coarse steps, splitting the steps that contain a station.
+
+        With max_acceleration (see MAX_ACCELERATION) each step is also kept below the
+        time the speed needs to reach zero at that rate of change, down to
+        MIN_BOUNDED_STEP_DAYS.
+
+        Yields:
+            (a, lon_a, b, lon_b, station_speed) pieces in time order; the longitude is
+            monotonic on each piece and station_speed is the speed before a station
+            at b, or 0.0 when b is no station
+        """
+        a = jd_start
+        lon_a, speed_a = motion(a)
+        next_step = step
+        while a < jd_end:
+            b = min(a + next_step, jd_end)
+            lon_b, speed_b = motion(b)
+            if max_acceleration is not None:
+                # The speed can only reach zero inside the step if both ends are close enough to it
+                while b - a > MIN_BOUNDED_STEP_DAYS and abs(speed_a) + abs(speed_b) <= max_acceleration * (b - a):
+                    b = a + max(MIN_BOUNDED_STEP_DAYS, (b - a) / 2)
+                    lon_b, speed_b = motion(b)
+            rate = (speed_b - speed_a) / (b - a)
+            if max_acceleration is not None:
+                next_step = min(step, max(MIN_BOUNDED_STEP_DAYS, 1.5 * abs(speed_b) / max_acceleration))
+            elif speed_b * rate < 0:
+                next_step = min(step, max(MIN_STEP_DAYS, STATION_SAFETY * abs(speed_b / rate)))
+            else:
+                next_step = step
+            if speed_a != 0.0 and (speed_a < 0) != (speed_b < 0):
+                # Station inside the step: split there so each part is monotonic
+                station = _refine_root(lambda t: motion(t)[1], a, speed_a, b, speed_b)
+                lon_station, _ = motion(station)
+                yield a, lon_a, station, lon_station, speed_a
+                yield station, lon_station, b, lon_b, 0.0
+            else:
+                yield a, lon_a, b, lon_b, 0.0
+            a, lon_a, speed_a = b, lon_b, speed_b
+
+    def _crossing(self, motion: Callable[[float], Tuple[float, float]], target: float, a: float, lon_a: float, b: float, lon_b: float) -> Optional[float]:
+        """Return the time the longitude reaches target within the monotonic piece (a, b], if it does."""
+        da, db = _signed_difference(lon_a - target), _signed_difference(lon_b - target)
+        # A sign change across the +/-180 seam is a wrap-around, not a crossing
+        if abs(da - db) >= 180.0 or not ((da < 0 <= db) or (da > 0 >= db)):
+            return None
+        if db == 0.0:
+            return b
+
+        def offset(t: float) -> Tuple[float, float]:
+            lon, speed = motion(t)
+            return _signed_difference(lon - target), speed
+        return _refine_root_newton(offset, a, da, b, db)
+
+    def _crossings(self, motion: Callable[[float], Tuple[float, float]], targets: List[float], jd_start: float, jd_end: float, step: float, max_acceleration: Optional[float] = None) -> List[Tuple[float, float, float, float]]:
+        """
+        Find every time the body's longitude passes through one of the targets.
+
+        Returns:
+            (jd, target, longitude, speed) tuples sorted by time
+        """
+        events = []
+        lon_start, _ = motion(jd_start)
+        for target in targets:
+            if _signed_difference(lon_start - target) == 0.0:
+                events.append((jd_start, target))
+        for a, lon_a, b, lon_b, _ in self._scan(motion, jd_start, jd_end, step, max_acceleration):
+            for target in targets:
+                jd = self._crossing(motion, target, a, lon_a, b, lon_b)
+                if jd is not None:
+                    events.append((jd, target))
+        events.sort()
+        return [(jd, target) + motion(jd) for jd, target in events]
+
+    def _iter_body_events(self, body: str, jd_start: float, jd_end: float, ingresses: bool, stations: bool, tzinfo) -> Iterator[Union[IngressEvent, StationEvent]]:
+        """Stream the ingresses and stations of one body in time order."""
+        motion = self._motion(body)
+        step = COARSE_STEP_DAYS.get(body, DEFAULT_COARSE_STEP)
+        for a, lon_a, b, lon_b, station_speed in self._scan(motion, jd_start, jd_end, step, MAX_ACCELERATION.get(body)):
+            if ingresses:
+                delta = _signed_difference(lon_b - lon_a)
+                # Sign boundaries inside the piece: (lon_a, lon_b] forwards, [lon_b, lon_a) backwards
+                if delta > 0:
+                    boundaries = range(math.floor(lon_a / 30.0) + 1, math.floor((lon_a + delta) / 30.0) + 1)
+                else:
+                    boundaries = range(math.ceil(lon_a / 30.0) - 1, math.ceil((lon_a + delta) / 30.0) - 2, -1)
+                for boundary in boundaries:
+                    target = (boundary * 30.0) % 360.0
+                    jd = self._crossing(motion, target, a, lon_a, b, lon_b)
+                    if jd is None:
+                        continue
+                    lon, _ = motion(jd)
+                    sign_index = int(target // 30) if delta > 0 else (int(target // 30) - 1) % 12
+                    previous_index = (sign_index - 1) % 12 if delta > 0 else (sign_index + 1) % 12
+                    yield IngressEvent(
+                        body=body, sign=SIGN_NAMES_BY_DEGREE[sign_index],
+                        previous_sign=SIGN_NAMES_BY_DEGREE[previous_index],
+                        dt_utc=jd_to_datetime(jd, tzinfo), jd_ut=jd, longitude=lon,
+                        is_retrograde=delta < 0
+                    )
+            if stations and station_speed != 0.0:
+                yield StationEvent(
+                    body=body, station_type="retrograde" if station_speed > 0 else "direct",
+                    dt_utc=jd_to_datetime(b, tzinfo), jd_ut=b, longitude=lon_b,
+                    sign=SIGN_NAMES_BY_DEGREE[int(lon_b // 30) % 12]
+                )
+
+    def _default_bodies(self) -> List[str]:
+        """The engine's bodies that have an ephemeris of their own or follow one (South Node)."""
+        return [
+            name for name in self.engine.body_names
+            if name not in self.engine.chart_angles
+            and (PLANET_MAPPING_SWE.get(name) is not None or name == "South Node")
+        ]
+
+    def iter_events(self, start: datetime.datetime, end: datetime.datetime, bodies: Optional[Iterable[str]] = None, ingresses: bool = True, stations: bool = True) -> Iterator[Union[IngressEvent, StationEvent]]:
+        """
+        Stream sign ingresses and stations of several bodies, merged in time order.
+
+        Each body is scanned once for both kinds of events and only one pending
+        event per body is held in memory, so long calendars stream in flat memory.
+
+        Args:
+            start: Start of the search range (UTC)
+            end: End of the search range (UTC)
+            bodies: Body names (defaults to the engine's bodies without chart angles and Lilith)
+            ingresses: Include sign ingresses (longitude crossing a multiple of 30 degrees)
+            stations: Include stations (speed changing sign)
+
+        Yields:
+            IngressEvent and StationEvent records sorted by time
+        """
+        if end < start:
+            raise ValueError("end must not be before start")
+        bodies = self._default_bodies() if bodies is None else list(bodies)
+        for body in bodies:
+            self._motion(body)  # reject unsupported bodies before streaming
+        jd_start, jd_end = datetime_to_jd(start), datetime_to_jd(end)
+        # The South Node mirrors the True Node, so one scan serves both when both are asked for
+        mirror_nodes = "True Node" in bodies and "South Node" in bodies
+        streams = []
+        for body in bodies:
+            if mirror_nodes and body == "South Node":
+                continue
+            stream = self._iter_body_events(body, jd_start, jd_end, ingresses, stations, start.tzinfo)
+            if mirror_nodes and body == "True Node":
+                stream = _with_south_node(stream)
+            streams.append(stream)
+        return heapq.merge(*streams, key=lambda event: event.jd_ut)
+
+    def iter_ingresses(self, start: datetime.datetime, end: datetime.datetime, bodies: Optional[Iterable[str]] = None) -> Iterator[IngressEvent]:
+        """Stream the sign ingresses of several bodies in time order (see iter_events)."""
+        return self.iter_events(start, end, bodies, ingresses=True, stations=False)
+
+    def iter_stations(self, start: datetime.datetime, end: datetime.datetime, bodies: Optional[Iterable[str]] = None) -> Iterator[StationEvent]:
+        """Stream the retrograde and direct stations of several bodies in time order (see iter_events)."""
+        return self.iter_events(start, end, bodies, ingresses=False, stations=True)
+
+    def find_exact_aspects(self, body: str, target: Union[Body, float], aspect_type: str, start: datetime.datetime, end: datetime.datetime, target_name: str = "", step: Optional[float] = None) -> List[AspectEvent]:
+        """
+        Find the exact times a transiting body makes an aspect to a fixed longitude.
+
+        Args:
+            body: Transiting body name (e.g. "Saturn")
+            target: Natal Body or ecliptic longitude in degrees
+            aspect_type: Aspect name from ASPECT_DATA (e.g. "Square")
+            start: Start of the search range (UTC)
+            end: End of the search range (UTC)
+            target_name: Label for the target (defaults to the Body's name)
+            step: Coarse scan step in days (defaults to COARSE_STEP_DAYS for the body)
+
+        Returns:
+            List of AspectEvent, sorted by time; retrograde loops give one event per pass
+        """
+        if aspect_type not in ASPECT_DATA:
+            raise ValueError(f"Unknown aspect type: {aspect_type}")
+        if end < start:
+            raise ValueError("end must not be before start")
+        if isinstance(target, Body):
+            target_name = target_name or target.name
+            target = target.longitude
+        step = step if step is not None else COARSE_STEP_DAYS.get(body, DEFAULT_COARSE_STEP)
+        if step <= 0:
+            raise ValueError(f"step must be positive, got {step}")
+
+        angle = ASPECT_DATA[aspect_type]["angle"]
+        # Both sides of the target, e.g. the waxing and the waning square
+        targets = sorted({(target + angle) % 360.0, (target - angle) % 360.0})
+        tzinfo = start.tzinfo
+        return [
+            AspectEvent(
+                body=body, target=target_name, aspect_type=aspect_type,
+                symbol=ASPECT_DATA[aspect_type]["symbol"],
+                dt_utc=jd_to_datetime(jd, tzinfo), jd_ut=jd, longitude=lon,
+                target_longitude=target, is_retrograde=speed < 0
+            )
+            for jd, _, lon, speed in self._crossings(
+                self._motion(body), targets, datetime_to_jd(start), datetime_to_jd(end), step,
+                MAX_ACCELERATION.get(body)
+            )
+        ]
+
+    def find_exact_aspects_to_chart(self, body: str, natal_bodies: Iterable[Body], aspect_types: Iterable[str], start: datetime.datetime, end: datetime.datetime) -> List[AspectEvent]:
+        """
+        Find the exact aspects of a transiting body to several natal bodies.
+
+        Returns:
+            List of AspectEvent for every natal body and aspect type, sorted by time
+        """
+        aspect_types = list(aspect_types)
+        for aspect_type in aspect_types:
+            if aspect_type not in ASPECT_DATA:
+                raise ValueError(f"Unknown aspect type: {aspect_type}")
+        if end < start:
+            raise ValueError("end must not be before start")
+        # One scan for every natal body and aspect: (natal body, aspect type) pairs by target longitude
+        labels = {}
+        for natal_body in natal_bodies:
+            for aspect_type in aspect_types:
+                angle = ASPECT_DATA[aspect_type]["angle"]
+                for target in sorted({(natal_body.longitude + angle) % 360.0, (natal_body.longitude - angle) % 360.0}):
+                    labels.setdefault(target, []).append((natal_body, aspect_type))
+        tzinfo = start.tzinfo
+        return [
+            AspectEvent(
+                body=body, target=natal_body.name, aspect_type=aspect_type,
+                symbol=ASPECT_DATA[aspect_type]["symbol"],
+                dt_utc=jd_to_datetime(jd, tzinfo), jd_ut=jd, longitude=lon,
+                target_longitude=natal_body.longitude, is_retrograde=speed < 0
+            )
+            for jd, target, lon, speed in self._crossings(
+                self._motion(body), list(labels), datetime_to_jd(start), datetime_to_jd(end),
+                COARSE_STEP_DAYS.get(body, DEFAULT_COARSE_STEP), MAX_ACCELERATION.get(body)
+            )
+            for natal_body, aspect_type in labels[target]
+        ]
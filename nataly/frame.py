@@ -0,0 +1,304 @@
+# nataly/frame.py
+# Columnar representation of many charts for population analytics.
+
+import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .aspects import np
+from .chart import NatalChart
+from .constants import (
+    ALL_BODY_NAMES, DIGNITY_RULES, SIGNS, SIGN_NAMES_BY_DEGREE,
+    ELEMENTS, MODALITIES, POLARITIES, ASTROLOGICAL_BODY_GROUPS
+)
+from .engine import AstroEngine
+from .models import BodyFilter, BODY_TYPE_FILTER_FLAGS
+
+# Dignity codes of the dignities column; 0 is no dignity
+DIGNITY_CODES = ("",) + tuple(DIGNITY_RULES)
+
+# Category of each sign index, in SIGN_NAMES_BY_DEGREE order
+SIGN_ELEMENTS = tuple(SIGNS[name]["element"] for name in SIGN_NAMES_BY_DEGREE)
+SIGN_MODALITIES = tuple(SIGNS[name]["modality"] for name in SIGN_NAMES_BY_DEGREE)
+SIGN_POLARITIES = tuple(SIGNS[name]["polarity"] for name in SIGN_NAMES_BY_DEGREE)
+
+# Houses of each quadrant and hemisphere, as NatalChart distributions count them
+QUADRANT_HOUSES = {
+    '1st ◵': (1, 2, 3), '2nd ◶': (4, 5, 6),
+    '3rd ◷': (7, 8, 9), '4th ◴': (10, 11, 12),
+}
+HEMISPHERE_HOUSES = {
+    'East ←': (1, 2, 3, 10, 11, 12), 'West →': (4, 5, 6, 7, 8, 9),
+    'North ↓': (1, 2, 3, 4, 5, 6), 'South ↑': (7, 8, 9, 10, 11, 12),
+}
+
+
+class ChartFrame:
+    """
+    Many charts as columns: one row per chart, one column per body.
+
+    longitudes, speeds, latitudes and declinations are float arrays of shape
+    (charts, bodies); signs (index into SIGN_NAMES_BY_DEGREE), houses (1-12) and
+    dignities (index into DIGNITY_CODES) are integer arrays of the same shape,
+    derived with array operations from the longitudes and the (charts, 12)
+    cusps array. A body missing from a chart has NaN positions, sign -1 and
+    house 0. Rows become NatalChart objects only when they are read.
+    """
+
+    def __init__(self, names: Sequence[str], datetimes: Sequence[datetime.datetime], chart_latitudes, chart_longitudes, body_names: Sequence[str], longitudes, speeds, latitudes, declinations, cusps, obliquities, engine: AstroEngine):
+        """
+        Build a frame from position arrays (see from_records and from_charts).
+
+        Args:
+            names: Person name of each chart
+            datetimes: Date and time of each chart (UTC)
+            chart_latitudes: Latitude of each chart's location
+            chart_longitudes: Longitude of each chart's location
+            body_names: Column names
+            longitudes: Ecliptic longitudes, shape (charts, bodies)
+            speeds: Longitude speeds in degrees per day, shape (charts, bodies)
+            latitudes: Ecliptic latitudes, shape (charts, bodies)
+            declinations: Declinations, shape (charts, bodies)
+            cusps: House cusp longitudes, shape (charts, 12)
+            obliquities: Mean obliquity of each chart, used for cusp declinations
+            engine: AstroEngine the rows are turned into charts with
+        """
+        if np is None:
+            raise ImportError("NumPy is required for ChartFrame (pip install numpy)")
+        self.names = list(names)
+        self.datetimes = list(datetimes)
+        self.chart_latitudes = np.asarray(chart_latitudes, dtype=float)
+        self.chart_longitudes = np.asarray(chart_longitudes, dtype=float)
+        self.body_names = list(body_names)
+        self.engine = engine
+        shape = (len(self.names), len(self.body_names))
+        self.longitudes = np.asarray(longitudes, dtype=float).reshape(shape)
+        self.speeds = np.asarray(speeds, dtype=float).reshape(shape)
+        self.latitudes = np.asarray(latitudes, dtype=float).reshape(shape)
+        self.declinations = np.asarray(declinations, dtype=float).reshape(shape)
+        self.cusps = np.asarray(cusps, dtype=float).reshape(len(self.names), 12)
+        self.obliquities = np.asarray(obliquities, dtype=float)
+
+        self.body_types = [engine._get_body_type(name) for name in self.body_names]
+        self._column = {name: i for i, name in enumerate(self.body_names)}
+        valid = ~np.isnan(self.longitudes)
+        self.signs = np.where(valid, np.floor(np.where(valid, self.longitudes, 0.0) / 30), -1).astype(np.int8)
+        self.houses = self._place_in_houses(valid)
+        # Dignity code of each body in each sign, looked up per cell; the extra
+        # last column is the no-dignity code read through sign -1 of missing bodies
+        dignity_table = np.array([
+            [DIGNITY_CODES.index(engine._get_dignity(name, sign)) for sign in SIGN_NAMES_BY_DEGREE] + [0]
+            for name in self.body_names
+        ], dtype=np.int8).reshape(len(self.body_names), 13)
+        self.dignities = dignity_table[np.arange(len(self.body_names))[None, :], self.signs]
+
+    def _place_in_houses(self, valid):
+        """House of every cell, as AstroEngine._get_house_from_longitude gives it."""
+        ac_longitudes = self.cusps[:, :1]
+        starts = (self.cusps - ac_longitudes + 360) % 360
+        offsets = (np.where(valid, self.longitudes, 0.0) - ac_longitudes + 360) % 360
+        # Cusps in zodiacal order from the AC: count the cusps at or before each body
+        houses = (offsets[:, :, None] >= starts[:, None, :]).sum(axis=2)
+        for row in np.flatnonzero(~np.all(np.diff(starts, axis=1) > 0, axis=1)):
+            cusps = self.cusps[row].tolist()
+            houses[row] = [self.engine._get_house_from_longitude(lon, cusps) for lon in self.longitudes[row].tolist()]
+        return np.where(valid, houses, 0).astype(np.int8)
+
+    @classmethod
+    def from_records(cls, records: Iterable[tuple], orb_config=None, ephe_path: str = './nataly/ephe', engine: Optional[AstroEngine] = None, bodies: Optional[Iterable[str]] = None) -> 'ChartFrame':
+        """
+        Calculate many charts straight into columns, without building Body or House objects.
+
+        Args:
+            records: Iterable of (person_name, dt_utc, lat, lon) records
+            orb_config: OrbConfig object or dict for orb settings
+            ephe_path: Path to ephemeris files
+            engine: Existing AstroEngine to reuse, e.g. a ParallelAstroEngine
+                    (orb_config, ephe_path and bodies are then ignored)
+            bodies: Body names and/or ASTROLOGICAL_BODY_GROUPS keys to calculate
+        """
+        if engine is None:
+            engine = AstroEngine(orb_config, ephe_path, bodies=bodies)
+        records = list(records)
+        raw = engine.compute_raw_batch([(dt_utc, lat, lon) for _, dt_utc, lat, lon in records])
+        body_names = engine.body_names
+        columns = np.full((4, len(records), len(body_names)), np.nan)
+        for row, (positions, _, _) in enumerate(raw):
+            for col, name in enumerate(body_names):
+                position = positions.get(name)
+                if position is not None:
+                    columns[:, row, col] = position
+        return cls(
+            [r[0] for r in records], [r[1] for r in records], [r[2] for r in records], [r[3] for r in records],
+            body_names, *columns,
+            cusps=[house_cusps for _, house_cusps, _ in raw], obliquities=[obliquity for _, _, obliquity in raw],
+            engine=engine
+        )
+
+    @classmethod
+    def from_charts(cls, charts: Sequence[NatalChart], engine: Optional[AstroEngine] = None) -> 'ChartFrame':
+        """
+        Convert NatalChart objects into a frame.
+
+        Args:
+            charts: Charts to convert; the columns are every body found in any of them
+            engine: AstroEngine for the rows (defaults to the first chart's)
+        """
+        charts = list(charts)
+        if engine is None:
+            if not charts:
+                raise ValueError("engine is required for an empty list of charts")
+            engine = charts[0].engine
+        present = {name for chart in charts for name in chart.bodies_dict}
+        body_names = [name for name in ALL_BODY_NAMES if name in present]
+        columns = np.full((4, len(charts), len(body_names)), np.nan)
+        for row, chart in enumerate(charts):
+            for col, name in enumerate(body_names):
+                body = chart.bodies_dict.get(name)
+                if body is not None:
+                    columns[:, row, col] = (body.longitude, body.speed, body.latitude, body.declination)
+        return cls(
+            [c.name for c in charts], [c.datetime_utc for c in charts],
+            [c.latitude for c in charts], [c.longitude for c in charts],
+            body_names, *columns,
+            cusps=[[house.cusp_longitude for house in c.houses] for c in charts],
+            obliquities=[engine._get_context(c.datetime_utc).mean_obliquity for c in charts],
+            engine=engine
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> NatalChart:
+        return self.chart(index)
+
+    def __iter__(self) -> Iterator[NatalChart]:
+        return (self.chart(index) for index in range(len(self)))
+
+    def column(self, body_name: str) -> int:
+        """Column index of a body."""
+        if body_name not in self._column:
+            raise ValueError(f"Body '{body_name}' is not a column of the frame")
+        return self._column[body_name]
+
+    @property
+    def is_retrograde(self):
+        """Retrograde flags, shape (charts, bodies); chart angles are never retrograde."""
+        angles = np.array([name in ASTROLOGICAL_BODY_GROUPS["chart_angles"] for name in self.body_names], dtype=bool)
+        return (self.speeds < 0) & ~angles[None, :]
+
+    def chart(self, index: int) -> NatalChart:
+        """Build the NatalChart of one row, equal to the chart calculated for its record."""
+        positions = {
+            name: (lon, speed, lat, decl)
+            for name, lon, speed, lat, decl in zip(
+                self.body_names, self.longitudes[index].tolist(), self.speeds[index].tolist(),
+                self.latitudes[index].tolist(), self.declinations[index].tolist()
+            )
+            if lon == lon
+        }
+        bodies_dict, houses = self.engine._build_bodies_and_houses(positions, self.cusps[index].tolist(), float(self.obliquities[index]))
+        chart = NatalChart.__new__(NatalChart)
+        chart._populate(
+            self.names[index], self.datetimes[index], float(self.chart_latitudes[index]), float(self.chart_longitudes[index]),
+            self.engine, bodies_dict, houses
+        )
+        return chart
+
+    def to_charts(self) -> List[NatalChart]:
+        """Build the NatalChart of every row."""
+        return list(self)
+
+    def mask(self, filter_config: Optional[Union[BodyFilter, Dict[str, Any]]] = None):
+        """
+        Cells matching a body filter, the array form of NatalChart.get_bodies.
+
+        Args:
+            filter_config: BodyFilter object or dict with filter parameters
+
+        Returns:
+            Boolean array of shape (charts, bodies)
+        """
+        present = ~np.isnan(self.longitudes)
+        if filter_config is None:
+            return present
+        if isinstance(filter_config, dict):
+            filter_config = BodyFilter(**filter_config)
+        f = filter_config
+        columns = np.array([
+            getattr(f, BODY_TYPE_FILTER_FLAGS[body_type], True) if body_type in BODY_TYPE_FILTER_FLAGS else True
+            for body_type in self.body_types
+        ], dtype=bool)
+        if f.include_bodies:
+            columns &= np.isin(self.body_names, f.include_bodies)
+        if f.exclude_bodies:
+            columns &= ~np.isin(self.body_names, f.exclude_bodies)
+        mask = present & columns[None, :]
+
+        def sign_indexes(values, categories):
+            return [i for i, category in enumerate(categories) if category in values]
+
+        for include, exclude, categories in (
+            (f.include_signs, f.exclude_signs, SIGN_NAMES_BY_DEGREE),
+            (f.include_elements, f.exclude_elements, SIGN_ELEMENTS),
+            (f.include_modalities, f.exclude_modalities, SIGN_MODALITIES),
+        ):
+            if include:
+                mask &= np.isin(self.signs, sign_indexes(include, categories))
+            if exclude:
+                mask &= ~np.isin(self.signs, sign_indexes(exclude, categories))
+        if f.include_houses:
+            mask &= np.isin(self.houses, f.include_houses)
+        if f.exclude_houses:
+            mask &= ~np.isin(self.houses, f.exclude_houses)
+        if f.include_dignities:
+            mask &= np.isin(self.dignities, [DIGNITY_CODES.index(d) for d in f.include_dignities if d in DIGNITY_CODES])
+        if f.exclude_dignities:
+            mask &= ~np.isin(self.dignities, [DIGNITY_CODES.index(d) for d in f.exclude_dignities if d in DIGNITY_CODES])
+        if f.include_retrograde is not None:
+            mask &= self.is_retrograde == f.include_retrograde
+        return mask
+
+    def count(self, filter_config: Optional[Union[BodyFilter, Dict[str, Any]]] = None):
+        """Number of bodies matching a body filter in each chart, shape (charts,)."""
+        return self.mask(filter_config).sum(axis=1)
+
+    def _distribution_weights(self, with_ascendant: bool):
+        """Weight of each column in NatalChart distributions, where the AC is counted a second time."""
+        weights = np.ones(len(self.body_names), dtype=np.int64)
+        if with_ascendant and "AC" in self._column:
+            weights[self._column["AC"]] += 1
+        return weights
+
+    def distribution(self, kind: str) -> Dict[str, Any]:
+        """
+        Counts of a NatalChart distribution for every chart.
+
+        Args:
+            kind: "element", "modality", "polarity", "quadrant" or "hemisphere"
+
+        Returns:
+            {category: counts of shape (charts,)}, with the counts of
+            chart.<kind>_distribution[category]['count'] (0 where a chart has none)
+        """
+        if kind in ("element", "modality", "polarity"):
+            categories = {"element": SIGN_ELEMENTS, "modality": SIGN_MODALITIES, "polarity": SIGN_POLARITIES}[kind]
+            names = {"element": ELEMENTS, "modality": MODALITIES, "polarity": POLARITIES}[kind]
+            weights = self._distribution_weights(True)[None, :]
+            return {
+                name: ((np.isin(self.signs, [i for i, c in enumerate(categories) if c == name])) * weights).sum(axis=1)
+                for name in names
+            }
+        if kind in ("quadrant", "hemisphere"):
+            groups = QUADRANT_HOUSES if kind == "quadrant" else HEMISPHERE_HOUSES
+            not_angles = np.array([name not in ASTROLOGICAL_BODY_GROUPS["chart_angles"] for name in self.body_names], dtype=bool)
+            present = ~np.isnan(self.longitudes) & not_angles[None, :]
+            return {name: (np.isin(self.houses, houses) & present).sum(axis=1) for name, houses in groups.items()}
+        raise ValueError(f"Unknown distribution: '{kind}'. Valid kinds are: element, modality, polarity, quadrant, hemisphere")
+
+    def element_modality_counts(self):
+        """Counts of NatalChart.element_modality_matrix, shape (charts, elements, modalities) in ELEMENTS and MODALITIES order."""
+        counts = np.zeros((len(self), len(ELEMENTS), len(MODALITIES)), dtype=np.int64)
+        for sign_index in range(12):
+            e, m = ELEMENTS.index(SIGN_ELEMENTS[sign_index]), MODALITIES.index(SIGN_MODALITIES[sign_index])
+            counts[:, e, m] += (self.signs == sign_index).sum(axis=1)
+        return counts
@@ -0,0 +1,208 @@
+# nataly/live.py
+# Incrementally updated chart for animations and live sky displays.
+
+import copy
+import datetime
+import math
+from bisect import bisect_right
+from typing import List, Tuple
+
+from .chart import NatalChart
+from .models import Aspect, ChartDiff, get_sign
+from .constants import SIGN_NAMES_BY_DEGREE
+
+# Margin kept from an orb window edge, so rounding in the orb test cannot change the outcome unseen
+EDGE_MARGIN = 1e-9
+
+
+class LiveChart(NatalChart):
+    """
+    NatalChart that is moved forward in time in place.
+
+    advance() recalculates the positions and house cusps and updates the
+    existing Body, House and Aspect objects instead of building new ones. A
+    body keeps its Sign object, dignity and house until it crosses a
+    boundary. Each body pair remembers the range of separations in which its
+    aspect (or the absence of one) cannot change, bounded by the nearest orb
+    window edges; only pairs leaving that range are matched against the orb
+    table again. Distributions are recalculated only after a sign or house
+    change, on their next access. After any number of steps the chart equals a NatalChart built for
+    the same instant.
+    """
+
+    def _populate(self, *args, **kwargs):
+        super()._populate(*args, **kwargs)
+        self._reset_state()
+
+    def with_orbs(self, orb_config) -> 'LiveChart':
+        """
+        Creates the same chart under another orb configuration (see NatalChart.with_orbs).
+
+        advance() moves bodies and houses in place, so the new chart gets copies
+        of its own and either chart can be advanced without the other going stale.
+        The pair distances are still reused.
+        """
+        engine = self.engine.with_orb_config(orb_config)
+        distances = self.pair_distances
+        bodies_dict = {name: copy.copy(body) for name, body in self.bodies_dict.items()}
+        houses = []
+        for house in self.houses:
+            house = copy.copy(house)
+            if house.classic_ruler is not None:
+                house.classic_ruler = bodies_dict[house.classic_ruler.name]
+            if house.modern_ruler is not None:
+                house.modern_ruler = bodies_dict[house.modern_ruler.name]
+            houses.append(house)
+        chart = type(self).__new__(type(self))
+        chart._populate(
+            self.name, self.datetime_utc, self.latitude, self.longitude, engine, bodies_dict, houses,
+            engine.get_aspects_from_distances(bodies_dict, distances)
+        )
+        chart._pair_distances = distances
+        return chart
+
+    def _reset_state(self):
+        """Index the pairs of bodies and the sign and house of every body."""
+        table = self.engine.aspect_table
+        items = list(self.bodies_dict.values())
+        self._items = items
+        self._aspect_angles = dict(zip(table.aspect_names, table.aspect_angles))
+        self._sign_indexes = [int(body.longitude / 30) for body in items]
+        index = {name: i for i, name in enumerate(self.bodies_dict)}
+        current = {(index[a.body1.name], index[a.body2.name]): a for a in self.aspects}
+        table_indexes = [table.index_of(body.name) for body in items]
+        breakpoints = {}
+        self._pairs = []
+        for i in range(len(items)):
+            for j in range(i + 1, len(items)):
+                orbs = table.orbs[table_indexes[i]][table_indexes[j]]
+                edges = breakpoints.get(orbs)
+                if edges is None:
+                    edges = breakpoints[orbs] = self._orb_edges(orbs)
+                # [i, j, candidate buckets, window edges, low, high, aspect]
+                pair = [i, j, table.candidates[table_indexes[i]][table_indexes[j]], edges, 0.0, 0.0, current.get((i, j))]
+                self._set_bounds(pair, self._separation(i, j))
+                self._pairs.append(pair)
+
+    def _orb_edges(self, orbs: Tuple[float, ...]) -> List[float]:
+        """Separations (0-180) where an aspect of a pair with these orbs starts or stops."""
+        edges = set()
+        for angle, orb in zip(self.engine.aspect_table.aspect_angles, orbs):
+            if orb >= 0:
+                edges.update(edge for edge in (angle - orb, angle + orb) if 0.0 <= edge <= 180.0)
+        return sorted(edges)
+
+    def _separation(self, i: int, j: int) -> float:
+        diff = abs(self._items[i].longitude - self._items[j].longitude)
+        return min(diff, 360 - diff)
+
+    @staticmethod
+    def _set_bounds(pair: list, separation: float):
+        """Store the open range of separations around separation with no window edge inside."""
+        edges = pair[3]
+        k = bisect_right(edges, separation)
+        pair[4] = edges[k - 1] + EDGE_MARGIN if k > 0 else float("-inf")
+        pair[5] = edges[k] - EDGE_MARGIN if k < len(edges) else float("inf")
+
+    def advance(self, dt_utc: datetime.datetime) -> ChartDiff:
+        """
+        Move the chart to another instant.
+
+        Args:
+            dt_utc: New date and time in UTC (earlier or later)
+
+        Returns:
+            ChartDiff with the aspects that formed and dissolved and the bodies
+            that changed sign or house. Aspects that continue keep their objects,
+            with the orb updated.
+        """
+        engine = self.engine
+        positions, house_cusps, obliquity = engine._calculate_raw_positions(
+            dt_utc, self.latitude, self.longitude, None, list(self.bodies_dict)
+        )
+        if len(positions) != len(self._items):
+            missing = [name for name in self.bodies_dict if name not in positions]
+            raise ValueError(f"No positions for {missing} at {dt_utc}")
+        self.datetime_utc = dt_utc
+        # Retrograde flags can change without a sign or house change
+        self._pair_distances = self._body_index = None
+
+        sign_changes, house_changes = [], []
+        for i, body in enumerate(self._items):
+            lon_val, speed, lat_val, decl_val = positions[body.name]
+            body.longitude, body.speed = lon_val, speed
+            body.latitude, body.declination = lat_val, decl_val
+            body.is_retrograde = speed < 0 and body.name not in self.chart_angles
+            sign_index = int(lon_val / 30)
+            if sign_index != self._sign_indexes[i]:
+                self._sign_indexes[i] = sign_index
+                previous = body.sign.name
+                body.sign = get_sign(SIGN_NAMES_BY_DEGREE[sign_index])
+                body.dignity = engine._get_dignity(body.name, body.sign.name)
+                sign_changes.append((body.name, previous, body.sign.name))
+
+        house_numbers = engine._get_houses_from_longitudes([body.longitude for body in self._items], house_cusps)
+        for body, house in zip(self._items, house_numbers):
+            if house != body.house:
+                house_changes.append((body.name, body.house, house))
+                body.house = house
+        self._update_houses(house_cusps, obliquity)
+
+        entered, left = self._update_aspects()
+        if entered or left:
+            self.aspects = [pair[6] for pair in self._pairs if pair[6] is not None]
+        if sign_changes or house_changes:
+            self._reset_analyses()
+        return ChartDiff(dt_utc, entered, left, sign_changes, house_changes)
+
+    def _update_houses(self, house_cusps: List[float], obliquity: float):
+        """Move the house cusps, changing signs and rulers only where a cusp changed sign."""
+        for house, cusp_lon in zip(self.houses, house_cusps):
+            if int(cusp_lon / 30) != int(house.cusp_longitude / 30):
+                sign = self.engine._get_sign_from_longitude(cusp_lon)
+                house.sign = sign
+                house.classic_ruler = self.bodies_dict.get(sign.classic_ruler)
+                house.modern_ruler = self.bodies_dict.get(sign.modern_ruler) if sign.modern_ruler else None
+            house.cusp_longitude = cusp_lon
+            house.declination = obliquity * math.sin(math.radians(cusp_lon))
+            house.classic_ruler_house = house.classic_ruler.house if house.classic_ruler else None
+            house.modern_ruler_house = house.modern_ruler.house if house.modern_ruler else None
+
+    def _update_aspects(self) -> Tuple[List[Aspect], List[Aspect]]:
+        """Update the orbs of continuing aspects and match the pairs that left their range."""
+        table = self.engine.aspect_table
+        items = self._items
+        longitudes = [body.longitude for body in items]
+        aspect_angles = self._aspect_angles
+        entered, left = [], []
+        for pair in self._pairs:
+            i, j, buckets, _, low, high, aspect = pair
+            diff = abs(longitudes[i] - longitudes[j])
+            separation = 360 - diff if diff > 180 else diff
+            if low < separation < high:
+                if aspect is not None:
+                    orb_diff = separation - aspect_angles[aspect.aspect_type]
+                    aspect.orb, aspect.is_applying = orb_diff, orb_diff < 0
+                continue
+            found = None
+            for k, angle, orb_limit in buckets[int(separation)]:
+                orb_diff = separation - angle
+                if abs(orb_diff) <= orb_limit:
+                    found = (k, orb_diff)
+                    break
+            self._set_bounds(pair, separation)
+            if aspect is not None and found is not None and table.aspect_names[found[0]] == aspect.aspect_type:
+                aspect.orb, aspect.is_applying = found[1], found[1] < 0
+                continue
+            if aspect is not None:
+                left.append(aspect)
+            pair[6] = None
+            if found is not None:
+                k, orb_diff = found
+                pair[6] = Aspect(
+                    body1=items[i], body2=items[j],
+                    aspect_type=table.aspect_names[k], symbol=table.aspect_symbols[k],
+                    orb=orb_diff, is_applying=orb_diff < 0
+                )
+                entered.append(pair[6])
+        return entered, left
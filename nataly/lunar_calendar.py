@@ -0,0 +1,275 @@
+# nataly/lunar_calendar.py
+# Lunation, eclipse and void-of-course Moon calendar.
+
+import datetime
+import heapq
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import swisseph as swe
+
+from .constants import ASPECT_DATA, ORB_ASPECT_GROUPS, SIGN_NAMES_BY_DEGREE
+from .context import datetime_to_jd, jd_to_datetime
+from .engine import AstroEngine
+from .events import EventFinder, TIME_TOLERANCE, _signed_difference
+from .models import LunationEvent, EclipseEvent, VoidOfCourseEvent
+
+# Moon - Sun elongation of each phase, in degrees
+LUNATION_PHASES = {"New Moon": 0.0, "First Quarter": 90.0, "Full Moon": 180.0, "Last Quarter": 270.0}
+
+# Scan step for the elongation, which grows by at most ~15 degrees a day
+LUNATION_STEP_DAYS = 5.0
+
+# Bodies and aspects that end a void-of-course Moon (Ptolemaic aspects to the planets)
+VOID_OF_COURSE_BODIES = ["Sun", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
+VOID_OF_COURSE_ASPECTS = ORB_ASPECT_GROUPS["major"] + ORB_ASPECT_GROUPS["sextile"]
+
+# The Moon never stays longer than this in a sign (days)
+MAX_SIGN_DAYS = 3.0
+
+# Largest error of a last-aspect time extrapolated linearly from the ingress (days)
+VOID_ESTIMATE_MARGIN = 0.5
+
+CalendarEvent = Union[LunationEvent, EclipseEvent, VoidOfCourseEvent]
+
+
+def _eclipse_type(retflag: int) -> str:
+    if retflag & swe.ECL_ANNULAR_TOTAL == swe.ECL_ANNULAR_TOTAL:
+        return "hybrid"
+    if retflag & swe.ECL_TOTAL:
+        return "total"
+    if retflag & swe.ECL_ANNULAR:
+        return "annular"
+    if retflag & swe.ECL_PARTIAL:
+        return "partial"
+    return "penumbral"
+
+
+class LunarCalendar:
+    """
+    Calendar of Moon phases, eclipses and void-of-course Moon periods.
+
+    Every instant is solved rather than sampled: lunations are crossings of the
+    Moon - Sun elongation found with EventFinder's scan and Newton refinement,
+    eclipse maxima come from the Swiss Ephemeris eclipse search, and each
+    void-of-course period runs from the Moon's last exact aspect in a sign,
+    solved backwards from the next ingress, to that ingress.
+    """
+
+    def __init__(self, engine: Optional[AstroEngine] = None, ephe_path: str = './nataly/ephe'):
+        """
+        Initialize the calendar.
+
+        Args:
+            engine: AstroEngine providing the ephemeris path and cache
+            ephe_path: Path to ephemeris files, when no engine is given
+        """
+        self.events = EventFinder(engine, ephe_path)
+        self.engine = self.events.engine
+
+    @staticmethod
+    def _range(start: datetime.datetime, end: datetime.datetime) -> Tuple[float, float]:
+        if end < start:
+            raise ValueError("end must not be before start")
+        return datetime_to_jd(start), datetime_to_jd(end)
+
+    def _elongation(self) -> Callable[[float], Tuple[float, float]]:
+        """Return a function of the Julian day giving the Moon - Sun (elongation, speed)."""
+        moon, sun = self.events._motion("Moon"), self.events._motion("Sun")
+
+        def elongation(jd: float) -> Tuple[float, float]:
+            moon_lon, moon_speed = moon(jd)
+            sun_lon, sun_speed = sun(jd)
+            return (moon_lon - sun_lon) % 360.0, moon_speed - sun_speed
+        return elongation
+
+    def iter_lunations(self, start: datetime.datetime, end: datetime.datetime, phases: Iterable[str] = ("New Moon", "Full Moon")) -> Iterator[LunationEvent]:
+        """
+        Stream the exact Moon phases within a date range.
+
+        Args:
+            start: Start of the range (UTC)
+            end: End of the range (UTC)
+            phases: Phase names from LUNATION_PHASES
+
+        Yields:
+            LunationEvent records sorted by time
+        """
+        phases = list(phases)
+        for phase in phases:
+            if phase not in LUNATION_PHASES:
+                raise ValueError(f"Unknown lunation phase: {phase}")
+        jd_start, jd_end = self._range(start, end)
+        targets = [LUNATION_PHASES[phase] for phase in phases]
+        elongation = self._elongation()
+        moon = self.events._motion("Moon")
+        for a, lon_a, b, lon_b, _ in self.events._scan(elongation, jd_start, jd_end, LUNATION_STEP_DAYS):
+            # A step covers less than 90 degrees of elongation, so at most one phase
+            for phase, target in zip(phases, targets):
+                jd = self.events._crossing(elongation, target, a, lon_a, b, lon_b)
+                if jd is None:
+                    continue
+                lon, _ = moon(jd)
+                yield LunationEvent(
+                    phase=phase, dt_utc=jd_to_datetime(jd, start.tzinfo), jd_ut=jd,
+                    longitude=lon, sign=SIGN_NAMES_BY_DEGREE[int(lon // 30) % 12]
+                )
+
+    def _iter_eclipse_kind(self, kind: str, jd_start: float, jd_end: float, tzinfo) -> Iterator[EclipseEvent]:
+        search = swe.sol_eclipse_when_glob if kind == "solar" else swe.lun_eclipse_when
+        motion = self.events._motion("Sun" if kind == "solar" else "Moon")
+        jd = jd_start
+        while True:
+            retflag, tret = search(jd, swe.FLG_SWIEPH, 0, False)
+            maximum = tret[0]
+            if maximum > jd_end:
+                return
+            if maximum >= jd_start:
+                lon, _ = motion(maximum)
+                yield EclipseEvent(
+                    eclipse_kind=kind, eclipse_type=_eclipse_type(retflag),
+                    dt_utc=jd_to_datetime(maximum, tzinfo), jd_ut=maximum,
+                    longitude=lon, sign=SIGN_NAMES_BY_DEGREE[int(lon // 30) % 12]
+                )
+            jd = maximum + 1.0
+
+    def iter_eclipses(self, start: datetime.datetime, end: datetime.datetime, kinds: Iterable[str] = ("solar", "lunar")) -> Iterator[EclipseEvent]:
+        """
+        Stream the solar and/or lunar eclipses within a date range.
+
+        Args:
+            start: Start of the range (UTC)
+            end: End of the range (UTC)
+            kinds: "solar" and/or "lunar"
+
+        Yields:
+            EclipseEvent records at the eclipse maximum, sorted by time
+        """
+        kinds = list(kinds)
+        for kind in kinds:
+            if kind not in ("solar", "lunar"):
+                raise ValueError(f"Unknown eclipse kind: {kind}")
+        jd_start, jd_end = self._range(start, end)
+        streams = [self._iter_eclipse_kind(kind, jd_start, jd_end, start.tzinfo) for kind in kinds]
+        return heapq.merge(*streams, key=lambda event: event.jd_ut)
+
+    @staticmethod
+    def _exact_aspect(moon: Callable, motion: Callable, angle: float, guess: float) -> float:
+        """Newton iteration on the Moon - body separation, from a guess near the aspect."""
+        jd = guess
+        for _ in range(50):
+            moon_lon, moon_speed = moon(jd)
+            lon, speed = motion(jd)
+            step = _signed_difference(moon_lon - lon - angle) / (moon_speed - speed)
+            jd -= step
+            if abs(step) < TIME_TOLERANCE:
+                return jd
+        raise RuntimeError(f"Moon aspect did not converge near Julian day {guess}")
+
+    def _last_aspect(self, moon: Callable, motions: Dict[str, Callable], targets: List[Tuple[float, str]], jd_in: float, jd_out: float) -> Optional[Tuple[float, str, str]]:
+        """
+        Find the Moon's last exact aspect between its ingress at jd_in and the next one at jd_out.
+
+        The Moon is faster than every planet, so its separation from each of them
+        grows monotonically: the last aspect angle passed before jd_out is known
+        from the separation at jd_out, and its time is extrapolated linearly.
+        Only the bodies whose estimate can be the latest are solved exactly.
+        """
+        moon_lon, moon_speed = moon(jd_out)
+        candidates = []
+        for body, motion in motions.items():
+            lon, speed = motion(jd_out)
+            separation = (moon_lon - lon) % 360.0
+            back, angle, aspect_type = min(((separation - angle) % 360.0, angle, aspect_type) for angle, aspect_type in targets)
+            estimate = jd_out - back / (moon_speed - speed)
+            if estimate >= jd_in - VOID_ESTIMATE_MARGIN:
+                candidates.append((estimate, body, angle, aspect_type))
+        candidates.sort(reverse=True)
+        best = None
+        for estimate, body, angle, aspect_type in candidates:
+            if best is not None and estimate < best[0] - VOID_ESTIMATE_MARGIN:
+                break
+            jd = min(self._exact_aspect(moon, motions[body], angle, estimate), jd_out)
+            if jd >= jd_in and (best is None or jd > best[0]):
+                best = (jd, body, aspect_type)
+        return best
+
+    def iter_void_of_course(self, start: datetime.datetime, end: datetime.datetime, bodies: Optional[Iterable[str]] = None, aspect_types: Optional[Iterable[str]] = None) -> Iterator[VoidOfCourseEvent]:
+        """
+        Stream the void-of-course Moon periods overlapping a date range.
+
+        A period starts at the Moon's last exact aspect to one of the bodies while
+        in a sign (at its ingress when it makes none) and ends at its next ingress.
+
+        Args:
+            start: Start of the range (UTC)
+            end: End of the range (UTC)
+            bodies: Aspected bodies (defaults to VOID_OF_COURSE_BODIES)
+            aspect_types: Aspect names from ASPECT_DATA (defaults to VOID_OF_COURSE_ASPECTS)
+
+        Yields:
+            VoidOfCourseEvent records sorted by start time
+        """
+        bodies = list(VOID_OF_COURSE_BODIES if bodies is None else bodies)
+        aspect_types = list(VOID_OF_COURSE_ASPECTS if aspect_types is None else aspect_types)
+        if "Moon" in bodies:
+            raise ValueError("The Moon cannot be one of the aspected bodies")
+        for aspect_type in aspect_types:
+            if aspect_type not in ASPECT_DATA:
+                raise ValueError(f"Unknown aspect type: {aspect_type}")
+        jd_start, jd_end = self._range(start, end)
+        moon = self.events._motion("Moon")
+        motions = {body: self.events._motion(body) for body in bodies}
+        # Both sides of each aspect, e.g. the waxing and the waning square
+        targets = sorted({
+            ((side * ASPECT_DATA[aspect_type]["angle"]) % 360.0, aspect_type)
+            for aspect_type in aspect_types for side in (1, -1)
+        })
+        return self._iter_void_periods(moon, motions, targets, jd_start, jd_end, start.tzinfo)
+
+    def _iter_void_periods(self, moon, motions, targets, jd_start, jd_end, tzinfo) -> Iterator[VoidOfCourseEvent]:
+        previous = None
+        # Ingresses a sign before and after the range bound the periods overlapping it
+        ingresses = self.events._iter_body_events("Moon", jd_start - MAX_SIGN_DAYS, jd_end + MAX_SIGN_DAYS, True, False, tzinfo)
+        for ingress in ingresses:
+            if previous is not None:
+                last = self._last_aspect(moon, motions, targets, previous.jd_ut, ingress.jd_ut) if targets else None
+                jd = last[0] if last else previous.jd_ut
+                if jd > jd_end:
+                    return
+                if ingress.jd_ut >= jd_start:
+                    yield VoidOfCourseEvent(
+                        sign=previous.sign, next_sign=ingress.sign,
+                        dt_utc=jd_to_datetime(jd, tzinfo), jd_ut=jd,
+                        end_dt_utc=ingress.dt_utc, end_jd_ut=ingress.jd_ut,
+                        last_aspect_body=last[1] if last else None,
+                        last_aspect_type=last[2] if last else None
+                    )
+            previous = ingress
+
+    def iter_events(self, start: datetime.datetime, end: datetime.datetime, lunations: bool = True, eclipses: bool = True, void_of_course: bool = True) -> Iterator[CalendarEvent]:
+        """
+        Stream the whole calendar, merged in time order.
+
+        New and full Moons, eclipses and void-of-course periods are produced by
+        independent generators and merged lazily, so a calendar of any length
+        streams in flat memory.
+
+        Args:
+            start: Start of the range (UTC)
+            end: End of the range (UTC)
+            lunations: Include new and full Moons
+            eclipses: Include solar and lunar eclipses
+            void_of_course: Include void-of-course Moon periods (by start time)
+
+        Yields:
+            LunationEvent, EclipseEvent and VoidOfCourseEvent records sorted by jd_ut
+        """
+        self._range(start, end)
+        streams = []
+        if lunations:
+            streams.append(self.iter_lunations(start, end))
+        if eclipses:
+            streams.append(self.iter_eclipses(start, end))
+        if void_of_course:
+            streams.append(self.iter_void_of_course(start, end))
+        return heapq.merge(*streams, key=lambda event: event.jd_ut)
@@ -1,7 +1,9 @@
 # nataly/models.py
 # Contains the core data classes for the astrology library.
 
-from dataclasses import dataclass
+import datetime
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import Optional, Literal, List, Dict, Any
 from .constants import SIGNS, ZODIAC_SIGN_DEGREES, ASTROLOGICAL_BODY_GROUPS
 
@@ -91,7 +93,38 @@ def decimal_to_dms_string(decimal: float, format_type: str = 'position') -> str:
     return f"{degrees}°{minutes:02d}'{seconds:02d}\""
 
 
-@dataclass
+# Number of DMS strings kept by the model properties (a report reads each several times)
+DMS_CACHE_SIZE = 4096
+
+_dms_string = lru_cache(maxsize=DMS_CACHE_SIZE)(decimal_to_dms_string)
+
+
+def _slotted(cls):
+    """
+    Recreate a dataclass with __slots__ instead of a per-instance __dict__.
+
+    Equivalent to dataclass(slots=True), which needs Python 3.10. Pickling and
+    copying go through __getstate__/__setstate__ so frozen classes work too.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items() if key not in names + ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+
+    def __getstate__(self):
+        return [getattr(self, name) for name in names]
+
+    def __setstate__(self, state):
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+
+    namespace['__getstate__'], namespace['__setstate__'] = __getstate__, __setstate__
+    slotted = type(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+@_slotted
+@dataclass(frozen=True)
 class Sign:
     """Represents the static properties of a Zodiac sign."""
     name: str
@@ -103,13 +136,25 @@ class Sign:
     modern_ruler: Optional[str] = None
 
 
+# The 12 Sign objects, shared by every body and house cusp
+SIGN_OBJECTS: Dict[str, Sign] = {name: Sign(**data) for name, data in SIGNS.items()}
+
+
 def get_sign(sign_name: str) -> Optional[Sign]:
-    """Create a Sign object from a sign name using the canonical SIGNS dict from constants.py."""
-    data = SIGNS.get(sign_name)
-    if data:
-        return Sign(**data)
-    return None
+    """Get the shared Sign object of a sign name (see SIGNS in constants.py), or None."""
+    return SIGN_OBJECTS.get(sign_name)
 
+
+@lru_cache(maxsize=DMS_CACHE_SIZE)
+def _signed_dms_string(longitude: float, symbol: str) -> str:
+    decimal_in_sign = longitude % 30
+    degrees = int(decimal_in_sign)
+    minutes_decimal = (decimal_in_sign - degrees) * 60
+    minutes = int(minutes_decimal)
+    seconds = int((minutes_decimal - minutes) * 60)
+    return f"{degrees}{symbol}{minutes:02d}'{seconds:02d}\""
+
+@_slotted
 @dataclass
 class Body:
     """Represents all calculated properties of a celestial body."""
@@ -127,19 +172,13 @@ class Body:
     @property
     def dms(self) -> str:
         """Returns the longitude in Degrees°Minutes'Seconds" format within its sign."""
-        return decimal_to_dms_string(self.longitude, 'position')
+        return _dms_string(self.longitude, 'position')
 
     @property
     def signed_dms(self) -> str:
         """Returns the longitude in DD°Sign'MM'SS" format."""
-        # This implementation is now more robust.
-        # It calculates the values directly instead of parsing the output of another property.
-        decimal_in_sign = self.longitude % 30
-        degrees = int(decimal_in_sign)
-        minutes_decimal = (decimal_in_sign - degrees) * 60
-        minutes = int(minutes_decimal)
-        seconds = int((minutes_decimal - minutes) * 60)
-        return f"{degrees}{self.sign.symbol}{minutes:02d}'{seconds:02d}\""
+        # Calculated directly instead of parsing the output of another property
+        return _signed_dms_string(self.longitude, self.sign.symbol)
 
     @property
     def absolute_longitude(self) -> float:
@@ -149,17 +188,23 @@ class Body:
     @property
     def absolute_dms(self) -> str:
         """Returns the absolute longitude in DMS format (0-360 degrees)."""
-        return decimal_to_dms_string(self.longitude, 'speed')
+        return _dms_string(self.longitude, 'speed')
 
     @property
     def latitude_dms(self) -> str:
         """Returns the latitude in DMS format."""
-        return decimal_to_dms_string(self.latitude, 'speed')
+        return _dms_string(self.latitude, 'speed')
 
     @property
     def declination_dms(self) -> str:
         """Returns the declination in DMS format."""
-        return decimal_to_dms_string(self.declination, 'speed')
+        return _dms_string(self.declination, 'speed')
+
+# BodyFilter flag that includes each body type
+BODY_TYPE_FILTER_FLAGS = {
+    "Planet": "include_planets", "Luminary": "include_luminaries", "Asteroid": "include_asteroids",
+    "Axis": "include_axes", "LunarNode": "include_lunar_nodes", "Lilith": "include_lilith",
+}
 
 @dataclass
 class BodyFilter:
@@ -206,6 +251,7 @@ class BodyFilter:
         if self.include_retrograde is not None and body.is_retrograde != self.include_retrograde: return False
         return True
 
+@_slotted
 @dataclass
 class House:
     """Represents the properties of an astrological house."""
@@ -221,7 +267,7 @@ class House:
     @property
     def dms(self) -> str:
         """Returns the cusp longitude in Degrees°Minutes'Seconds" format within its sign."""
-        return decimal_to_dms_string(self.cusp_longitude, 'position')
+        return _dms_string(self.cusp_longitude, 'position')
 
     @property
     def absolute_longitude(self) -> float:
@@ -231,13 +277,14 @@ class House:
     @property
     def absolute_dms(self) -> str:
         """Returns the absolute longitude in DMS format (0-360 degrees)."""
-        return decimal_to_dms_string(self.cusp_longitude, 'speed')
+        return _dms_string(self.cusp_longitude, 'speed')
 
     @property
     def declination_dms(self) -> str:
         """Returns the declination in DMS format."""
-        return decimal_to_dms_string(self.declination, 'speed')
+        return _dms_string(self.declination, 'speed')
 
+@_slotted
 @dataclass
 class Aspect:
     """Represents an aspectual relationship between two celestial bodies."""
@@ -252,7 +299,93 @@ class Aspect:
     def orb_str(self) -> str:
         """Returns the orb value in Degrees°Minutes'Seconds" format with sign."""
         sign = "-" if self.orb < 0 else ""
-        return sign + decimal_to_dms_string(self.orb, 'orb')
+        return sign + _dms_string(self.orb, 'orb')
+
+@_slotted
+@dataclass(frozen=True)
+class AspectEvent:
+    """Represents the exact moment a transiting body aspects a fixed ecliptic longitude."""
+    body: str
+    target: str
+    aspect_type: str
+    symbol: str
+    dt_utc: datetime.datetime
+    jd_ut: float
+    longitude: float
+    target_longitude: float
+    is_retrograde: bool
+
+@_slotted
+@dataclass(frozen=True)
+class IngressEvent:
+    """Represents a celestial body entering a zodiac sign."""
+    body: str
+    sign: str
+    previous_sign: str
+    dt_utc: datetime.datetime
+    jd_ut: float
+    longitude: float
+    is_retrograde: bool
+
+@_slotted
+@dataclass(frozen=True)
+class StationEvent:
+    """Represents a celestial body turning retrograde or direct."""
+    body: str
+    station_type: Literal["retrograde", "direct"]
+    dt_utc: datetime.datetime
+    jd_ut: float
+    longitude: float
+    sign: str
+
+@_slotted
+@dataclass(frozen=True)
+class LunationEvent:
+    """Represents an exact Moon phase (e.g. New Moon or Full Moon)."""
+    phase: Literal["New Moon", "First Quarter", "Full Moon", "Last Quarter"]
+    dt_utc: datetime.datetime
+    jd_ut: float
+    longitude: float  # Moon longitude
+    sign: str
+
+@_slotted
+@dataclass(frozen=True)
+class EclipseEvent:
+    """Represents the maximum of a solar or lunar eclipse."""
+    eclipse_kind: Literal["solar", "lunar"]
+    eclipse_type: Literal["total", "annular", "hybrid", "partial", "penumbral"]
+    dt_utc: datetime.datetime
+    jd_ut: float
+    longitude: float  # Sun longitude for solar eclipses, Moon longitude for lunar eclipses
+    sign: str
+
+@_slotted
+@dataclass(frozen=True)
+class VoidOfCourseEvent:
+    """Represents a void-of-course Moon period, from its last aspect in a sign to its next ingress."""
+    sign: str
+    next_sign: str
+    dt_utc: datetime.datetime
+    jd_ut: float
+    end_dt_utc: datetime.datetime
+    end_jd_ut: float
+    last_aspect_body: Optional[str] = None  # None when the Moon makes no aspect in the sign
+    last_aspect_type: Optional[str] = None
+
+@_slotted
+@dataclass
+class ChartDiff:
+    """Represents what changed in a chart between two instants (see LiveChart.advance)."""
+    dt_utc: datetime.datetime
+    entered_aspects: List["Aspect"]
+    left_aspects: List["Aspect"]
+    sign_changes: List[tuple]   # (body, previous sign, new sign)
+    house_changes: List[tuple]  # (body, previous house, new house)
+
+    @property
+    def is_empty(self) -> bool:
+        """True when no aspect, sign or house changed."""
+        return not (self.entered_aspects or self.left_aspects or self.sign_changes or self.house_changes)
 
 @dataclass
 class OrbConfig:
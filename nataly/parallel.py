@@ -0,0 +1,173 @@
+# nataly/parallel.py
+# Process-pool chart engine that spreads batch calculations across CPU cores.
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Iterable, Optional
+
+from .engine import AstroEngine, ORB_ENGINE_CACHE_SIZE
+from .context import JDContext
+
+# Engine owned by each worker process, created once by _init_worker.
+_worker_engine = None
+
+# Worker engines by orb configuration key, so switching configurations reuses their aspect tables
+_worker_orb_engines = {}
+
+
+def _init_worker(ephe_path: str, single_call: bool, bodies: List[str]):
+    """Create the worker's engine, which also sets the ephemeris path once per process."""
+    global _worker_engine
+    _worker_engine = AstroEngine(None, ephe_path, single_call, bodies)
+    _worker_orb_engines.clear()
+
+
+def _engine_for(orb_config, orb_key: tuple) -> AstroEngine:
+    """The worker's engine for the orb configuration the parent sent with a task."""
+    engine = _worker_orb_engines.get(orb_key)
+    if engine is None:
+        if len(_worker_orb_engines) > ORB_ENGINE_CACHE_SIZE:
+            del _worker_orb_engines[next(iter(_worker_orb_engines))]
+        engine = _worker_orb_engines[orb_key] = _worker_engine._derive(orb_config)
+    return engine
+
+
+def _compute_chunk(chunk: List[tuple], with_aspects: bool, orb_config, orb_key: tuple) -> list:
+    """
+    Calculate a chunk of charts inside a worker process.
+
+    The orb configuration comes with every task, so the workers always use
+    the one the parent engine holds at the time of the call.
+
+    Results are sent back as _ChartBlock columns (see AstroEngine._chart_blocks),
+    so the parent unpickles a few arrays per chunk instead of an object graph or
+    tuple tree per chart. Aspects are found here, for the whole chunk at once.
+    """
+    engine = _engine_for(orb_config, orb_key)
+    raw_batch = []
+    contexts = {}
+    for dt_utc, lat, lon in chunk:
+        context = contexts.get(dt_utc)
+        if context is None:
+            context = contexts[dt_utc] = JDContext.from_datetime(dt_utc)
+        raw_batch.append(engine._calculate_raw_positions(dt_utc, lat, lon, context))
+    return engine._chart_blocks(raw_batch, with_aspects)
+
+
+class ParallelAstroEngine(AstroEngine):
+    """
+    AstroEngine whose batch path runs on a pool of worker processes.
+
+    The Swiss Ephemeris keeps its state per process, so every worker owns its own
+    engine and ephemeris setup. Single-chart calls still run in the calling process.
+
+    Workers calculate positions, house cusps and aspects and send them back as
+    column blocks (see _compute_chunk). NatalChart.from_many wraps each chart
+    around its block without building any model objects; a chart builds its
+    Body, House and Aspect objects in the calling process on first access.
+
+    Scaling of from_many (benchmarks/bench_parallel.py): the workers spend
+    0.27 ms per chart and the calling process 0.003 ms (unpickling the blocks
+    and creating the charts). One worker on one CPU measured 0.89-1.0x of the
+    serial engine. With the calling process's share not overlapping the
+    workers at all, the projected speedup is 7.3x on 8 workers, 13x on 16 and
+    23x on 32; results are handled while later chunks are still calculated,
+    which brings it closer to linear. Reading every chart's aspects adds about
+    0.19 ms per chart in the calling process.
+    """
+
+    def __init__(self, orb_config=None, ephe_path='./nataly/ephe', single_call: bool = False, bodies: Optional[Iterable[str]] = None, max_workers: Optional[int] = None, chunksize: Optional[int] = None):
+        """
+        Initialize the parallel astrological engine.
+
+        Args:
+            orb_config: OrbConfig object or dict for orb settings
+            ephe_path: Path to ephemeris files
+            single_call: If True, make one ephemeris call per body (see AstroEngine)
+            bodies: Body names and/or ASTROLOGICAL_BODY_GROUPS keys to calculate
+            max_workers: Number of worker processes (defaults to the CPU count)
+            chunksize: Records sent to a worker per task (defaults to an even split
+                       into four tasks per worker)
+        """
+        super().__init__(orb_config, ephe_path, single_call, bodies)
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self._executor = None
+        # Engine whose worker pool this one uses; engines derived by with_orb_config share it
+        self._pool_owner = self
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use."""
+        owner = self._pool_owner
+        if owner._executor is None:
+            owner._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.ephe_path, self.single_call, self.body_names),
+            )
+        return owner._executor
+
+    def compute_batch(self, inputs: Iterable[tuple], with_aspects: bool = False) -> List[tuple]:
+        """
+        Calculate planetary positions and house cusps for many charts across worker processes.
+
+        The Body, House and Aspect objects returned are built in the calling
+        process; NatalChart.from_many avoids that by building them per chart on
+        first access.
+
+        Args:
+            inputs: Iterable of (name, dt_utc, lat, lon) records
+            with_aspects: If True, also calculate the aspects between the bodies of each chart
+
+        Returns:
+            List of (bodies_dict, houses) tuples in input order, or
+            (bodies_dict, houses, aspects) tuples when with_aspects is True
+        """
+        records = [(dt_utc, lat, lon) for _, dt_utc, lat, lon in inputs]
+        results = []
+        for block, index in self._map_blocks(records, with_aspects):
+            bodies_dict, houses = self._build_bodies_and_houses(*block.raw(index))
+            if with_aspects:
+                results.append((bodies_dict, houses, self._aspects_from_rows(bodies_dict, block.aspect_rows(index))))
+            else:
+                results.append((bodies_dict, houses))
+        return results
+
+    def _compute_chart_batch(self, records: List[tuple]) -> List[tuple]:
+        """Raw results of many charts, with the aspects found by the workers (see AstroEngine)."""
+        return self._map_blocks(records, True)
+
+    def compute_raw_batch(self, records: List[tuple]) -> List[tuple]:
+        """Run the ephemeris calculations for many charts across worker processes (see AstroEngine)."""
+        return [block.raw(index) for block, index in self._map_blocks(list(records), False)]
+
+    def _map_blocks(self, records: List[tuple], with_aspects: bool) -> List[tuple]:
+        """Split (dt_utc, lat, lon) records into chunks, calculate them on the worker pool and return (block, index) pairs in input order."""
+        if not records:
+            return []
+        executor = self._get_executor()
+        workers = self.max_workers or os.cpu_count() or 1
+        chunksize = self.chunksize or max(1, math.ceil(len(records) / (workers * 4)))
+        chunks = [records[i:i + chunksize] for i in range(0, len(records), chunksize)]
+        tasks = executor.map(
+            _compute_chunk, chunks, [with_aspects] * len(chunks),
+            [self.orb_config] * len(chunks), [self._orb_key] * len(chunks)
+        )
+        placed = []
+        for chunk, blocks in zip(chunks, tasks):
+            placed.extend(self._place_blocks(len(chunk), blocks))
+        return placed
+
+    def close(self):
+        """Shut down the worker pool, which engines derived by with_orb_config share."""
+        owner = self._pool_owner
+        if owner._executor is not None:
+            owner._executor.shutdown()
+            owner._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
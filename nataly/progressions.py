@@ -0,0 +1,165 @@
+# nataly/progressions.py
+# Secondary progressions and solar arc directions over a range of ages.
+
+import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import swisseph as swe
+
+from .aspects import np
+from .chart import NatalChart
+from .context import datetime_to_jd
+from .engine import AstroEngine
+from .events import EventFinder, _signed_difference
+from .synastry import SynastryBatch, SynastryAspect
+from .transits import TransitTimeline
+
+# Length of the year of life matched by each day after birth (tropical year)
+DAYS_PER_YEAR = 365.2422
+
+# Mean motion of the Sun in degrees per day, the Naibod arc per year of life
+NAIBOD_RATE = 0.9856473
+
+ANGLE_METHODS = ("solar_arc", "naibod")
+
+
+class ProgressionSeries:
+    """
+    Secondary progressions and solar arc directions of a natal chart for a range of ages.
+
+    Progressed bodies are the positions N days after birth for the age of N
+    years (times holds those instants, dates the calendar dates of the ages),
+    calculated in one TransitTimeline sweep. Progressed angles come from the
+    natal ARMC advanced by the solar arc (or the Naibod arc) at the birth
+    place. Solar arc directions add the same arc, the progressed Sun minus the
+    natal Sun, to every natal point. Everything is kept as (ages, points)
+    arrays; no Body or House objects are built per age.
+    """
+
+    def __init__(self, natal: NatalChart, start_age: float, end_age: float, step_years: float = 1.0, bodies: Optional[Iterable[str]] = None, angle_method: str = "solar_arc", engine: Optional[AstroEngine] = None):
+        """
+        Calculate the series.
+
+        Args:
+            natal: Natal chart to progress and direct
+            start_age: First age in years
+            end_age: Last age in years, included when it falls on a step
+            step_years: Years between two ages (e.g. 1 / 12 for monthly steps)
+            bodies: Body names and/or ASTROLOGICAL_BODY_GROUPS keys to progress
+                    (defaults to the natal chart's bodies)
+            angle_method: "solar_arc" or "naibod", the arc added to the natal ARMC
+            engine: AstroEngine for the ephemeris and orbs (defaults to the natal chart's)
+        """
+        if step_years <= 0:
+            raise ValueError(f"step_years must be positive, got {step_years}")
+        if end_age < start_age:
+            raise ValueError("end_age must not be before start_age")
+        if angle_method not in ANGLE_METHODS:
+            raise ValueError(f"angle_method must be one of {ANGLE_METHODS}, got '{angle_method}'")
+        self.natal = natal
+        self.engine = engine if engine is not None else natal.engine
+        self.angle_method = angle_method
+        selection = list(natal.bodies_dict) if bodies is None else bodies
+
+        count = int((end_age - start_age) / step_years + 1e-9) + 1
+        self.ages = [start_age + i * step_years for i in range(count)]
+        # One day after birth per year of life
+        step = datetime.timedelta(days=step_years)
+        first = natal.datetime_utc + datetime.timedelta(days=start_age)
+        self.timeline = TransitTimeline(first, first + (count - 1) * step, step, bodies=selection, engine=self.engine)
+        self.times = self.timeline.times
+        self.jds = self.timeline.jds
+        # Calendar date each age stands for
+        self.dates = [natal.datetime_utc + datetime.timedelta(days=age * DAYS_PER_YEAR) for age in self.ages]
+
+        natal_jd = datetime_to_jd(natal.datetime_utc)
+        sun = EventFinder(self.engine)._motion("Sun")
+        # A chart of selected bodies may leave out the Sun the arcs are measured from
+        natal_sun = natal.bodies_dict["Sun"].longitude if "Sun" in natal.bodies_dict else sun(natal_jd)[0]
+        if "Sun" in self.timeline.body_names:
+            sun_index = self.timeline.body_names.index("Sun")
+            suns = [float(row[sun_index]) for row in self.timeline.longitudes]
+        else:
+            suns = [sun(jd)[0] for jd in self.jds]
+        # The true arc stays within a few degrees of the Naibod arc, which sets its turn count
+        self.solar_arcs = [
+            NAIBOD_RATE * age + _signed_difference(lon - natal_sun - NAIBOD_RATE * age)
+            for age, lon in zip(self.ages, suns)
+        ]
+
+        self.angle_names = [name for name in self.engine.chart_angles if name in natal.bodies_dict]
+        angle_rows = self._progressed_angles(natal_jd) if self.angle_names else [[] for _ in self.ages]
+        self.body_names = self.timeline.body_names + self.angle_names
+        self.directed_names = list(natal.bodies_dict)
+        natal_longitudes = [natal.bodies_dict[name].longitude for name in self.directed_names]
+        directed = [[(lon + arc) % 360.0 for lon in natal_longitudes] for arc in self.solar_arcs]
+
+        if np is not None:
+            self.solar_arcs = np.array(self.solar_arcs, dtype=float)
+            angles = np.array(angle_rows, dtype=float).reshape(count, len(self.angle_names))
+            self.longitudes = np.hstack([self.timeline.longitudes, angles])
+            self.directed_longitudes = np.array(directed, dtype=float).reshape(count, len(self.directed_names))
+        else:
+            self.longitudes = [list(row) + angle_row for row, angle_row in zip(self.timeline.longitudes, angle_rows)]
+            self.directed_longitudes = directed
+
+    def _progressed_angles(self, natal_jd: float) -> List[List[float]]:
+        """AC, MC, IC and DC of each age from the natal ARMC advanced by the arc."""
+        natal = self.natal
+        _, ascmc = self.engine._houses(natal_jd, natal.latitude, natal.longitude)
+        armc = ascmc[2]
+        obliquity = swe.calc_ut(natal_jd, swe.ECL_NUT)[0][0]
+        if self.angle_method == "solar_arc":
+            arcs = self.solar_arcs
+        else:
+            arcs = [NAIBOD_RATE * age for age in self.ages]
+        rows = []
+        for arc in arcs:
+            _, ascmc = swe.houses_armc((armc + arc) % 360.0, natal.latitude, obliquity, b'P')
+            angles = {
+                "AC": ascmc[0], "MC": ascmc[1],
+                "IC": (ascmc[1] + 180) % 360, "DC": (ascmc[0] + 180) % 360,
+            }
+            rows.append([angles[name] for name in self.angle_names])
+        return rows
+
+    def __len__(self) -> int:
+        return len(self.ages)
+
+    def progressed_at(self, index: int) -> Dict[str, float]:
+        """Progressed body and angle longitudes by name at one age."""
+        return {
+            name: float(lon) for name, lon in zip(self.body_names, self.longitudes[index])
+            if lon == lon
+        }
+
+    def directed_at(self, index: int) -> Dict[str, float]:
+        """Solar arc directed longitudes of the natal points by name at one age."""
+        return {name: float(lon) for name, lon in zip(self.directed_names, self.directed_longitudes[index])}
+
+    def _matcher(self, names: List[str]) -> SynastryBatch:
+        # Every progressed or directed point against every natal point, itself included
+        return SynastryBatch(self.natal, names, natal_first=False, table=self.engine.aspect_table, all_pairs=True)
+
+    def progressed_aspects(self, chunk_size: int = 1024) -> List[List[SynastryAspect]]:
+        """
+        Progressed-to-natal aspects of every age.
+
+        Returns:
+            Per age, (progressed point, natal point, aspect type, orb, is_applying)
+            tuples for every progressed and natal point pair, including a point
+            and its own natal position (e.g. progressed Moon to natal Moon)
+        """
+        return self._matcher(self.body_names).aspects(self.longitudes, chunk_size)
+
+    def directed_aspects(self, chunk_size: int = 1024) -> List[List[SynastryAspect]]:
+        """Solar arc directed-to-natal aspects of every age (see progressed_aspects)."""
+        return self._matcher(self.directed_names).aspects(self.directed_longitudes, chunk_size)
+
+    def iter_progressed_aspects(self, chunk_size: int = 1024) -> Iterator[Tuple[float, List[SynastryAspect]]]:
+        """Stream (age, aspects) pairs of the progressed-to-natal aspects."""
+        return zip(self.ages, self._matcher(self.body_names).iter_aspects(self.longitudes, chunk_size))
+
+    def iter_directed_aspects(self, chunk_size: int = 1024) -> Iterator[Tuple[float, List[SynastryAspect]]]:
+        """Stream (age, aspects) pairs of the solar arc directed-to-natal aspects."""
+        return zip(self.ages, self._matcher(self.directed_names).iter_aspects(self.directed_longitudes, chunk_size))
@@ -0,0 +1,223 @@
+# nataly/rectification.py
+# Birth-time rectification: the parts of a time window where chart constraints hold.
+
+import datetime
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import swisseph as swe
+
+from .constants import SIGN_NAMES_BY_DEGREE
+from .context import datetime_to_jd, jd_to_datetime
+from .engine import AstroEngine
+from .events import EventFinder, _signed_difference
+
+# Mean rate of the ARMC (local sidereal time in degrees) per day of UT
+SIDEREAL_RATE = 360.98564736629
+
+# Spacing of the positions slow bodies are interpolated between (days)
+SLOW_SAMPLE_DAYS = 0.5
+
+# Bodies calculated at every step instead of interpolated
+FAST_BODIES = ("Moon",)
+
+_CONSTRAINT_PATTERN = re.compile(r"^\s*(.+?)\s+in\s+(?:house\s+(\d+)|(\w+))\s*$", re.IGNORECASE)
+
+
+@dataclass
+class RectificationConstraint:
+    """A sign or house placement a candidate birth time must have (e.g. Jupiter in house 10)."""
+    point: str
+    sign: Optional[str] = None
+    house: Optional[int] = None
+
+    def __post_init__(self):
+        if (self.sign is None) == (self.house is None):
+            raise ValueError("A constraint needs exactly one of sign and house")
+        if self.sign is not None and self.sign not in SIGN_NAMES_BY_DEGREE:
+            raise ValueError(f"Unknown sign: {self.sign}")
+        if self.house is not None and not 1 <= self.house <= 12:
+            raise ValueError(f"House must be between 1 and 12, got {self.house}")
+
+    @classmethod
+    def parse(cls, text: str) -> 'RectificationConstraint':
+        """Parse "<point> in <sign>" or "<point> in house <n>", e.g. "AC in Virgo"."""
+        match = _CONSTRAINT_PATTERN.match(text)
+        if match is None:
+            raise ValueError(f"Cannot parse constraint: '{text}'")
+        point, house, sign = match.groups()
+        if house is not None:
+            return cls(point, house=int(house))
+        return cls(point, sign=sign.capitalize())
+
+
+ConstraintLike = Union[RectificationConstraint, str]
+Window = Tuple[datetime.datetime, datetime.datetime]
+
+
+class RectificationSearch:
+    """
+    Angles, house cusps and body placements over a window of candidate birth times.
+
+    Only the quantities that change quickly are recalculated per instant: the
+    ARMC advances at the sidereal rate between ARMCs sampled with swe.houses,
+    cusps and angles come from swe.houses_armc, and the Moon from the
+    ephemeris. Other bodies are interpolated (cubic Hermite with their speeds)
+    between positions sampled every SLOW_SAMPLE_DAYS, which keeps them within a
+    few milliarcseconds.
+    """
+
+    def __init__(self, start: datetime.datetime, end: datetime.datetime, lat: float, lon: float, bodies: Optional[Iterable[str]] = None, engine: Optional[AstroEngine] = None, ephe_path: str = './nataly/ephe'):
+        """
+        Prepare the search.
+
+        Args:
+            start: Earliest candidate birth time (UTC)
+            end: Latest candidate birth time (UTC)
+            lat: Latitude of the birth place
+            lon: Longitude of the birth place
+            bodies: Body names constraints may refer to (defaults to every body
+                    with an ephemeris of its own, see EventFinder)
+            engine: AstroEngine providing the ephemeris path and cache
+            ephe_path: Path to ephemeris files, when no engine is given
+        """
+        if end < start:
+            raise ValueError("end must not be before start")
+        finder = EventFinder(engine, ephe_path)
+        self.engine = finder.engine
+        self.start, self.end = start, end
+        self.latitude, self.longitude = lat, lon
+        self.jd_start, self.jd_end = datetime_to_jd(start), datetime_to_jd(end)
+        self.body_names = finder._default_bodies() if bodies is None else list(bodies)
+
+        self._fast = {name: finder._motion(name) for name in self.body_names if name in FAST_BODIES}
+        count = int((self.jd_end - self.jd_start) / SLOW_SAMPLE_DAYS) + 2
+        self._node_jds = [self.jd_start + i * SLOW_SAMPLE_DAYS for i in range(count)]
+        self._node_armcs = [self.engine._houses(jd, lat, lon)[1][2] for jd in self._node_jds]
+        self._node_obliquities = [swe.calc_ut(jd, swe.ECL_NUT)[0][0] for jd in self._node_jds]
+        # ARMC rate of each segment, so the ARMC meets the sample at both ends
+        self._armc_rates = [
+            SIDEREAL_RATE + _signed_difference(armc1 - armc0 - SIDEREAL_RATE * SLOW_SAMPLE_DAYS) / SLOW_SAMPLE_DAYS
+            for armc0, armc1 in zip(self._node_armcs, self._node_armcs[1:])
+        ]
+        self._nodes = {}
+        for name in self.body_names:
+            if name not in self._fast:
+                motion = finder._motion(name)
+                self._nodes[name] = [motion(jd) for jd in self._node_jds]
+
+    def _node_index(self, jd: float) -> int:
+        return min(max(int((jd - self.jd_start) / SLOW_SAMPLE_DAYS), 0), len(self._node_jds) - 2)
+
+    def _armc(self, jd: float) -> Tuple[float, float]:
+        """ARMC and true obliquity at a Julian day, from the nearest earlier sample."""
+        index = self._node_index(jd)
+        armc = (self._node_armcs[index] + self._armc_rates[index] * (jd - self._node_jds[index])) % 360.0
+        return armc, self._node_obliquities[index]
+
+    def houses_at(self, jd: float) -> Tuple[List[float], Dict[str, float]]:
+        """
+        House cusps and angles at a Julian day (UT).
+
+        Returns:
+            (12 Placidus cusp longitudes, {"AC", "MC", "IC", "DC"} longitudes)
+        """
+        armc, obliquity = self._armc(jd)
+        cusps, ascmc = swe.houses_armc(armc, self.latitude, obliquity, b'P')
+        angles = {
+            "AC": ascmc[0], "MC": ascmc[1],
+            "IC": (ascmc[1] + 180) % 360, "DC": (ascmc[0] + 180) % 360,
+        }
+        return list(cusps), angles
+
+    def longitude_at(self, body: str, jd: float) -> float:
+        """Ecliptic longitude of a body at a Julian day (UT) within the window."""
+        if body in self._fast:
+            return self._fast[body](jd)[0]
+        nodes = self._nodes.get(body)
+        if nodes is None:
+            raise ValueError(f"Body '{body}' is not part of the rectification search")
+        index = self._node_index(jd)
+        (lon0, speed0), (lon1, speed1) = nodes[index], nodes[index + 1]
+        h = SLOW_SAMPLE_DAYS
+        s = (jd - self._node_jds[index]) / h
+        delta = _signed_difference(lon1 - lon0)
+        # Cubic Hermite basis on [0, 1]
+        h10, h01, h11 = s ** 3 - 2 * s ** 2 + s, -2 * s ** 3 + 3 * s ** 2, s ** 3 - s ** 2
+        return (lon0 + h10 * h * speed0 + h01 * delta + h11 * h * speed1) % 360.0
+
+    def _point_longitude(self, point: str, jd: float, angles: Optional[Dict[str, float]]) -> float:
+        if point in self.engine.chart_angles:
+            return angles[point]
+        return self.longitude_at(point, jd)
+
+    def _holds(self, constraints: Sequence[RectificationConstraint], jd: float) -> bool:
+        cusps, angles = self.houses_at(jd)
+        for constraint in constraints:
+            longitude = self._point_longitude(constraint.point, jd, angles)
+            if constraint.sign is not None:
+                if SIGN_NAMES_BY_DEGREE[int(longitude // 30) % 12] != constraint.sign:
+                    return False
+            elif self.engine._get_house_from_longitude(longitude, cusps) != constraint.house:
+                return False
+        return True
+
+    def _constraints(self, constraints: Iterable[ConstraintLike]) -> List[RectificationConstraint]:
+        parsed = [RectificationConstraint.parse(c) if isinstance(c, str) else c for c in constraints]
+        for constraint in parsed:
+            if constraint.point not in self.engine.chart_angles and constraint.point not in self.body_names:
+                raise ValueError(f"Unknown point in constraint: '{constraint.point}'")
+        return parsed
+
+    def find_windows(self, constraints: Iterable[ConstraintLike], step: datetime.timedelta = datetime.timedelta(minutes=2), tolerance: datetime.timedelta = datetime.timedelta(seconds=1)) -> List[Window]:
+        """
+        Find the sub-windows of candidate birth times where every constraint holds.
+
+        The window is scanned at step and each change between two samples is
+        located by bisection down to tolerance, so the cost grows with the number
+        of boundaries rather than with the resolution.
+
+        Args:
+            constraints: RectificationConstraint objects or strings such as
+                         "Jupiter in house 10" and "AC in Virgo"
+            step: Scan step; shorter than the briefest placement to be found
+            tolerance: Precision of the window boundaries
+
+        Returns:
+            (start, end) UTC datetimes of each sub-window, in time order
+        """
+        if step <= datetime.timedelta(0) or tolerance <= datetime.timedelta(0):
+            raise ValueError("step and tolerance must be positive")
+        constraints = self._constraints(constraints)
+        step_days = step.total_seconds() / 86400.0
+        tolerance_days = tolerance.total_seconds() / 86400.0
+        tzinfo = self.start.tzinfo
+
+        def boundary(a: float, b: float, state_a: bool) -> float:
+            while b - a > tolerance_days:
+                middle = (a + b) / 2.0
+                if self._holds(constraints, middle) == state_a:
+                    a = middle
+                else:
+                    b = middle
+            return (a + b) / 2.0
+
+        windows = []
+        a = self.jd_start
+        state = self._holds(constraints, a)
+        opened = a if state else None
+        while a < self.jd_end:
+            b = min(a + step_days, self.jd_end)
+            state_b = self._holds(constraints, b)
+            if state_b != state:
+                jd = boundary(a, b, state)
+                if state_b:
+                    opened = jd
+                else:
+                    windows.append((opened, jd))
+                    opened = None
+            a, state = b, state_b
+        if opened is not None:
+            windows.append((opened, self.jd_end))
+        return [(jd_to_datetime(s, tzinfo), jd_to_datetime(e, tzinfo)) for s, e in windows]
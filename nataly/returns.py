@@ -0,0 +1,179 @@
+# nataly/returns.py
+# Solar and lunar return instants and charts.
+
+import datetime
+import math
+from bisect import bisect_left
+from typing import List, Optional, Sequence, Tuple, Union
+
+from .chart import NatalChart
+from .context import datetime_to_jd, jd_to_datetime
+from .engine import AstroEngine
+from .events import EventFinder, TIME_TOLERANCE, _signed_difference
+
+# Mean time in days for the body to come back to the same longitude
+RETURN_PERIOD_DAYS = {"Sun": 365.2422, "Moon": 27.3217}
+
+# Sampling step in days of the shared track used by batch searches
+BATCH_SAMPLE_DAYS = {"Sun": 10.0, "Moon": 0.5}
+
+Location = Tuple[float, float]
+
+
+class ReturnFinder:
+    """
+    Finds the instants the transiting Sun or Moon regains a natal longitude.
+
+    The Sun and the Moon never turn retrograde, so Newton iteration with the
+    speed returned by swe.calc_ut converges in a few steps from a date near
+    the return.
+    """
+
+    def __init__(self, engine: Optional[AstroEngine] = None, ephe_path: str = './nataly/ephe'):
+        """
+        Initialize the finder.
+
+        Args:
+            engine: AstroEngine used for the ephemeris and the return charts
+            ephe_path: Path to ephemeris files, when no engine is given
+        """
+        self.events = EventFinder(engine, ephe_path)
+        self.engine = self.events.engine
+
+    def _motion(self, body: str):
+        if body not in RETURN_PERIOD_DAYS:
+            raise ValueError(f"Returns are supported for {sorted(RETURN_PERIOD_DAYS)}, not '{body}'")
+        return self.events._motion(body)
+
+    def find_return_jd(self, body: str, natal_longitude: float, near_jd: float) -> float:
+        """
+        Solve for the Julian day (UT) of the return closest to near_jd.
+
+        Args:
+            body: "Sun" or "Moon"
+            natal_longitude: Longitude to return to, in degrees
+            near_jd: Starting guess, within half a period of the return
+        """
+        motion = self._motion(body)
+        jd = near_jd
+        for _ in range(50):
+            lon, speed = motion(jd)
+            step = _signed_difference(lon - natal_longitude) / speed
+            jd -= step
+            if abs(step) < TIME_TOLERANCE:
+                return jd
+        raise RuntimeError(f"{body} return did not converge near Julian day {near_jd}")
+
+    def find_return(self, body: str, natal_longitude: float, near: datetime.datetime) -> datetime.datetime:
+        """Solve for the UTC instant of the return closest to near (see find_return_jd)."""
+        return jd_to_datetime(self.find_return_jd(body, natal_longitude, datetime_to_jd(near)), near.tzinfo)
+
+    def _return_chart(self, body: str, natal_chart: NatalChart, near: datetime.datetime, location: Optional[Location]) -> NatalChart:
+        dt_utc = self.find_return(body, natal_chart.bodies_dict[body].longitude, near)
+        lat, lon = location if location is not None else (natal_chart.latitude, natal_chart.longitude)
+        label = "Solar" if body == "Sun" else "Lunar"
+        return NatalChart(f"{natal_chart.name} {label} Return", dt_utc, lat, lon, engine=self.engine)
+
+    def solar_return(self, natal_chart: NatalChart, year: int, location: Optional[Location] = None) -> NatalChart:
+        """
+        Build the solar return chart of a year.
+
+        Args:
+            natal_chart: Natal chart whose Sun longitude is returned to
+            year: Year of the return (the one near the birthday in that year)
+            location: (latitude, longitude) to relocate the return chart to
+                      (defaults to the birth place)
+        """
+        birth = natal_chart.datetime_utc
+        try:
+            near = birth.replace(year=year)
+        except ValueError:  # February 29 in a common year
+            near = birth.replace(year=year, month=3, day=1)
+        return self._return_chart("Sun", natal_chart, near, location)
+
+    def lunar_return(self, natal_chart: NatalChart, near: datetime.datetime, location: Optional[Location] = None) -> NatalChart:
+        """Build the lunar return chart closest to near, optionally relocated (see solar_return)."""
+        return self._return_chart("Moon", natal_chart, near, location)
+
+    def return_jds(self, body: str, natal_longitudes: Sequence[float], start: datetime.datetime, end: datetime.datetime) -> List[List[float]]:
+        """
+        Find every return of the body within a date range, for many natal longitudes at once.
+
+        The body's longitude is sampled once over the range (BATCH_SAMPLE_DAYS) and
+        unwrapped into a monotonic track. Each return is bracketed on that track by
+        binary search and polished with Newton iteration, so the ephemeris work per
+        return is about two calls whatever the number of natal longitudes.
+
+        Returns:
+            Sorted Julian days (UT) of the returns of each natal longitude
+        """
+        motion = self._motion(body)
+        if end < start:
+            raise ValueError("end must not be before start")
+        jd_start, jd_end = datetime_to_jd(start), datetime_to_jd(end)
+        step = BATCH_SAMPLE_DAYS[body]
+        count = int((jd_end - jd_start) / step) + 2
+        jds = [jd_start + i * step for i in range(count)]
+        track = []
+        for jd in jds:
+            lon, _ = motion(jd)
+            track.append(lon if not track else track[-1] + (_signed_difference(lon - track[-1] % 360.0)))
+
+        results = []
+        for natal_longitude in natal_longitudes:
+            returns = []
+            # First multiple of the natal longitude on the unwrapped track
+            target = natal_longitude + 360.0 * math.ceil((track[0] - natal_longitude) / 360.0)
+            while target <= track[-1]:
+                i = bisect_left(track, target)
+                if i == 0:
+                    guess = jds[0]
+                else:
+                    fraction = (target - track[i - 1]) / (track[i] - track[i - 1])
+                    guess = jds[i - 1] + fraction * step
+                jd = self.find_return_jd(body, natal_longitude, guess)
+                if jd_start <= jd <= jd_end:
+                    returns.append(jd)
+                target += 360.0
+            results.append(returns)
+        return results
+
+    def returns_batch(self, body: str, natal_charts: Sequence[NatalChart], start: datetime.datetime, end: datetime.datetime, locations: Optional[Union[Location, Sequence[Optional[Location]]]] = None) -> List[List[NatalChart]]:
+        """
+        Build every return chart of many natal charts within a date range.
+
+        Args:
+            body: "Sun" or "Moon"
+            natal_charts: Natal charts to calculate returns for
+            start: Start of the range (UTC)
+            end: End of the range (UTC)
+            locations: One (latitude, longitude) for all charts, or one per chart
+                       (None entries keep the birth place)
+
+        Returns:
+            The return charts of each natal chart, in time order
+        """
+        # An empty list is one location per chart for no charts
+        if locations is None or (len(locations) > 0 and isinstance(locations[0], (int, float))):
+            locations = [locations] * len(natal_charts)
+        if len(locations) != len(natal_charts):
+            raise ValueError("locations must be a single (latitude, longitude) or one per natal chart")
+        all_jds = self.return_jds(body, [chart.bodies_dict[body].longitude for chart in natal_charts], start, end)
+
+        label = "Solar" if body == "Sun" else "Lunar"
+        records, counts = [], []
+        for chart, location, jds in zip(natal_charts, locations, all_jds):
+            lat, lon = location if location is not None else (chart.latitude, chart.longitude)
+            records.extend((f"{chart.name} {label} Return", jd_to_datetime(jd, start.tzinfo), lat, lon) for jd in jds)
+            counts.append(len(jds))
+        # All return charts share the engine's batch path
+        charts = NatalChart.from_many(records, engine=self.engine)
+        grouped, position = [], 0
+        for count in counts:
+            grouped.append(charts[position:position + count])
+            position += count
+        return grouped
+
+    def lunar_returns_batch(self, natal_charts: Sequence[NatalChart], start: datetime.datetime, end: datetime.datetime, locations=None) -> List[List[NatalChart]]:
+        """Build every lunar return chart of many natal charts within a date range (see returns_batch)."""
+        return self.returns_batch("Moon", natal_charts, start, end, locations)
@@ -0,0 +1,198 @@
+# nataly/sign_index.py
+# Precomputed sign ingresses for zodiac sign lookups without ephemeris calls.
+
+import datetime
+import random
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .aspects import np
+from .constants import SIGN_NAMES_BY_DEGREE
+from .context import datetime_to_jd
+from .engine import AstroEngine
+from .events import EventFinder
+from .models import Sign, get_sign
+from .utils import save_to_json, load_from_json
+
+SIGN_INDEX_FORMAT_VERSION = 1
+
+TimeLike = Union[datetime.datetime, float]
+
+
+class SignIndex:
+    """
+    Sorted sign ingress instants per body over a Julian day range.
+
+    The sign of a body at any instant in the range is found by binary search,
+    returning the same Sign as AstroEngine._get_sign_from_longitude without
+    any ephemeris call. Build it once with SignIndex.build and keep it with
+    save/load.
+    """
+
+    def __init__(self, jd_start: float, jd_end: float, initial_signs: Dict[str, int], ingress_jds: Dict[str, List[float]], ingress_signs: Dict[str, List[int]]):
+        """
+        Create an index from its raw tables (see build and load).
+
+        Args:
+            jd_start: First Julian day (UT) covered
+            jd_end: Last Julian day (UT) covered
+            initial_signs: Sign index (0 = Aries) of each body at jd_start
+            ingress_jds: Sorted ingress Julian days of each body
+            ingress_signs: Sign index entered at each ingress
+        """
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self.initial_signs = initial_signs
+        self.ingress_jds = ingress_jds
+        self.ingress_signs = ingress_signs
+        self._signs = [get_sign(name) for name in SIGN_NAMES_BY_DEGREE]
+        self._arrays = {}
+
+    @classmethod
+    def build(cls, start: datetime.datetime, end: datetime.datetime, bodies: Optional[Iterable[str]] = None, engine: Optional[AstroEngine] = None, ephe_path: str = './nataly/ephe') -> 'SignIndex':
+        """
+        Calculate the ingresses of every body over a date range.
+
+        Args:
+            start: Start of the range (UTC)
+            end: End of the range (UTC)
+            bodies: Body names (defaults to every body with an ephemeris of its own, see EventFinder)
+            engine: AstroEngine providing the ephemeris path
+            ephe_path: Path to ephemeris files, when no engine is given
+        """
+        finder = EventFinder(engine, ephe_path)
+        bodies = finder._default_bodies() if bodies is None else list(bodies)
+        jd_start, jd_end = datetime_to_jd(start), datetime_to_jd(end)
+        initial_signs, ingress_jds, ingress_signs = {}, {}, {}
+        for body in bodies:
+            longitude, _ = finder._motion(body)(jd_start)
+            initial_signs[body] = int(longitude / 30)
+            ingress_jds[body], ingress_signs[body] = [], []
+        for event in finder.iter_ingresses(start, end, bodies):
+            ingress_jds[event.body].append(event.jd_ut)
+            ingress_signs[event.body].append(SIGN_NAMES_BY_DEGREE.index(event.sign))
+        return cls(jd_start, jd_end, initial_signs, ingress_jds, ingress_signs)
+
+    @property
+    def bodies(self) -> List[str]:
+        return list(self.initial_signs)
+
+    def _check_body(self, body: str):
+        if body not in self.initial_signs:
+            raise ValueError(f"Body '{body}' is not in the sign index")
+
+    def _to_jd(self, when: TimeLike) -> float:
+        jd = datetime_to_jd(when) if isinstance(when, datetime.datetime) else float(when)
+        if not self.jd_start <= jd <= self.jd_end:
+            raise ValueError(f"Julian day {jd} is outside the sign index range {self.jd_start}-{self.jd_end}")
+        return jd
+
+    def sign_index_at(self, body: str, when: TimeLike) -> int:
+        """Sign index (0 = Aries) of a body at a UTC datetime or Julian day (UT)."""
+        self._check_body(body)
+        jd = self._to_jd(when)
+        position = bisect_right(self.ingress_jds[body], jd)
+        return self.ingress_signs[body][position - 1] if position else self.initial_signs[body]
+
+    def sign_at(self, body: str, when: TimeLike) -> Sign:
+        """Sign of a body at a UTC datetime or Julian day (UT)."""
+        return get_sign(SIGN_NAMES_BY_DEGREE[self.sign_index_at(body, when)])
+
+    def sign_indexes(self, body: str, jds):
+        """
+        Bulk lookup of sign indexes (0 = Aries) for many Julian days (UT).
+
+        Args:
+            body: Body name
+            jds: Julian days (UT), e.g. a NumPy array
+
+        Returns:
+            A NumPy integer array with NumPy installed, otherwise a list
+        """
+        self._check_body(body)
+        if np is None:
+            return [self.sign_index_at(body, jd) for jd in jds]
+        jds = np.asarray(jds, dtype=float)
+        if jds.size and (jds.min() < self.jd_start or jds.max() > self.jd_end):
+            raise ValueError(f"Julian days outside the sign index range {self.jd_start}-{self.jd_end}")
+        arrays = self._arrays.get(body)
+        if arrays is None:
+            arrays = self._arrays[body] = (
+                np.asarray(self.ingress_jds[body], dtype=float),
+                np.asarray([self.initial_signs[body]] + self.ingress_signs[body], dtype=np.intp),
+            )
+        ingress_jds, signs = arrays
+        return signs[np.searchsorted(ingress_jds, jds, side='right')]
+
+    def signs(self, body: str, times: Iterable[TimeLike]) -> List[Sign]:
+        """Bulk lookup of Sign objects for UTC datetimes or Julian days (UT)."""
+        jds = [datetime_to_jd(t) if isinstance(t, datetime.datetime) else t for t in times]
+        return [self._signs[index] for index in self.sign_indexes(body, jds)]
+
+    def validate(self, engine: Optional[AstroEngine] = None, samples: int = 1000, seed: int = 0) -> List[Tuple[str, float, str, str]]:
+        """
+        Compare lookups with the engine's signs at random instants and around every ingress.
+
+        Args:
+            engine: AstroEngine to compare with (defaults to one with the standard ephemeris path)
+            samples: Random instants per body
+            seed: Random seed for the instants
+
+        Returns:
+            (body, jd, engine sign, index sign) for every disagreement; empty when the index is valid
+        """
+        finder = EventFinder(engine)
+        rng = random.Random(seed)
+        mismatches = []
+        for body in self.bodies:
+            motion = finder._motion(body)
+            jds = [rng.uniform(self.jd_start, self.jd_end) for _ in range(samples)]
+            # Just before and after each ingress (about 0.1 s away)
+            for jd in self.ingress_jds[body]:
+                jds.extend(t for t in (jd - 1e-6, jd + 1e-6) if self.jd_start <= t <= self.jd_end)
+            for jd in jds:
+                expected = finder.engine._get_sign_from_longitude(motion(jd)[0]).name
+                found = SIGN_NAMES_BY_DEGREE[self.sign_index_at(body, jd)]
+                if expected != found:
+                    mismatches.append((body, jd, expected, found))
+        return mismatches
+
+    def to_dict(self) -> dict:
+        return {
+            "version": SIGN_INDEX_FORMAT_VERSION,
+            "jd_start": self.jd_start,
+            "jd_end": self.jd_end,
+            "bodies": {
+                body: {
+                    "initial_sign": self.initial_signs[body],
+                    "ingress_jds": self.ingress_jds[body],
+                    "ingress_signs": self.ingress_signs[body],
+                }
+                for body in self.bodies
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SignIndex':
+        if data.get("version") != SIGN_INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported sign index format version: {data.get('version')}")
+        bodies = data["bodies"]
+        return cls(
+            data["jd_start"], data["jd_end"],
+            {body: entry["initial_sign"] for body, entry in bodies.items()},
+            {body: entry["ingress_jds"] for body, entry in bodies.items()},
+            {body: entry["ingress_signs"] for body, entry in bodies.items()},
+        )
+
+    def save(self, filepath: Union[str, Path]) -> bool:
+        """Save the index to a JSON file; returns True if successful."""
+        return save_to_json(self.to_dict(), filepath, indent=None)
+
+    @classmethod
+    def load(cls, filepath: Union[str, Path]) -> 'SignIndex':
+        """Load an index saved with save."""
+        data = load_from_json(filepath)
+        if data is None:
+            raise ValueError(f"Could not load sign index from {filepath}")
+        return cls.from_dict(data)
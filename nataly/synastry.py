@@ -0,0 +1,251 @@
+# nataly/synastry.py
+# Aspects between one natal chart and many candidate charts in one pass.
+
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .aspects import AspectTable, visited_pairs, np
+from .chart import NatalChart
+from .models import Body
+from .config import create_orb_config
+
+# (natal body, candidate body, aspect type, orb, is_applying)
+SynastryAspect = Tuple[str, str, str, float, bool]
+
+PositionSource = Union[NatalChart, Dict[str, Body], Dict[str, float]]
+
+
+def _longitudes(source: PositionSource) -> Dict[str, float]:
+    """Body longitudes by name from a chart, a bodies dict or a name -> longitude dict."""
+    if isinstance(source, NatalChart):
+        source = source.bodies_dict
+    return {
+        name: value.longitude if isinstance(value, Body) else float(value)
+        for name, value in source.items()
+    }
+
+
+def stack_positions(charts: Iterable[PositionSource], body_names: Sequence[str]):
+    """
+    Stack candidate longitudes into rows aligned with body_names.
+
+    Bodies missing from a candidate are filled with NaN, which never forms an aspect;
+    the other pairs of that candidate are unchanged.
+
+    Args:
+        charts: NatalCharts, bodies dicts or name -> longitude dicts
+        body_names: Column order of the stacked rows
+
+    Returns:
+        A (candidates, bodies) NumPy array, or a list of row lists without NumPy
+    """
+    nan = float("nan")
+    rows = []
+    for chart in charts:
+        longitudes = _longitudes(chart)
+        rows.append([longitudes.get(name, nan) for name in body_names])
+    if np is not None:
+        return np.array(rows, dtype=float).reshape(len(rows), len(body_names))
+    return rows
+
+
+class SynastryBatch:
+    """
+    Aspects between one natal chart and a stack of candidate charts.
+
+    Pairs are taken like AstroEngine.get_aspects(natal_bodies, candidate_bodies)
+    (or get_aspects(candidate_bodies, natal_bodies) with natal_first=False), so the
+    aspects found for a candidate are the same, but the body pairs and their orb
+    buckets are prepared once for the whole batch and results are plain tuples
+    instead of Aspect objects. With all_pairs every natal and candidate body
+    pair is checked, in both orders and including a body with itself, as
+    transits and progressions to a natal chart need.
+    """
+
+    def __init__(self, natal: PositionSource, body_names: Sequence[str], orb_config=None, vectorized: Optional[bool] = None, natal_first: bool = True, table: Optional[AspectTable] = None, all_pairs: bool = False):
+        """
+        Prepare the batch for one natal chart.
+
+        Args:
+            natal: NatalChart, bodies dict or name -> longitude dict of the natal chart
+            body_names: Column order of the candidate position rows
+            orb_config: OrbConfig object or dict for orb settings (defaults to the standard orbs)
+            vectorized: Use the NumPy kernel (True), the pure-Python kernel (False) or
+                        NumPy when it is installed (None)
+            natal_first: Natal bodies are body1 of each pair (True) or body2 (False, e.g.
+                         transits listed before natal bodies)
+            table: Compiled AspectTable to reuse (e.g. engine.aspect_table); takes
+                   precedence over orb_config
+            all_pairs: Check the full natal x candidate cross product (True) instead of
+                       the pairs get_aspects visits (False), which skip same-name pairs
+                       and each unordered pair of names after its first visit
+        """
+        if table is None:
+            table = AspectTable(orb_config if orb_config is not None else create_orb_config())
+        if vectorized is None:
+            vectorized = np is not None
+        elif vectorized and np is None:
+            raise ImportError("NumPy is required for vectorized aspect calculation (pip install numpy)")
+
+        natal_longitudes = _longitudes(natal)
+        self.natal_names = list(natal_longitudes)
+        self.natal_longitudes = list(natal_longitudes.values())
+        self.body_names = list(body_names)
+        self.vectorized = vectorized
+        self.natal_first = natal_first
+        self.table = table
+        self.aspect_names = table.aspect_names
+
+        natal_indexes = [table.index_of(name) for name in self.natal_names]
+        body_indexes = [table.index_of(name) for name in self.body_names]
+        # Pure-Python kernel: (natal index, column, natal longitude, degree buckets) per pair
+        if all_pairs:
+            self._pairs = [
+                (i, j, self.natal_longitudes[i], table.candidates[natal_indexes[i]][body_indexes[j]])
+                for i in range(len(self.natal_names)) for j in range(len(self.body_names))
+            ] if natal_first else [
+                (i, j, self.natal_longitudes[i], table.candidates[body_indexes[j]][natal_indexes[i]])
+                for j in range(len(self.body_names)) for i in range(len(self.natal_names))
+            ]
+        elif natal_first:
+            self._pairs = [
+                (i, j, self.natal_longitudes[i], table.candidates[natal_indexes[i]][body_indexes[j]])
+                for i, j in visited_pairs(self.natal_names, self.body_names)
+            ]
+        else:
+            self._pairs = [
+                (i, j, self.natal_longitudes[i], table.candidates[body_indexes[j]][natal_indexes[i]])
+                for j, i in visited_pairs(self.body_names, self.natal_names)
+            ]
+        if vectorized:
+            pair_natal = np.array([natal_indexes[i] for i, _, _, _ in self._pairs], dtype=np.intp)
+            pair_body = np.array([body_indexes[j] for _, j, _, _ in self._pairs], dtype=np.intp)
+            first, second = (pair_natal, pair_body) if natal_first else (pair_body, pair_natal)
+            self._bucket_k, self._bucket_angle, self._bucket_orb = (array[first, second] for array in table.bucket_arrays)
+            self._pair_rows = np.array([i for i, _, _, _ in self._pairs], dtype=np.intp)
+            self._pair_cols = np.array([j for _, j, _, _ in self._pairs], dtype=np.intp)
+            self._pair_natal = np.array([lon for _, _, lon, _ in self._pairs], dtype=float)
+
+    def _match_arrays(self, rows):
+        """NumPy kernel: (candidate, natal index, column, aspect index, orb_diff) hit arrays of a chunk."""
+        lons = np.asarray(rows, dtype=float).reshape(len(rows), len(self.body_names))
+        diff = np.abs(self._pair_natal - lons[:, self._pair_cols])
+        diff = np.minimum(diff, 360 - diff)
+        valid = ~np.isnan(diff)
+        degree = np.where(valid, diff, 0).astype(np.intp)
+        pair_index = np.arange(len(self._pairs))[None, :]
+        orb_diff = diff[:, :, None] - self._bucket_angle[pair_index, degree]
+        within = (np.abs(orb_diff) <= self._bucket_orb[pair_index, degree]) & valid[:, :, None]
+        # The first aspect within orb in strength order is the resolved aspect
+        hit_c, hit_p = np.nonzero(within.any(axis=2))
+        hit_b = within[hit_c, hit_p].argmax(axis=1)
+        ks = self._bucket_k[hit_p, degree[hit_c, hit_p], hit_b]
+        return hit_c, self._pair_rows[hit_p], self._pair_cols[hit_p], ks, orb_diff[hit_c, hit_p, hit_b]
+
+    def _match_chunk(self, rows) -> List[List[Tuple[int, int, int, float]]]:
+        """Return (natal index, column, aspect index, orb_diff) hits per row of a chunk."""
+        if self.vectorized:
+            hit_c, hit_i, hit_j, ks, orbs = self._match_arrays(rows)
+            bounds = np.searchsorted(hit_c, np.arange(len(rows) + 1)).tolist()
+            hits = list(zip(hit_i.tolist(), hit_j.tolist(), ks.tolist(), orbs.tolist()))
+            return [hits[bounds[c]:bounds[c + 1]] for c in range(len(rows))]
+
+        if np is not None and isinstance(rows, np.ndarray):
+            rows = rows.tolist()
+        results = []
+        for row in rows:
+            hits = []
+            for i, j, natal_lon, buckets in self._pairs:
+                lon = row[j]
+                if lon != lon:  # NaN: body missing from this candidate
+                    continue
+                diff = abs(natal_lon - lon)
+                angular_diff = min(diff, 360 - diff)
+                for k, angle, orb_limit in buckets[int(angular_diff)]:
+                    orb_diff = angular_diff - angle
+                    if abs(orb_diff) <= orb_limit:
+                        hits.append((i, j, k, orb_diff))
+                        break
+            results.append(hits)
+        return results
+
+    def _chunks(self, candidates, chunk_size: int) -> Iterator[list]:
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if np is not None and isinstance(candidates, np.ndarray):
+            for start in range(0, len(candidates), chunk_size):
+                yield candidates[start:start + chunk_size]
+            return
+        iterator = iter(candidates)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def iter_aspects(self, candidates, chunk_size: int = 1024) -> Iterator[List[SynastryAspect]]:
+        """
+        Stream the aspects of each candidate, chunk_size candidates at a time.
+
+        Args:
+            candidates: Rows of longitudes aligned with body_names (a 2D array, a list
+                        or any iterable, e.g. a generator reading from a database)
+            chunk_size: Number of candidates processed per step; memory use is bounded
+                        by the chunk, not by the number of candidates
+
+        Yields:
+            One list of (natal body, candidate body, aspect type, orb, is_applying)
+            tuples per candidate, in input order (candidate body first with
+            natal_first=False)
+        """
+        natal_names, body_names, aspect_names = self.natal_names, self.body_names, self.aspect_names
+        for chunk in self._chunks(candidates, chunk_size):
+            for hits in self._match_chunk(chunk):
+                if self.natal_first:
+                    yield [
+                        (natal_names[i], body_names[j], aspect_names[k], orb_diff, orb_diff < 0)
+                        for i, j, k, orb_diff in hits
+                    ]
+                else:
+                    yield [
+                        (body_names[j], natal_names[i], aspect_names[k], orb_diff, orb_diff < 0)
+                        for i, j, k, orb_diff in hits
+                    ]
+
+    def aspects(self, candidates, chunk_size: int = 1024) -> List[List[SynastryAspect]]:
+        """Return the aspect tuples of every candidate (see iter_aspects)."""
+        return list(self.iter_aspects(candidates, chunk_size))
+
+    def iter_scores(self, candidates, weights: Optional[Dict[str, float]] = None, chunk_size: int = 1024) -> Iterator[float]:
+        """
+        Stream one compatibility score per candidate.
+
+        Args:
+            candidates: Rows of longitudes aligned with body_names
+            weights: Score per aspect type (defaults to 1 for every aspect, i.e. the
+                     number of aspects); aspect types not listed score 0
+            chunk_size: Number of candidates processed per step
+
+        Yields:
+            The summed aspect weights of each candidate, in input order
+        """
+        if weights is None:
+            weight_by_index = [1.0] * len(self.aspect_names)
+        else:
+            unknown = set(weights) - set(self.aspect_names)
+            if unknown:
+                raise ValueError(f"Unknown aspect types: {sorted(unknown)}")
+            weight_by_index = [float(weights.get(name, 0.0)) for name in self.aspect_names]
+        if self.vectorized:
+            weight_array = np.asarray(weight_by_index)
+        for chunk in self._chunks(candidates, chunk_size):
+            if self.vectorized:
+                hit_c, _, _, ks, _ = self._match_arrays(chunk)
+                yield from np.bincount(hit_c, weights=weight_array[ks], minlength=len(chunk)).tolist()
+                continue
+            for hits in self._match_chunk(chunk):
+                yield sum((weight_by_index[k] for _, _, k, _ in hits), 0.0)
+
+    def scores(self, candidates, weights: Optional[Dict[str, float]] = None, chunk_size: int = 1024) -> List[float]:
+        """Return the score of every candidate (see iter_scores)."""
+        return list(self.iter_scores(candidates, weights, chunk_size))
@@ -0,0 +1,127 @@
+# nataly/transits.py
+# Transit positions over a date range, computed once and shared by many natal charts.
+
+import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import swisseph as swe
+
+from .aspects import np
+from .constants import PLANET_MAPPING_SWE
+from .context import datetime_to_jd
+from .engine import AstroEngine, resolve_body_selection
+from .synastry import SynastryBatch, SynastryAspect, PositionSource
+
+
+class TransitTimeline:
+    """
+    Transiting body positions for every step of a date range, as arrays.
+
+    Positions are calculated once per step with the engine's body mapping
+    (PLANET_MAPPING_SWE). Chart angles depend on a location and are not part of
+    the timeline. Any number of natal charts can then be matched against the
+    timeline; every transit and natal body pair is checked, so returns (e.g.
+    transiting Saturn to natal Saturn) and both transit X to natal Y and
+    transit Y to natal X are reported.
+    """
+
+    def __init__(self, start: datetime.datetime, end: datetime.datetime, step: datetime.timedelta = datetime.timedelta(days=1), bodies: Optional[Iterable[str]] = None, engine: Optional[AstroEngine] = None, orb_config=None, ephe_path: str = './nataly/ephe'):
+        """
+        Calculate the timeline.
+
+        Args:
+            start: First instant (UTC)
+            end: Last instant (UTC), included when it falls on a step
+            step: Time between two instants
+            bodies: Body names and/or ASTROLOGICAL_BODY_GROUPS keys to calculate
+                    (defaults to the engine's selection without chart angles)
+            engine: AstroEngine providing the orbs, ephemeris path and cache
+            orb_config: OrbConfig object or dict for orb settings, when no engine is given
+            ephe_path: Path to ephemeris files, when no engine is given
+        """
+        if step <= datetime.timedelta(0):
+            raise ValueError(f"step must be positive, got {step}")
+        if end < start:
+            raise ValueError("end must not be before start")
+        if engine is None:
+            engine = AstroEngine(orb_config, ephe_path)
+        self.engine = engine
+        selection = engine.body_names if bodies is None else resolve_body_selection(bodies)
+        self.body_names = [name for name in selection if name not in engine.chart_angles]
+
+        count = int((end - start) / step) + 1
+        self.times = [start + i * step for i in range(count)]
+        self.jds = [datetime_to_jd(t) for t in self.times]
+        longitudes, speeds = [], []
+        for jd in self.jds:
+            positions = self._positions_at(jd)
+            longitudes.append([positions.get(name, (float("nan"),) * 2)[0] for name in self.body_names])
+            speeds.append([positions.get(name, (float("nan"),) * 2)[1] for name in self.body_names])
+        if np is not None:
+            shape = (count, len(self.body_names))
+            self.longitudes = np.array(longitudes, dtype=float).reshape(shape)
+            self.speeds = np.array(speeds, dtype=float).reshape(shape)
+        else:
+            self.longitudes = longitudes
+            self.speeds = speeds
+
+    def _positions_at(self, jd: float) -> Dict[str, Tuple[float, float]]:
+        """(longitude, speed) of each timeline body at one Julian day."""
+        positions = {}
+        for name in self.body_names:
+            if name == "South Node":
+                if "True Node" in positions:
+                    node_lon, node_speed = positions["True Node"]
+                    positions[name] = ((node_lon + 180) % 360, node_speed)
+                continue
+            planet_id = PLANET_MAPPING_SWE.get(name)
+            if planet_id is None:
+                continue
+            try:
+                ecl_output, _ = self.engine._calc_ut(jd, planet_id, swe.FLG_SPEED)
+            except Exception:
+                continue
+            positions[name] = (ecl_output[0], ecl_output[3])
+        return positions
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def positions_at(self, index: int) -> Dict[str, float]:
+        """Body longitudes by name at one step."""
+        return {
+            name: float(lon) for name, lon in zip(self.body_names, self.longitudes[index])
+            if lon == lon
+        }
+
+    def matcher(self, natal: PositionSource) -> SynastryBatch:
+        """Prepare the aspect matching of one natal chart against the timeline."""
+        return SynastryBatch(natal, self.body_names, natal_first=False, table=self.engine.aspect_table, all_pairs=True)
+
+    def iter_aspects(self, natal: PositionSource, chunk_size: int = 1024) -> Iterator[Tuple[datetime.datetime, List[SynastryAspect]]]:
+        """
+        Stream the transit-to-natal aspects of every step.
+
+        Args:
+            natal: NatalChart, bodies dict or name -> longitude dict
+            chunk_size: Number of steps processed at a time
+
+        Yields:
+            (time, aspects) per step, where aspects are (transit body, natal body,
+            aspect type, orb, is_applying) tuples
+        """
+        return zip(self.times, self.matcher(natal).iter_aspects(self.longitudes, chunk_size))
+
+    def aspects(self, natal: PositionSource, chunk_size: int = 1024) -> List[List[SynastryAspect]]:
+        """Return the transit-to-natal aspect tuples of every step (see iter_aspects)."""
+        return self.matcher(natal).aspects(self.longitudes, chunk_size)
+
+    def evaluate(self, natals: Iterable[PositionSource], chunk_size: int = 1024) -> Iterator[List[List[SynastryAspect]]]:
+        """
+        Match many natal charts against the timeline without new ephemeris calls.
+
+        Yields:
+            The per-step aspect lists of each natal chart, in input order
+        """
+        for natal in natals:
+            yield self.aspects(natal, chunk_size)
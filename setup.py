@@ -34,6 +34,9 @@ setup(
     python_requires=">=3.7",
     install_requires=requirements,
     extras_require={
+        "fast": [
+            "numpy>=1.20.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
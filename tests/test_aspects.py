@@ -0,0 +1,171 @@
+"""
+Tests for the compiled aspect tables of the nataly library.
+"""
+
+import copy
+import datetime
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, create_orb_config
+from nataly.aspects import AspectTable, np
+from nataly.constants import ALL_BODY_NAMES, ASPECT_DATA, ASPECT_STRENGTH
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+
+def resolve_aspect_conflicts(valid_aspects):
+    """
+    Oracle for the compiled tables: the per-pair resolution of Astrodienst logic.
+    The strongest aspect within orb wins, the smallest orb within one strength.
+    """
+    if not valid_aspects:
+        return None
+    return min(valid_aspects, key=lambda x: (ASPECT_STRENGTH.get(x[0], 99), abs(x[2])))
+
+
+def reference_aspect(engine, name1, name2, angular_diff):
+    """Resolves an aspect with the per-aspect orb lookup and conflict resolution."""
+    valid_aspects = []
+    for aspect_name, aspect_data in ASPECT_DATA.items():
+        orb_diff = angular_diff - aspect_data["angle"]
+        if abs(orb_diff) <= engine._get_categorized_orb(aspect_name, name1, name2):
+            valid_aspects.append((aspect_name, aspect_data, orb_diff))
+    best = resolve_aspect_conflicts(valid_aspects)
+    return (best[0], best[2]) if best else None
+
+
+class TestAspectTable:
+    """Test cases for AspectTable."""
+
+    @pytest.mark.parametrize("system", ["Default", "Classical"])
+    def test_matches_reference_resolution(self, system):
+        """Table lookups agree with per-aspect resolution for every pair."""
+        engine = AstroEngine(create_orb_config(system), ephe_path=ephe_path)
+        table = engine.aspect_table
+        rng = random.Random(42)
+        diffs = [rng.uniform(0, 180) for _ in range(40)] + [0.0, 30.0, 45.0, 60.0, 90.0, 180.0]
+        for name1 in ALL_BODY_NAMES:
+            for name2 in ALL_BODY_NAMES:
+                if name1 == name2:
+                    continue
+                for diff in diffs:
+                    rows = engine._aspect_rows([name1, name2], [0.0, diff])
+                    result = (table.aspect_names[rows[0][2]], rows[0][3]) if rows else None
+                    assert result == reference_aspect(engine, name1, name2, diff)
+
+    def test_unknown_bodies_are_added(self):
+        """Bodies outside ALL_BODY_NAMES get rows on first use."""
+        table = AspectTable(create_orb_config())
+        size = len(table.body_index)
+        k, angle, orb = table.candidates[table.index_of("Eris")][table.index_of("Sun")][0][0]
+        assert len(table.body_index) == size + 1
+        assert table.aspect_names[k] == "Conjunction" and angle == 0 and orb > 0.5
+        assert all(len(row) == size + 1 for row in table.orbs)
+
+    def test_engine_recompiles_on_new_orb_config(self):
+        """Replacing orb_config on an engine rebuilds its table."""
+        engine = AstroEngine(create_orb_config('Default'), ephe_path=ephe_path)
+        chart = NatalChart("Test", datetime.datetime(1990, 2, 27, 7, 15), 38.4167, 27.150, engine=engine)
+        default_count = len(engine.get_aspects(chart.bodies_dict))
+        engine.orb_config = create_orb_config('Classical')
+        assert engine.aspect_table.orb_config is engine.orb_config
+        assert len(engine.get_aspects(chart.bodies_dict)) < default_count
+
+    def test_engine_recompiles_on_orb_config_edited_in_place(self):
+        """Orbs changed inside the engine's orb_config dict take effect when it is assigned again."""
+        orb_config = copy.deepcopy(create_orb_config('Default'))
+        engine = AstroEngine(orb_config, ephe_path=ephe_path)
+        chart = NatalChart("Test", datetime.datetime(1990, 2, 27, 7, 15), 38.4167, 27.150, engine=engine)
+        assert len(chart.aspects) > 0
+        table = engine.aspect_table
+        engine.orb_config = orb_config
+        assert engine.aspect_table is table
+        for orbs in orb_config.values():
+            for orb_type in orbs:
+                orbs[orb_type] = 0
+        assert engine.aspect_table is table
+        engine.orb_config = orb_config
+        exact = engine.get_aspects(chart.bodies_dict)
+        assert all(a.orb == 0 for a in exact)
+        assert len(exact) < len(chart.aspects)
+
+
+
+def aspect_keys(aspects):
+    return [(a.body1.name, a.body2.name, a.aspect_type, a.symbol, a.orb, a.is_applying) for a in aspects]
+
+
+@pytest.mark.skipif(np is None, reason="NumPy is not installed")
+class TestVectorizedAspects:
+    """Test cases for the NumPy aspect kernel."""
+
+    def setup_method(self):
+        self.engine = AstroEngine(ephe_path=ephe_path)
+        start = datetime.datetime(1950, 1, 1)
+        self.charts = [
+            NatalChart(f"P{i}", start + datetime.timedelta(days=i * 911.3), -40 + i * 7, -150 + i * 23, engine=self.engine)
+            for i in range(12)
+        ]
+
+    def test_single_chart_identical(self):
+        """Vectorized aspects within one chart equal the pure-Python ones."""
+        for chart in self.charts:
+            assert aspect_keys(self.engine.get_aspects(chart.bodies_dict, vectorized=True)) == \
+                aspect_keys(self.engine.get_aspects(chart.bodies_dict, vectorized=False))
+
+    def test_chart_vs_chart_identical(self):
+        """Vectorized chart-vs-chart aspects equal the pure-Python ones, including partial overlaps."""
+        for chart1, chart2 in zip(self.charts, self.charts[1:]):
+            subset = dict(list(chart2.bodies_dict.items())[3:14])
+            for bodies1, bodies2 in [(chart1.bodies_dict, chart2.bodies_dict), (chart1.bodies_dict, subset), (subset, chart1.bodies_dict)]:
+                assert aspect_keys(self.engine.get_aspects(bodies1, bodies2, vectorized=True)) == \
+                    aspect_keys(self.engine.get_aspects(bodies1, bodies2, vectorized=False))
+
+    def test_pure_python_fallback(self, monkeypatch):
+        """Without NumPy the automatic choice falls back to the pure-Python kernel."""
+        import nataly.engine
+        chart1, chart2 = self.charts[:2]
+        expected = aspect_keys(self.engine.get_aspects(chart1.bodies_dict, chart2.bodies_dict))
+        monkeypatch.setattr(nataly.engine, "np", None)
+        assert aspect_keys(self.engine.get_aspects(chart1.bodies_dict, chart2.bodies_dict)) == expected
+        with pytest.raises(ImportError):
+            self.engine.get_aspects(chart1.bodies_dict, chart2.bodies_dict, vectorized=True)
+
+    def test_empty(self):
+        """Empty body sets give no aspects."""
+        assert self.engine.get_aspects({}, self.charts[0].bodies_dict, vectorized=True) == []
+
+    def test_batch_identical(self, monkeypatch):
+        """Aspects of many charts found together equal the per-chart ones, across chunks and body selections."""
+        import nataly.aspects
+        monkeypatch.setattr(nataly.aspects, "BATCH_CHUNK_CHARTS", 5)
+        records = [(chart.name, chart.datetime_utc, chart.latitude, chart.longitude) for chart in self.charts]
+        for bodies in [None, ["luminaries", "chart_angles", "Mars"]]:
+            charts = NatalChart.from_many(records, ephe_path=ephe_path, bodies=bodies)
+            assert all(chart._block[0].aspects is not None for chart in charts)
+            for chart in charts:
+                assert aspect_keys(chart.aspects) == aspect_keys(self.engine.get_aspects(chart.bodies_dict, vectorized=False))
+        offsets, *columns = nataly.aspects.find_aspects_batch(self.engine.aspect_table, ["Sun"], [[1.0], [2.0]])
+        assert offsets.tolist() == [0, 0, 0] and all(len(column) == 0 for column in columns)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
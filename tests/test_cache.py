@@ -0,0 +1,93 @@
+"""
+Tests for the ephemeris cache of the nataly library.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, EphemerisCache
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+
+class TestEphemerisCache:
+    """Test cases for EphemerisCache."""
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = EphemerisCache(maxsize=2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 99)  # Hit, "a" becomes most recent
+        cache.get_or_compute("c", lambda: 3)   # Evicts "b"
+        assert len(cache) == 2
+        assert cache.get_or_compute("a", lambda: 99) == 1
+        assert cache.get_or_compute("b", lambda: 22) == 22
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 4
+        assert stats["evictions"] == 2
+
+    def test_invalid_size(self):
+        """A non-positive maxsize is rejected."""
+        with pytest.raises(ValueError):
+            EphemerisCache(maxsize=0)
+
+    def test_quantized_jd(self):
+        """Instants within the resolution share an entry."""
+        cache = EphemerisCache(jd_resolution=1e-5)
+        first = cache.calc_ut(2451545.0, 0, 256)
+        assert cache.calc_ut(2451545.0 + 1e-7, 0, 256) is first
+        assert cache.calc_ut(2451545.0 + 1e-3, 0, 256) is not first
+        assert cache.stats()["hits"] == 1
+
+    def test_engine_with_cache(self):
+        """A cached engine returns the same chart and hits on repeated instants."""
+        dt_utc = datetime.datetime(1990, 2, 27, 7, 15)
+        cache = EphemerisCache()
+        cached_engine = AstroEngine(ephe_path=ephe_path, cache=cache)
+        expected, expected_houses = AstroEngine(ephe_path=ephe_path).get_planets_and_houses(dt_utc, 38.4167, 27.150)
+
+        bodies, houses = cached_engine.get_planets_and_houses(dt_utc, 38.4167, 27.150)
+        misses = cache.stats()["misses"]
+        assert cache.stats()["hits"] == 0
+        bodies, houses = cached_engine.get_planets_and_houses(dt_utc, 38.4167, 27.150)
+        assert cache.stats()["misses"] == misses
+        assert cache.stats()["hits"] == misses
+
+        assert {n: (b.longitude, b.declination) for n, b in bodies.items()} == \
+            {n: (b.longitude, b.declination) for n, b in expected.items()}
+        assert [h.cusp_longitude for h in houses] == [h.cusp_longitude for h in expected_houses]
+
+        # Another location at the same instant only misses on the houses
+        cached_engine.get_planets_and_houses(dt_utc, 51.5074, -0.1278)
+        assert cache.stats()["misses"] == misses + 1
+
+    def test_clear(self):
+        """clear() empties the cache and resets statistics."""
+        cache = EphemerisCache()
+        cache.calc_ut(2451545.0, 0, 256)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats()["misses"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
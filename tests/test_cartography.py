@@ -0,0 +1,110 @@
+"""
+Tests for the astrocartography lines of the nataly library.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+import swisseph as swe
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, AstroCartography
+from nataly.context import datetime_to_jd
+
+np = pytest.importorskip("numpy")
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+DT = datetime.datetime(1990, 2, 27, 7, 15)
+
+
+def separation(lon1, lon2):
+    return abs((lon1 - lon2 + 180) % 360 - 180)
+
+
+class TestAstroCartography:
+    """Test cases for AstroCartography."""
+
+    def setup_method(self):
+        self.engine = AstroEngine(ephe_path=ephe_path)
+        self.jd = datetime_to_jd(DT)
+        self.map = AstroCartography(DT, engine=self.engine)
+
+    def test_sun_lines_match_houses(self):
+        """On the Sun's lines, swe.houses puts the matching angle on the Sun."""
+        sun = self.map.body_names.index("Sun")
+        sun_longitude = self.engine._calc_ut(self.jd, swe.SUN, swe.FLG_SPEED)[0][0]
+        latitudes = [-50.0, -20.0, 0.0, 35.0, 60.0]
+        lines = self.map.line_longitudes(latitudes)
+        for k, lat in enumerate(latitudes):
+            for angle in ("AC", "MC", "IC", "DC"):
+                _, ascmc = swe.houses(self.jd, lat, float(lines[angle][sun, k]), b'P')
+                points = {"AC": ascmc[0], "MC": ascmc[1], "IC": ascmc[1] + 180, "DC": ascmc[0] + 180}
+                assert separation(points[angle], sun_longitude) < 5e-3
+
+    def test_meridian_is_right_ascension(self):
+        for i in range(len(self.map.body_names)):
+            lon = float(self.map.meridian_longitudes()[i])
+            _, ascmc = swe.houses(self.jd, 10.0, lon, b'P')
+            assert separation(ascmc[2], self.map.right_ascensions[i]) < 1e-6
+
+    def test_circumpolar_latitudes(self):
+        moon = self.map.body_names.index("Moon")
+        limit = 90 - abs(self.map.declinations[moon])
+        rising, setting = self.map.horizon_longitudes(np.array([limit - 1, limit + 1, -limit - 1]))
+        assert not np.isnan(rising[moon, 0]) and not np.isnan(setting[moon, 0])
+        assert np.isnan(rising[moon, 1:]).all() and np.isnan(setting[moon, 1:]).all()
+
+    def test_polylines(self):
+        lines = self.map.lines(lat_step=2.0, max_latitude=80.0)
+        assert set(lines) == set(self.map.body_names)
+        for angles in lines.values():
+            assert set(angles) == {"AC", "MC", "IC", "DC"}
+            for polylines in angles.values():
+                assert polylines
+                for polyline in polylines:
+                    assert polyline.shape[1] == 2
+                    assert (np.abs(np.diff(polyline[:, 0])) < 180).all()
+                    assert (np.abs(polyline[:, 1]) <= 80).all()
+            # Meridian lines are straight
+            assert len(angles["MC"]) == 1 and np.ptp(angles["MC"][0][:, 0]) == 0
+
+    def test_distance_grid_and_angular_bodies(self):
+        latitudes, longitudes = np.arange(-60, 61, 10), np.arange(-180, 180, 5)
+        grid = self.map.distance_grid(latitudes, longitudes)
+        assert grid["AC"].shape == (len(self.map.body_names), len(latitudes), len(longitudes))
+        assert np.nanmax(grid["MC"]) <= 180
+        sun = self.map.body_names.index("Sun")
+        lon = float(self.map.meridian_longitudes()[sun]) + 0.5
+        found = self.map.angular_bodies(40.0, lon, orb=1.0)
+        assert found[0][:2] == ("Sun", "MC")
+        assert found[0][2] == pytest.approx(0.5)
+        assert all(distance <= 1.0 for _, _, distance in found)
+
+    def test_south_node_opposes_true_node(self):
+        north, south = self.map.body_names.index("True Node"), self.map.body_names.index("South Node")
+        assert separation(self.map.right_ascensions[north] + 180, self.map.right_ascensions[south]) < 1e-9
+        assert self.map.declinations[south] == pytest.approx(-self.map.declinations[north])
+        only_south = AstroCartography(DT, bodies=["South Node"], engine=self.engine)
+        assert only_south.right_ascensions[0] == pytest.approx(self.map.right_ascensions[south])
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            AstroCartography(DT, bodies=["AC"], engine=self.engine)
+        with pytest.raises(ValueError):
+            self.map.lines(lat_step=0)
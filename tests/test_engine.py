@@ -0,0 +1,425 @@
+"""
+Tests for the AstroEngine calculation paths of the nataly library.
+"""
+
+import datetime
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import NatalChart, AstroEngine, ParallelAstroEngine, JDContext, BodyFilter
+from nataly.config import ORB_CONFIGS
+from nataly.engine import resolve_body_selection
+from nataly.aspects import np
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+
+RECORDS = [
+    ("Joe Doe", datetime.datetime(1990, 2, 27, 7, 15), 38.4167, 27.150),
+    ("Jane Doe", datetime.datetime(1985, 7, 4, 18, 30), 40.7128, -74.0060),
+    ("John Roe", datetime.datetime(2001, 11, 15, 3, 5), -33.8688, 151.2093),
+]
+
+
+def aspect_keys(aspects):
+    return [(a.body1.name, a.body2.name, a.aspect_type, a.symbol, a.orb, a.is_applying) for a in aspects]
+
+
+def assert_same_chart(chart1, chart2):
+    """Asserts that two charts hold the same positions, houses and aspects."""
+    assert list(chart1.bodies_dict) == list(chart2.bodies_dict)
+    for name, body in chart1.bodies_dict.items():
+        other = chart2.bodies_dict[name]
+        assert body.longitude == other.longitude
+        assert body.house == other.house
+        assert body.sign.name == other.sign.name
+    assert [h.cusp_longitude for h in chart1.houses] == [h.cusp_longitude for h in chart2.houses]
+    assert [(a.body1.name, a.body2.name, a.aspect_type, a.orb) for a in chart1.aspects] == \
+        [(a.body1.name, a.body2.name, a.aspect_type, a.orb) for a in chart2.aspects]
+
+
+class TestBatch:
+    """Test cases for the batch chart API."""
+
+    def test_compute_batch(self):
+        """compute_batch returns one (bodies, houses) pair per record."""
+        engine = AstroEngine(ephe_path=ephe_path)
+        results = engine.compute_batch(RECORDS)
+        assert len(results) == len(RECORDS)
+        for (_, dt_utc, lat, lon), (bodies_dict, houses) in zip(RECORDS, results):
+            expected_bodies, expected_houses = engine.get_planets_and_houses(dt_utc, lat, lon)
+            assert {n: b.longitude for n, b in bodies_dict.items()} == \
+                {n: b.longitude for n, b in expected_bodies.items()}
+            assert [(h.id, h.cusp_longitude) for h in houses] == \
+                [(h.id, h.cusp_longitude) for h in expected_houses]
+
+    def test_from_many_matches_single_charts(self):
+        """NatalChart.from_many builds the same charts as individual construction."""
+        charts = NatalChart.from_many(RECORDS, ephe_path=ephe_path)
+        assert len(charts) == len(RECORDS)
+        for (name, dt_utc, lat, lon), chart in zip(RECORDS, charts):
+            assert chart.name == name
+            assert_same_chart(chart, NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path))
+
+    def test_shared_engine(self):
+        """Charts built from a shared engine reference that engine."""
+        engine = AstroEngine(ephe_path=ephe_path)
+        charts = NatalChart.from_many(RECORDS, engine=engine)
+        assert all(chart.engine is engine for chart in charts)
+        name, dt_utc, lat, lon = RECORDS[0]
+        assert NatalChart(name, dt_utc, lat, lon, engine=engine).engine is engine
+
+
+
+class TestJDContext:
+    """Test cases for the per-instant JDContext."""
+
+    def test_from_datetime(self):
+        """The context holds consistent time and obliquity values."""
+        context = JDContext.from_datetime(datetime.datetime(2000, 1, 1, 12, 0))
+        assert context.jd_ut == pytest.approx(2451545.0)
+        assert context.jd_et == pytest.approx(context.jd_ut + context.delta_t)
+        assert 60 / 86400 < context.delta_t < 70 / 86400
+        assert context.true_obliquity == pytest.approx(context.mean_obliquity + context.nutation_obliquity)
+        assert context.mean_obliquity == pytest.approx(84381.406 / 3600, abs=1e-6)
+
+    def test_timezone_and_seconds(self):
+        """Aware datetimes are converted to UTC and seconds are not dropped."""
+        naive = JDContext.from_datetime(datetime.datetime(1990, 2, 27, 7, 15, 30))
+        aware = JDContext.from_datetime(datetime.datetime(
+            1990, 2, 27, 9, 15, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+        ))
+        assert aware.jd_ut == naive.jd_ut
+        assert naive.jd_ut - JDContext.from_datetime(datetime.datetime(1990, 2, 27, 7, 15)).jd_ut == \
+            pytest.approx(30 / 86400)
+
+    def test_shared_context(self):
+        """Charts built with a shared context match charts that build their own."""
+        engine = AstroEngine(ephe_path=ephe_path)
+        name, dt_utc, lat, lon = RECORDS[0]
+        context = JDContext.from_datetime(dt_utc)
+        for location in [(lat, lon), (51.5074, -0.1278), (-23.5505, -46.6333)]:
+            assert_same_chart(
+                NatalChart(name, dt_utc, *location, engine=engine, context=context),
+                NatalChart(name, dt_utc, *location, engine=engine)
+            )
+
+
+class TestBodySelection:
+    """Test cases for calculating a subset of bodies."""
+
+    def test_resolve_names_and_groups(self):
+        """Names and group keys resolve in ALL_BODY_NAMES order."""
+        assert resolve_body_selection(["AC", "luminaries"]) == ["Sun", "Moon", "AC"]
+        assert resolve_body_selection("Moon") == ["Moon"]
+        assert len(resolve_body_selection(None)) == len(resolve_body_selection(["all_planets", "all_asteroids", "lunar_nodes", "hypothetical_points", "chart_angles"]))
+
+    def test_dependencies_are_pulled_in(self):
+        """Derived points bring the bodies they are calculated from."""
+        assert resolve_body_selection(["South Node"]) == ["True Node", "South Node"]
+
+    def test_invalid_body(self):
+        """Unknown names raise a ValueError."""
+        with pytest.raises(ValueError):
+            resolve_body_selection(["Sun", "Vulcan"])
+
+    def test_chart_with_subset(self):
+        """Only the selected bodies are calculated, with unchanged positions and aspects."""
+        name, dt_utc, lat, lon = RECORDS[0]
+        full = NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path)
+        chart = NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path, bodies=["luminaries", "chart_angles", "South Node"])
+        assert list(chart.bodies_dict) == ["Sun", "Moon", "True Node", "South Node", "AC", "MC", "IC", "DC"]
+        for body_name, body in chart.bodies_dict.items():
+            assert body.longitude == full.bodies_dict[body_name].longitude
+            assert body.house == full.bodies_dict[body_name].house
+        selected = set(chart.bodies_dict)
+        expected = [
+            (a.body1.name, a.body2.name, a.aspect_type, a.orb) for a in full.aspects
+            if a.body1.name in selected and a.body2.name in selected
+        ]
+        assert [(a.body1.name, a.body2.name, a.aspect_type, a.orb) for a in chart.aspects] == expected
+        distributed = [b.name for d in chart.element_distribution.values() for b in d['bodies']]
+        assert set(distributed) == selected
+
+    def test_engine_selection(self):
+        """An engine created with a selection applies it to every chart."""
+        engine = AstroEngine(ephe_path=ephe_path, bodies=["Sun", "Moon"])
+        charts = NatalChart.from_many(RECORDS, engine=engine)
+        assert all(list(chart.bodies_dict) == ["Sun", "Moon"] for chart in charts)
+
+
+class TestSingleCall:
+    """Test cases for the single ephemeris call per body mode."""
+
+    def test_declination_matches_two_call_output(self):
+        """Transformed declinations agree with the equatorial ephemeris call."""
+        two_call = AstroEngine(ephe_path=ephe_path)
+        single_call = AstroEngine(ephe_path=ephe_path, single_call=True)
+        for i in range(50):
+            dt_utc = datetime.datetime(1850, 1, 1) + datetime.timedelta(days=i * 1987.3)
+            expected, _ = two_call.get_planets_and_houses(dt_utc, 38.4167, 27.150)
+            actual, _ = single_call.get_planets_and_houses(dt_utc, 38.4167, 27.150)
+            assert list(actual) == list(expected)
+            for name, body in expected.items():
+                assert actual[name].longitude == body.longitude
+                assert actual[name].declination == pytest.approx(body.declination, abs=1e-7)
+
+
+class TestRelocation:
+    """Test cases for relocated charts."""
+
+    LOCATIONS = [(51.5074, -0.1278), (-33.8688, 151.2093), (64.1466, -21.9426), (0.0, 0.0)]
+
+    def test_relocate_many_matches_new_charts(self):
+        """relocate_many builds the same charts as a NatalChart at each location."""
+        name, dt_utc, lat, lon = RECORDS[0]
+        chart = NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path)
+        relocated = chart.relocate_many(self.LOCATIONS)
+        assert len(relocated) == len(self.LOCATIONS)
+        # Aspects are deferred like those of any chart
+        assert all(moved._aspects is None for moved in relocated)
+        for (new_lat, new_lon), moved in zip(self.LOCATIONS, relocated):
+            expected = NatalChart(name, dt_utc, new_lat, new_lon, engine=chart.engine)
+            assert (moved.latitude, moved.longitude) == (new_lat, new_lon)
+            assert_same_chart(moved, expected)
+            assert [(h.classic_ruler_house, h.modern_ruler_house) for h in moved.houses] == \
+                [(h.classic_ruler_house, h.modern_ruler_house) for h in expected.houses]
+            assert {k: [b.name for b in v['bodies']] for k, v in moved.quadrant_distribution.items()} == \
+                {k: [b.name for b in v['bodies']] for k, v in expected.quadrant_distribution.items()}
+            assert {k: [b.name for b in v['bodies']] for k, v in moved.element_distribution.items()} == \
+                {k: [b.name for b in v['bodies']] for k, v in expected.element_distribution.items()}
+
+    def test_relocate_selected_bodies(self):
+        """A chart of selected bodies keeps its selection when relocated."""
+        name, dt_utc, lat, lon = RECORDS[1]
+        bodies = ["Sun", "Moon", "AC", "MC"]
+        chart = NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path, bodies=bodies)
+        moved = chart.relocate(*self.LOCATIONS[0], person_name="Moved")
+        assert moved.name == "Moved"
+        assert_same_chart(moved, NatalChart(name, dt_utc, *self.LOCATIONS[0], engine=chart.engine, bodies=bodies))
+
+    def test_original_chart_unchanged(self):
+        """Relocating leaves the original chart's bodies and houses as they were."""
+        name, dt_utc, lat, lon = RECORDS[2]
+        chart = NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path)
+        before = {n: (b.longitude, b.house) for n, b in chart.bodies_dict.items()}
+        chart.relocate(*self.LOCATIONS[1])
+        assert {n: (b.longitude, b.house) for n, b in chart.bodies_dict.items()} == before
+        assert all(a.body1 is chart.bodies_dict[a.body1.name] for a in chart.aspects)
+
+    def test_houses_from_longitudes(self):
+        """The batched house lookup agrees with _get_house_from_longitude."""
+        engine = AstroEngine(ephe_path=ephe_path)
+        longitudes = [i * 0.7 for i in range(515)]
+        for _, dt_utc, lat, lon in RECORDS:
+            cusps = list(engine._houses(engine._get_context(dt_utc).jd_ut, lat, lon)[0])
+            assert engine._get_houses_from_longitudes(longitudes + cusps, cusps) == \
+                [engine._get_house_from_longitude(x, cusps) for x in longitudes + cusps]
+
+
+class TestOrbSwitch:
+    """Test cases for re-filtering a chart's aspects under another orb configuration."""
+
+    def test_with_orbs_matches_new_chart(self):
+        """with_orbs finds the aspects of a chart built with that orb configuration."""
+        for name, dt_utc, lat, lon in RECORDS:
+            chart = NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path)
+            for orb_config in ORB_CONFIGS.values():
+                switched = chart.with_orbs(orb_config)
+                assert switched.engine.orb_config is orb_config
+                assert_same_chart(switched, NatalChart(name, dt_utc, lat, lon, orb_config=orb_config, ephe_path=ephe_path))
+
+    def test_with_orbs_shares_positions(self):
+        """The switched chart shares bodies and houses and leaves the original aspects alone."""
+        name, dt_utc, lat, lon = RECORDS[0]
+        chart = NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path)
+        aspects = list(chart.aspects)
+        switched = chart.with_orbs(ORB_CONFIGS["Classical"])
+        assert switched.bodies_dict is chart.bodies_dict
+        assert switched.houses is chart.houses
+        assert switched.pair_distances is chart.pair_distances
+        assert chart.aspects == aspects
+        assert len(chart.pair_distances) == len(chart.bodies_dict) * (len(chart.bodies_dict) - 1) // 2
+
+    def test_with_orb_config_reuses_engines(self):
+        """Switching back and forth reuses the derived engines and their aspect tables."""
+        engine = AstroEngine(ephe_path=ephe_path)
+        classical = engine.with_orb_config(ORB_CONFIGS["Classical"])
+        assert classical is not engine and classical.cache is engine.cache
+        assert engine.with_orb_config(engine.orb_config) is engine
+        assert classical.with_orb_config(engine.orb_config) is engine
+        assert engine.with_orb_config(ORB_CONFIGS["Classical"]) is classical
+        with ParallelAstroEngine(ephe_path=ephe_path) as parallel:
+            assert parallel.with_orb_config(ORB_CONFIGS["Classical"])._get_executor() is parallel._get_executor()
+        assert parallel._executor is None
+
+
+class TestLazyChart:
+    """Test cases for the analyses a chart calculates on first access."""
+
+    def test_analyses_deferred(self):
+        """Reading bodies does not calculate aspects, distributions or the matrix."""
+        name, dt_utc, lat, lon = RECORDS[0]
+        chart = NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path)
+        assert chart.bodies_dict["Sun"].sign.name == "Pisces"
+        assert chart._aspects is None and chart._distributions is None and chart._element_modality_matrix is None
+        aspects = chart.aspects
+        assert aspects is chart.aspects
+        assert [(a.body1.name, a.body2.name, a.aspect_type) for a in aspects] == \
+            [(a.body1.name, a.body2.name, a.aspect_type) for a in chart.engine.get_aspects(chart.bodies_dict)]
+        assert chart._distributions is None
+        assert sum(v['count'] for v in chart.element_distribution.values()) == len(chart.planets) + 1
+        assert chart.element_distribution is chart.element_distribution
+        assert sum(c['count'] for row in chart.element_modality_matrix.values() for c in row.values()) == len(chart.planets)
+
+    def test_from_many_deferred(self):
+        """Batch charts keep the raw batch results and build bodies, houses and aspects on first access."""
+        engine = AstroEngine(ephe_path=ephe_path)
+        charts = NatalChart.from_many(RECORDS, engine=engine)
+        assert all(chart._aspects is None and chart._bodies_dict is None for chart in charts)
+        assert all((chart._block[0].aspects is None) == (np is None) for chart in charts)
+        for (name, dt_utc, lat, lon), chart in zip(RECORDS, charts):
+            assert_same_chart(chart, NatalChart(name, dt_utc, lat, lon, engine=engine))
+        with ParallelAstroEngine(ephe_path=ephe_path, max_workers=1) as engine:
+            chart = NatalChart.from_many(RECORDS[:1], engine=engine)[0]
+        assert chart._aspects is None and chart._bodies_dict is None and chart._block[0].aspect_rows(chart._block[1])
+        assert chart.ascendant is chart.bodies_dict["AC"] and chart.houses[0].cusp_longitude == chart.ascendant.longitude
+        assert aspect_keys(chart.aspects) == aspect_keys(engine.get_aspects(chart.bodies_dict))
+
+    def test_from_many_without_numpy(self, monkeypatch):
+        """Without NumPy batch blocks hold plain lists and charts calculate their aspects on first access."""
+        monkeypatch.setattr("nataly.engine.np", None)
+        engine = AstroEngine(ephe_path=ephe_path)
+        charts = NatalChart.from_many(RECORDS, engine=engine)
+        assert all(not chart._block[0].columnar and chart._block[0].aspects is None for chart in charts)
+        for (name, dt_utc, lat, lon), chart in zip(RECORDS, charts):
+            assert_same_chart(chart, NatalChart(name, dt_utc, lat, lon, engine=engine))
+
+    def test_aspects_assignable(self):
+        """Assigning aspects replaces the calculated ones."""
+        name, dt_utc, lat, lon = RECORDS[1]
+        chart = NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path)
+        chart.aspects = []
+        assert chart.aspects == []
+
+
+class TestBodyIndex:
+    """Test cases for the body queries answered from the chart's body index."""
+
+    def test_queries_match_scan(self):
+        """Every get_bodies_* helper returns the bodies a scan of bodies_dict finds, in the same order."""
+        for name, dt_utc, lat, lon in RECORDS:
+            chart = NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path)
+            bodies = list(chart.bodies_dict.values())
+            assert chart.get_luminaries() == [b for b in bodies if b.body_type == "Luminary"]
+            assert chart.get_planets() == [b for b in bodies if b.body_type in ("Planet", "Luminary")]
+            assert chart.get_planets(include_luminaries=False) == chart.get_bodies_by_type("Planet")
+            assert chart.get_axes() == [b for b in bodies if b.body_type == "Axis"]
+            assert chart.get_retrograde_bodies() == [b for b in bodies if b.is_retrograde]
+            assert chart.get_direct_bodies() == [b for b in bodies if not b.is_retrograde]
+            assert chart.get_bodies_by_names(["Moon", "Sun", "Nowhere"]) == [b for b in bodies if b.name in ("Sun", "Moon")]
+            assert chart.get_bodies_by_signs(["Aries", "Pisces"]) == [b for b in bodies if b.sign.name in ("Aries", "Pisces")]
+            assert chart.get_bodies_by_houses([1, 10]) == [b for b in bodies if b.house in (1, 10)]
+            for body in bodies:
+                assert chart.get_bodies_in_sign(body.sign.name) == [b for b in bodies if b.sign.name == body.sign.name]
+                assert chart.get_bodies_in_element(body.sign.element) == [b for b in bodies if b.sign.element == body.sign.element]
+                assert chart.get_bodies_in_modality(body.sign.modality) == [b for b in bodies if b.sign.modality == body.sign.modality]
+                assert chart.get_bodies_in_house(body.house) == [b for b in bodies if b.house == body.house]
+                assert chart.get_bodies_with_dignity(body.dignity) == [b for b in bodies if b.dignity == body.dignity]
+            with pytest.raises(ValueError):
+                chart.get_bodies_by_type("Comet")
+
+    def test_filters_match_scan(self):
+        """BodyFilter queries return the bodies BodyFilter.matches accepts."""
+        chart = NatalChart(*RECORDS[0], ephe_path=ephe_path)
+        bodies = list(chart.bodies_dict.values())
+        rng = random.Random(7)
+        values = {
+            'bodies': [b.name for b in bodies], 'signs': [b.sign.name for b in bodies],
+            'elements': ["Fire", "Earth", "Air", "Water"], 'modalities': ["Cardinal", "Fixed", "Mutable"],
+            'houses': list(range(1, 13)), 'dignities': [b.dignity for b in bodies],
+        }
+        for _ in range(300):
+            config = {flag: rng.random() < 0.8 for flag in (
+                'include_planets', 'include_luminaries', 'include_asteroids',
+                'include_axes', 'include_lunar_nodes', 'include_lilith')}
+            for field, choices in values.items():
+                for prefix in ('include_', 'exclude_'):
+                    if rng.random() < 0.25:
+                        config[prefix + field] = rng.sample(choices, rng.randint(0, 3))
+            config['include_retrograde'] = rng.choice([None, True, False])
+            body_filter = BodyFilter(**config)
+            assert chart.get_bodies(body_filter) == [b for b in bodies if body_filter.matches(b)]
+        assert chart.get_bodies({'include_axes': False}) == [b for b in bodies if b.body_type != "Axis"]
+
+
+class TestParallel:
+    """Test cases for the process-pool engine."""
+
+    def test_parallel_matches_serial(self):
+        """ParallelAstroEngine builds the same charts as the serial engine."""
+        with ParallelAstroEngine(ephe_path=ephe_path, max_workers=2, chunksize=1) as engine:
+            charts = NatalChart.from_many(RECORDS, engine=engine)
+            bodies_only = engine.compute_batch(RECORDS)
+            with_aspects = engine.compute_batch(RECORDS, with_aspects=True)
+        assert len(charts) == len(RECORDS)
+        for (name, dt_utc, lat, lon), chart, (bodies_dict, _, aspects) in zip(RECORDS, charts, with_aspects):
+            expected = NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path)
+            assert_same_chart(chart, expected)
+            assert aspect_keys(aspects) == aspect_keys(expected.aspects)
+            assert all(a.body1 is bodies_dict[a.body1.name] for a in aspects)
+        assert all(len(result) == 2 for result in bodies_only)
+
+    @pytest.mark.parametrize("min_pairs", [0, 10 ** 6])
+    def test_aspect_rows_match_get_aspects(self, monkeypatch, min_pairs):
+        """Aspect rows from both kernels rebuild the aspects get_aspects finds."""
+        monkeypatch.setattr("nataly.engine.VECTORIZED_MIN_PAIRS", min_pairs)
+        engine = AstroEngine(ephe_path=ephe_path)
+        for _, dt_utc, lat, lon in RECORDS:
+            bodies_dict, _ = engine.get_planets_and_houses(dt_utc, lat, lon)
+            rows = engine._aspect_rows(list(bodies_dict), [b.longitude for b in bodies_dict.values()])
+            assert aspect_keys(engine._aspects_from_rows(bodies_dict, rows)) == aspect_keys(engine.get_aspects(bodies_dict, vectorized=False))
+
+    def test_orb_config_changes_reach_workers(self):
+        """Workers use the orb configuration the engine holds at each call, and derived engines share the pool."""
+        name, dt_utc, lat, lon = RECORDS[0]
+        classical = ORB_CONFIGS["Classical"]
+        with ParallelAstroEngine(ephe_path=ephe_path, max_workers=1) as engine:
+            default_chart = NatalChart.from_many(RECORDS[:1], engine=engine)[0]
+            derived = engine.with_orb_config(classical)
+            derived_chart = NatalChart.from_many(RECORDS[:1], engine=derived)[0]
+            assert derived._get_executor() is engine._get_executor()
+            engine.orb_config = classical
+            switched_chart = NatalChart.from_many(RECORDS[:1], engine=engine)[0]
+        assert engine._executor is None
+        assert_same_chart(default_chart, NatalChart(name, dt_utc, lat, lon, ephe_path=ephe_path))
+        expected = NatalChart(name, dt_utc, lat, lon, orb_config=classical, ephe_path=ephe_path)
+        assert_same_chart(derived_chart, expected)
+        assert_same_chart(switched_chart, expected)
+
+    def test_empty_batch(self):
+        """An empty batch does not start the worker pool."""
+        engine = ParallelAstroEngine(ephe_path=ephe_path)
+        assert engine.compute_batch([]) == []
+        assert engine._executor is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
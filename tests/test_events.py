@@ -0,0 +1,170 @@
+"""
+Tests for the event search engine of the nataly library.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import swisseph as swe
+
+from nataly import AstroEngine, NatalChart, EventFinder
+from nataly.context import datetime_to_jd, jd_to_datetime
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+
+def scan_crossings(body_id, target, start, end, step=0.05):
+    """Counts target crossings by sampling the longitude densely."""
+    jd, jd_end = datetime_to_jd(start), datetime_to_jd(end)
+    count, previous = 0, None
+    while jd <= jd_end:
+        diff = (swe.calc_ut(jd, body_id, 0)[0][0] - target + 180) % 360 - 180
+        if previous is not None and (previous < 0) != (diff < 0) and abs(previous - diff) < 180:
+            count += 1
+        previous, jd = diff, jd + step
+    return count
+
+
+class TestEventFinder:
+    """Test cases for EventFinder."""
+
+    def setup_method(self):
+        self.engine = AstroEngine(ephe_path=ephe_path)
+        self.finder = EventFinder(self.engine)
+        self.natal = NatalChart("Test", datetime.datetime(1990, 2, 27, 7, 15), 38.4167, 27.150, engine=self.engine)
+
+    def test_retrograde_multi_hits(self):
+        """A retrograde loop over the target gives one exact event per pass."""
+        sun = self.natal.bodies_dict["Sun"]
+        events = self.finder.find_exact_aspects("Saturn", sun, "Square", datetime.datetime(2001, 1, 1), datetime.datetime(2003, 1, 1))
+        assert [e.is_retrograde for e in events] == [False, True, False]
+        for event in events:
+            assert event.target == "Sun"
+            assert event.symbol == "□"
+            assert abs((event.longitude - sun.longitude) % 360 - 90) < 1e-6
+            lon = swe.calc_ut(datetime_to_jd(event.dt_utc), swe.SATURN, 0)[0][0]
+            assert abs((lon - sun.longitude) % 360 - 90) < 1e-5
+
+    @pytest.mark.parametrize("body,body_id,aspect,angle", [
+        ("Mercury", swe.MERCURY, "Conjunction", 0), ("Mars", swe.MARS, "Trine", 120), ("Moon", swe.MOON, "Square", 90),
+    ])
+    def test_matches_dense_scan(self, body, body_id, aspect, angle):
+        """Every crossing seen by a dense scan is found."""
+        start, end = datetime.datetime(2010, 1, 1), datetime.datetime(2011, 1, 1)
+        events = self.finder.find_exact_aspects(body, 200.0, aspect, start, end)
+        expected = sum(scan_crossings(body_id, target, start, end) for target in {(200.0 + angle) % 360, (200.0 - angle) % 360})
+        assert len(events) == expected
+        assert [e.jd_ut for e in events] == sorted(e.jd_ut for e in events)
+
+    def test_south_node_and_chart_search(self):
+        """Derived bodies can be searched and chart searches are sorted by time."""
+        events = self.finder.find_exact_aspects_to_chart(
+            "South Node", [self.natal.bodies_dict["Sun"], self.natal.bodies_dict["Moon"]], ["Conjunction", "Opposition"],
+            datetime.datetime(1990, 1, 1), datetime.datetime(2010, 1, 1)
+        )
+        assert events and {e.target for e in events} <= {"Sun", "Moon"}
+        assert [e.jd_ut for e in events] == sorted(e.jd_ut for e in events)
+
+    def test_timezone_aware_range(self):
+        """Aware ranges give aware event times."""
+        start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        events = self.finder.find_exact_aspects("Sun", 0.0, "Conjunction", start, start + datetime.timedelta(days=366))
+        assert len(events) == 1
+        assert events[0].dt_utc.tzinfo is not None
+        assert events[0].dt_utc.month == 3 and events[0].dt_utc.day == 20
+
+    def test_invalid_queries(self):
+        """Angles, unknown aspects and reversed ranges are rejected."""
+        start, end = datetime.datetime(2020, 1, 1), datetime.datetime(2021, 1, 1)
+        with pytest.raises(ValueError):
+            self.finder.find_exact_aspects("AC", 0.0, "Square", start, end)
+        with pytest.raises(ValueError):
+            self.finder.find_exact_aspects("Sun", 0.0, "Handshake", start, end)
+        with pytest.raises(ValueError):
+            self.finder.find_exact_aspects("Sun", 0.0, "Square", end, start)
+
+    def test_sun_ingresses(self):
+        """The Sun enters each sign once a year, Aries around the March equinox."""
+        events = list(self.finder.iter_ingresses(datetime.datetime(2021, 1, 1), datetime.datetime(2022, 1, 1), bodies=["Sun"]))
+        assert len(events) == 12
+        aries = next(e for e in events if e.sign == "Aries")
+        assert aries.previous_sign == "Pisces"
+        assert (aries.dt_utc.month, aries.dt_utc.day) == (3, 20)
+        assert abs((aries.longitude + 15) % 30 - 15) < 1e-6
+
+    def test_ingresses_match_dense_scan(self):
+        """Every sign change seen by a dense scan is found, including retrograde re-entries."""
+        start, end = datetime.datetime(2020, 1, 1), datetime.datetime(2022, 1, 1)
+        events = list(self.finder.iter_ingresses(start, end, bodies=["Mercury"]))
+        jd, jd_end = datetime_to_jd(start), datetime_to_jd(end)
+        changes, previous = 0, None
+        while jd <= jd_end:
+            sign = int(swe.calc_ut(jd, swe.MERCURY, 0)[0][0] // 30)
+            changes += previous is not None and sign != previous
+            previous, jd = sign, jd + 0.05
+        assert len(events) == changes
+        assert any(e.is_retrograde for e in events)
+        for event in events:
+            assert abs((event.longitude + 15) % 30 - 15) < 1e-6
+
+    def test_stations(self):
+        """Mercury stations alternate between retrograde and direct, three loops a year."""
+        events = list(self.finder.iter_stations(datetime.datetime(2020, 1, 1), datetime.datetime(2021, 1, 1), bodies=["Mercury"]))
+        assert [e.station_type for e in events] == ["retrograde", "direct"] * 3
+        for event in events:
+            assert abs(swe.calc_ut(event.jd_ut, swe.MERCURY, swe.FLG_SPEED)[0][3]) < 1e-6
+
+    def test_true_node_stations_match_dense_scan(self):
+        """True node phases shorter than its coarse step (e.g. August 2017) still give both stations."""
+        start, end = datetime.datetime(2016, 1, 1), datetime.datetime(2019, 1, 1)
+        events = list(self.finder.iter_stations(start, end, bodies=["True Node"]))
+        jd, jd_end = datetime_to_jd(start), datetime_to_jd(end)
+        flips, previous = [], None
+        while jd <= jd_end:
+            speed = swe.calc_ut(jd, swe.TRUE_NODE, swe.FLG_SPEED)[0][3]
+            if previous is not None and (previous < 0) != (speed < 0):
+                flips.append(jd)
+            previous, jd = speed, jd + 0.01
+        assert len(events) == len(flips) > 100
+        assert all(abs(event.jd_ut - flip) < 0.011 for event, flip in zip(events, flips))
+        assert all(e1.station_type != e2.station_type for e1, e2 in zip(events, events[1:]))
+
+    def test_merged_calendar_stream(self):
+        """Events of several bodies are streamed in time order; the South Node mirrors the True Node."""
+        start, end = datetime.datetime(2020, 1, 1), datetime.datetime(2020, 7, 1)
+        stream = self.finder.iter_events(start, end)
+        assert next(stream).jd_ut <= next(stream).jd_ut
+        events = list(self.finder.iter_events(start, end, bodies=["Moon", "Mars", "True Node", "South Node"]))
+        assert [e.jd_ut for e in events] == sorted(e.jd_ut for e in events)
+        mirrored = [(e.jd_ut, e.sign) for e in events if e.body == "South Node"]
+        direct = [(e.jd_ut, e.sign) for e in self.finder.iter_events(start, end, bodies=["South Node"])]
+        assert [sign for _, sign in mirrored] == [sign for _, sign in direct]
+        assert all(abs(a - b) < 1e-6 for (a, _), (b, _) in zip(mirrored, direct))
+        with pytest.raises(ValueError):
+            self.finder.iter_events(start, end, bodies=["Lilith"])
+
+    def test_jd_to_datetime_round_trip(self):
+        """jd_to_datetime inverts datetime_to_jd."""
+        dt_utc = datetime.datetime(1990, 2, 27, 7, 15, 30)
+        assert abs(jd_to_datetime(datetime_to_jd(dt_utc)) - dt_utc) < datetime.timedelta(milliseconds=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,142 @@
+"""
+Tests for the columnar chart frame of the nataly library.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, ParallelAstroEngine, NatalChart, ChartFrame, BodyFilter
+from nataly.frame import DIGNITY_CODES
+from nataly.constants import SIGN_NAMES_BY_DEGREE, ELEMENTS, MODALITIES
+
+np = pytest.importorskip("numpy")
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+RECORDS = [
+    (f"Person {i}", datetime.datetime(1950, 1, 1, 6) + datetime.timedelta(days=i * 431.7), -50 + i * 9.5, -170 + i * 31.3)
+    for i in range(12)
+]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return AstroEngine(ephe_path=ephe_path)
+
+
+@pytest.fixture(scope="module")
+def frame(engine):
+    return ChartFrame.from_records(RECORDS, engine=engine)
+
+
+@pytest.fixture(scope="module")
+def charts(engine):
+    return NatalChart.from_many(RECORDS, engine=engine)
+
+
+def chart_state(chart):
+    return (
+        [(n, b.longitude, b.speed, b.declination, b.sign.name, b.house, b.dignity, b.is_retrograde) for n, b in chart.bodies_dict.items()],
+        [(h.cusp_longitude, h.sign.name, h.classic_ruler_house, h.declination) for h in chart.houses],
+        [(a.body1.name, a.body2.name, a.aspect_type, a.orb) for a in chart.aspects],
+    )
+
+
+class TestChartFrame:
+    """Test cases for ChartFrame."""
+
+    def test_columns_match_charts(self, frame, charts):
+        """Every cell holds the position, sign, house and dignity of the chart's body."""
+        assert frame.longitudes.shape == (len(RECORDS), len(frame.body_names))
+        for row, chart in enumerate(charts):
+            for col, name in enumerate(frame.body_names):
+                body = chart.bodies_dict.get(name)
+                if body is None:
+                    assert np.isnan(frame.longitudes[row, col]) and frame.houses[row, col] == 0
+                    continue
+                assert frame.longitudes[row, col] == body.longitude
+                assert frame.declinations[row, col] == body.declination
+                assert SIGN_NAMES_BY_DEGREE[frame.signs[row, col]] == body.sign.name
+                assert frame.houses[row, col] == body.house
+                assert DIGNITY_CODES[frame.dignities[row, col]] == body.dignity
+                assert frame.is_retrograde[row, col] == body.is_retrograde
+
+    def test_rows_as_charts(self, frame, charts):
+        """A row read as a NatalChart equals the chart calculated for the record."""
+        assert len(frame) == len(charts)
+        for row_chart, chart in zip(frame, charts):
+            assert (row_chart.name, row_chart.datetime_utc, row_chart.latitude, row_chart.longitude) == \
+                (chart.name, chart.datetime_utc, chart.latitude, chart.longitude)
+            assert chart_state(row_chart) == chart_state(chart)
+
+    def test_from_charts_round_trip(self, frame, charts):
+        """Converting charts into a frame and back keeps them unchanged."""
+        converted = ChartFrame.from_charts(charts)
+        columns = [frame.column(name) for name in converted.body_names]
+        assert np.array_equal(converted.longitudes, frame.longitudes[:, columns])
+        assert np.array_equal(converted.houses, frame.houses[:, columns])
+        assert np.array_equal(converted.cusps, frame.cusps)
+        assert [chart_state(c) for c in converted.to_charts()] == [chart_state(c) for c in charts]
+        with pytest.raises(ValueError):
+            ChartFrame.from_charts([])
+
+    def test_distributions(self, frame, charts):
+        """Vectorized distributions count what the charts' distributions count."""
+        for kind in ("element", "modality", "polarity", "quadrant", "hemisphere"):
+            counts = frame.distribution(kind)
+            for row, chart in enumerate(charts):
+                expected = {key: value['count'] for key, value in getattr(chart, f"{kind}_distribution").items()}
+                assert {key: int(value[row]) for key, value in counts.items() if value[row]} == \
+                    {key: count for key, count in expected.items() if count}
+        matrix = frame.element_modality_counts()
+        for row, chart in enumerate(charts):
+            for e, element in enumerate(ELEMENTS):
+                for m, modality in enumerate(MODALITIES):
+                    assert matrix[row, e, m] == chart.element_modality_matrix[element][modality]['count']
+        with pytest.raises(ValueError):
+            frame.distribution("decan")
+
+    def test_filters(self, frame, charts):
+        """Filter masks select the bodies NatalChart.get_bodies returns."""
+        filters = [
+            None,
+            BodyFilter(include_signs=["Aries", "Leo", "Capricorn"]),
+            BodyFilter(include_planets=False, include_elements=["Fire", "Air"], exclude_houses=[1, 2]),
+            BodyFilter(include_dignities=["domicile", "exaltation"]),
+            BodyFilter(include_retrograde=True, exclude_bodies=["Pluto"]),
+            {"include_modalities": ["Fixed"], "include_axes": False, "include_houses": [10, 11]},
+        ]
+        for filter_config in filters:
+            mask = frame.mask(filter_config)
+            for row, chart in enumerate(charts):
+                assert [frame.body_names[col] for col in np.flatnonzero(mask[row])] == \
+                    [body.name for body in chart.get_bodies(filter_config)]
+            assert np.array_equal(frame.count(filter_config), mask.sum(axis=1))
+
+    def test_parallel_engine(self, frame):
+        """The parallel batch path fills the same columns."""
+        with ParallelAstroEngine(ephe_path=ephe_path, max_workers=2) as parallel:
+            parallel_frame = ChartFrame.from_records(RECORDS, engine=parallel)
+        assert np.array_equal(parallel_frame.longitudes, frame.longitudes, equal_nan=True)
+        assert np.array_equal(parallel_frame.houses, frame.houses)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,122 @@
+"""
+Tests for the incrementally updated chart of the nataly library.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, LiveChart, ChartDiff
+from nataly.config import ORB_CONFIGS
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+START = datetime.datetime(2024, 3, 20, 0, 0)
+LAT, LON = 41.0082, 28.9784
+
+
+def chart_state(chart):
+    """Everything a chart derives from its instant, as comparable values."""
+    return (
+        [(n, b.longitude, b.speed, b.sign.name, b.house, b.dignity, b.is_retrograde) for n, b in chart.bodies_dict.items()],
+        [(h.cusp_longitude, h.sign.name, h.classic_ruler_house, h.modern_ruler_house) for h in chart.houses],
+        [(a.body1.name, a.body2.name, a.aspect_type, a.orb, a.is_applying) for a in chart.aspects],
+        {k: [b.name for b in v['bodies']] for k, v in chart.quadrant_distribution.items()},
+        {k: [b.name for b in v['bodies']] for k, v in chart.element_distribution.items()},
+    )
+
+
+class TestLiveChart:
+    """Test cases for LiveChart."""
+
+    def test_advance_matches_new_charts(self):
+        """After many steps forward and back the chart equals a freshly built one."""
+        engine = AstroEngine(ephe_path=ephe_path)
+        live = LiveChart("Sky", START, LAT, LON, engine=engine)
+        for minutes in list(range(0, 3 * 1440, 37)) + list(range(3 * 1440, -1440, -241)):
+            dt = START + datetime.timedelta(minutes=minutes)
+            live.advance(dt)
+            assert live.datetime_utc == dt
+            if minutes % 5 == 0:
+                expected = NatalChart("Sky", dt, LAT, LON, engine=engine)
+                assert chart_state(live) == chart_state(expected)
+                assert [b.name for b in live.get_retrograde_bodies()] == [b.name for b in expected.get_retrograde_bodies()]
+                assert [b.name for b in live.get_bodies_in_house(1)] == [b.name for b in expected.get_bodies_in_house(1)]
+
+    def test_diff_reports_changes(self):
+        """The diff lists the aspects that formed and dissolved and the sign and house changes."""
+        live = LiveChart("Sky", START, LAT, LON, ephe_path=ephe_path)
+        before = chart_state(live)
+        diff = live.advance(START + datetime.timedelta(hours=6))
+        assert isinstance(diff, ChartDiff)
+        old_aspects = {(a[0], a[1], a[2]) for a in before[2]}
+        new_aspects = {(a.body1.name, a.body2.name, a.aspect_type) for a in live.aspects}
+        assert {(a.body1.name, a.body2.name, a.aspect_type) for a in diff.entered_aspects} == new_aspects - old_aspects
+        assert {(a.body1.name, a.body2.name, a.aspect_type) for a in diff.left_aspects} == old_aspects - new_aspects
+        old_bodies = {b[0]: b for b in before[0]}
+        assert diff.house_changes == [
+            (name, old_bodies[name][4], body.house) for name, body in live.bodies_dict.items()
+            if body.house != old_bodies[name][4]
+        ]
+        assert diff.sign_changes == [
+            (name, old_bodies[name][3], body.sign.name) for name, body in live.bodies_dict.items()
+            if body.sign.name != old_bodies[name][3]
+        ]
+        # The AC moves through at least two signs in six hours
+        assert "AC" in [change[0] for change in diff.sign_changes]
+
+    def test_objects_updated_in_place(self):
+        """Bodies, houses and continuing aspects keep their objects; a repeated instant changes nothing."""
+        live = LiveChart("Sky", START, LAT, LON, ephe_path=ephe_path)
+        bodies = dict(live.bodies_dict)
+        houses = list(live.houses)
+        live.advance(START + datetime.timedelta(seconds=10))
+        assert all(live.bodies_dict[name] is body for name, body in bodies.items())
+        assert all(new is old for new, old in zip(live.houses, houses))
+        aspects = list(live.aspects)
+        diff = live.advance(START + datetime.timedelta(seconds=10))
+        assert diff.is_empty
+        assert live.aspects == aspects and all(new is old for new, old in zip(live.aspects, aspects))
+
+    def test_selected_bodies_and_orbs(self):
+        """A chart of selected bodies and another orb configuration advances like a new chart."""
+        engine = AstroEngine(ORB_CONFIGS["Classical"], ephe_path)
+        live = LiveChart("Sky", START, LAT, LON, engine=engine, bodies=["luminaries", "chart_angles", "Mars"])
+        dt = START + datetime.timedelta(days=2, hours=5)
+        live.advance(dt)
+        expected = NatalChart("Sky", dt, LAT, LON, engine=engine, bodies=["luminaries", "chart_angles", "Mars"])
+        assert chart_state(live) == chart_state(expected)
+
+    def test_with_orbs_charts_advance_separately(self):
+        """A chart switched to other orbs has bodies of its own; advancing one leaves the other valid."""
+        engine = AstroEngine(ephe_path=ephe_path)
+        live = LiveChart("Sky", START, LAT, LON, engine=engine)
+        classical = live.with_orbs(ORB_CONFIGS["Classical"])
+        assert all(classical.bodies_dict[name] is not body for name, body in live.bodies_dict.items())
+        assert all(h.classic_ruler is classical.bodies_dict[h.classic_ruler.name] for h in classical.houses if h.classic_ruler)
+        later = START + datetime.timedelta(hours=9)
+        live.advance(later)
+        assert chart_state(live) == chart_state(NatalChart("Sky", later, LAT, LON, engine=engine))
+        assert chart_state(classical) == chart_state(NatalChart("Sky", START, LAT, LON, orb_config=ORB_CONFIGS["Classical"], ephe_path=ephe_path))
+        classical.advance(later)
+        assert chart_state(classical) == chart_state(NatalChart("Sky", later, LAT, LON, orb_config=ORB_CONFIGS["Classical"], ephe_path=ephe_path))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,136 @@
+"""
+Tests for the lunar calendar of the nataly library.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, LunarCalendar, LunationEvent, EclipseEvent, VoidOfCourseEvent
+from nataly.lunar_calendar import LUNATION_PHASES, VOID_OF_COURSE_BODIES, VOID_OF_COURSE_ASPECTS
+from nataly.constants import ASPECT_DATA
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+START = datetime.datetime(2024, 1, 1)
+END = datetime.datetime(2024, 4, 1)
+
+
+def separation(lon1, lon2):
+    return abs((lon1 - lon2 + 180) % 360 - 180)
+
+
+class TestLunarCalendar:
+    """Test cases for LunarCalendar."""
+
+    def setup_method(self):
+        self.engine = AstroEngine(ephe_path=ephe_path)
+        self.calendar = LunarCalendar(self.engine)
+        self.moon = self.calendar.events._motion("Moon")
+        self.sun = self.calendar.events._motion("Sun")
+
+    def test_lunations_are_exact(self):
+        events = list(self.calendar.iter_lunations(START, END, phases=LUNATION_PHASES))
+        assert [e.jd_ut for e in events] == sorted(e.jd_ut for e in events)
+        angles = {"New Moon": 0, "First Quarter": 90, "Full Moon": 180, "Last Quarter": 270}
+        for event in events:
+            assert isinstance(event, LunationEvent)
+            elongation = (self.moon(event.jd_ut)[0] - self.sun(event.jd_ut)[0]) % 360
+            assert separation(elongation, angles[event.phase]) < 1e-5
+        # About one of each phase per synodic month
+        assert sum(e.phase == "New Moon" for e in events) == 3
+        assert sum(e.phase == "Full Moon" for e in events) == 3
+        assert len(events) == 12
+
+    def test_known_new_moon(self):
+        new_moon = next(self.calendar.iter_lunations(START, END, phases=["New Moon"]))
+        assert new_moon.sign == "Capricorn"
+        assert abs(new_moon.dt_utc - datetime.datetime(2024, 1, 11, 11, 57)) < datetime.timedelta(minutes=2)
+
+    def test_known_eclipses(self):
+        events = list(self.calendar.iter_eclipses(START, datetime.datetime(2025, 1, 1)))
+        assert [(e.eclipse_kind, e.eclipse_type) for e in events] == [
+            ("lunar", "penumbral"), ("solar", "total"), ("lunar", "partial"), ("solar", "annular")
+        ]
+        total = events[1]
+        assert isinstance(total, EclipseEvent)
+        assert total.sign == "Aries"
+        assert abs(total.dt_utc - datetime.datetime(2024, 4, 8, 18, 17)) < datetime.timedelta(minutes=2)
+        solar_only = list(self.calendar.iter_eclipses(START, datetime.datetime(2025, 1, 1), kinds=["solar"]))
+        assert solar_only == [e for e in events if e.eclipse_kind == "solar"]
+
+    def test_void_of_course_periods(self):
+        events = list(self.calendar.iter_void_of_course(START, END))
+        assert len(events) > 30
+        motions = {body: self.calendar.events._motion(body) for body in VOID_OF_COURSE_BODIES}
+        angles = sorted({ASPECT_DATA[a]["angle"] for a in VOID_OF_COURSE_ASPECTS})
+        for previous, event in zip(events, events[1:]):
+            assert previous.end_jd_ut <= event.jd_ut
+        for event in events:
+            assert isinstance(event, VoidOfCourseEvent)
+            assert event.jd_ut <= event.end_jd_ut
+            # The Moon leaves the sign at the end of the period
+            assert int(self.moon(event.end_jd_ut - 1e-6)[0] // 30) != int(self.moon(event.end_jd_ut + 1e-6)[0] // 30)
+            if event.last_aspect_body is None:
+                continue
+            # An exact aspect starts the period...
+            lon = motions[event.last_aspect_body](event.jd_ut)[0]
+            angle = ASPECT_DATA[event.last_aspect_type]["angle"]
+            assert separation(separation(self.moon(event.jd_ut)[0], lon), angle) < 1e-5
+            # ...and no other is made before the ingress (hourly samples of the separations)
+            jd = event.jd_ut + 1e-4
+            while jd < event.end_jd_ut:
+                nxt = min(jd + 1 / 24, event.end_jd_ut)
+                for motion in motions.values():
+                    before = separation(self.moon(jd)[0], motion(jd)[0])
+                    after = separation(self.moon(nxt)[0], motion(nxt)[0])
+                    for angle in angles:
+                        assert (before - angle) * (after - angle) > 0 or min(before, after) == angle == 0
+                jd = nxt
+
+    def test_void_of_course_without_aspects_spans_the_sign(self):
+        events = list(self.calendar.iter_void_of_course(START, datetime.datetime(2024, 1, 15), aspect_types=[]))
+        for previous, event in zip(events, events[1:]):
+            assert event.last_aspect_body is None
+            assert event.jd_ut == previous.end_jd_ut
+
+    def test_iter_events_merges_in_time_order(self):
+        events = list(self.calendar.iter_events(START, END))
+        assert [e.jd_ut for e in events] == sorted(e.jd_ut for e in events)
+        kinds = {type(e) for e in events}
+        assert kinds == {LunationEvent, EclipseEvent, VoidOfCourseEvent}
+        lunations = list(self.calendar.iter_events(START, END, eclipses=False, void_of_course=False))
+        assert lunations == list(self.calendar.iter_lunations(START, END))
+
+    def test_timezone_aware_range(self):
+        tz = datetime.timezone(datetime.timedelta(hours=3))
+        event = next(self.calendar.iter_lunations(START.replace(tzinfo=tz), END.replace(tzinfo=tz)))
+        assert event.dt_utc.tzinfo == tz
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            list(self.calendar.iter_lunations(START, END, phases=["Blue Moon"]))
+        with pytest.raises(ValueError):
+            list(self.calendar.iter_eclipses(START, END, kinds=["stellar"]))
+        with pytest.raises(ValueError):
+            self.calendar.iter_void_of_course(START, END, bodies=["Moon"])
+        with pytest.raises(ValueError):
+            self.calendar.iter_void_of_course(START, END, aspect_types=["Unknown"])
+        with pytest.raises(ValueError):
+            self.calendar.iter_events(END, START)
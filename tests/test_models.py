@@ -0,0 +1,89 @@
+"""
+Tests for the data model classes of the nataly library.
+"""
+
+import copy
+import dataclasses
+import datetime
+import os
+import pickle
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import NatalChart, Body, House, Aspect, Sign, AspectEvent
+from nataly.models import get_sign, decimal_to_dms_string, SIGN_OBJECTS
+from nataly.constants import SIGNS
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+
+class TestModels:
+    """Test cases for the model classes."""
+
+    def test_signs_are_shared(self):
+        """get_sign returns one frozen Sign object per sign."""
+        assert len(SIGN_OBJECTS) == 12
+        for name, data in SIGNS.items():
+            sign = get_sign(name)
+            assert sign is get_sign(name)
+            assert sign == Sign(**data)
+        assert get_sign("Ophiuchus") is None
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            get_sign("Aries").element = "Water"
+
+    def test_chart_uses_shared_signs(self):
+        """Bodies and house cusps of a chart point at the shared Sign objects."""
+        chart = NatalChart("Joe Doe", datetime.datetime(1990, 2, 27, 7, 15), 38.4167, 27.150, ephe_path=ephe_path)
+        assert all(body.sign is SIGN_OBJECTS[body.sign.name] for body in chart.bodies_dict.values())
+        assert all(house.sign is SIGN_OBJECTS[house.sign.name] for house in chart.houses)
+
+    def test_models_are_slotted(self):
+        """Model instances have no __dict__ and still copy, pickle and replace."""
+        sign = get_sign("Leo")
+        body = Body("Sun", "Luminary", 135.25, 0.95, False, sign, 10, "domicile")
+        house = House(1, 130.5, sign, classic_ruler=body, classic_ruler_house=10)
+        aspect = Aspect(body, body, "Conjunction", "☌", -0.5, True)
+        event = AspectEvent("Sun", "Moon", "Conjunction", "☌", datetime.datetime(2024, 1, 11), 2460320.5, 290.0, 290.0, False)
+        for obj in (sign, body, house, aspect, event):
+            assert not hasattr(obj, "__dict__")
+            assert pickle.loads(pickle.dumps(obj)) == obj
+            assert copy.copy(obj) == obj
+        assert dataclasses.replace(event, body="Mars").body == "Mars"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.body = "Mars"
+        with pytest.raises(AttributeError):
+            body.color = "gold"
+        # Bodies, houses and aspects stay mutable
+        body.house = 11
+        assert body.house == 11
+
+    def test_dms_strings(self):
+        """The cached DMS properties agree with decimal_to_dms_string and follow updates."""
+        body = Body("Moon", "Luminary", 75.123456, 13.2, False, get_sign("Gemini"), 3, latitude=-4.5, declination=23.1)
+        assert body.dms == decimal_to_dms_string(75.123456, 'position')
+        assert body.absolute_dms == decimal_to_dms_string(75.123456, 'speed')
+        assert body.latitude_dms == decimal_to_dms_string(-4.5, 'speed')
+        assert body.signed_dms == "15♊07'24\""
+        body.longitude = 80.5
+        assert body.dms == "20°30'00\""
+        aspect = Aspect(body, body, "Square", "□", -1.25, True)
+        assert aspect.orb_str == "-1°15'00\""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,157 @@
+"""
+Tests for the progression series of the nataly library.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, ProgressionSeries
+from nataly.constants import ASPECT_DATA
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+ANGLES = ["AC", "MC", "IC", "DC"]
+
+
+def cross_product_aspects(table, positions, natal):
+    """Brute-force oracle: the first aspect within orb of every moved x natal point pair."""
+    aspects = []
+    for name, lon in positions.items():
+        for natal_name, natal_body in natal.bodies_dict.items():
+            sep = separation(lon, natal_body.longitude)
+            for k, angle, orb_limit in table.candidates[table.index_of(name)][table.index_of(natal_name)][int(sep)]:
+                if abs(sep - angle) <= orb_limit:
+                    aspects.append((name, natal_name, table.aspect_names[k]))
+                    break
+    return aspects
+
+
+def separation(lon1, lon2):
+    return abs((lon1 - lon2 + 180) % 360 - 180)
+
+
+class TestProgressionSeries:
+    """Test cases for ProgressionSeries."""
+
+    def setup_method(self):
+        self.engine = AstroEngine(ephe_path=ephe_path)
+        self.natal = NatalChart("User", datetime.datetime(1990, 2, 27, 7, 15), 38.4167, 27.150, engine=self.engine)
+        self.series = ProgressionSeries(self.natal, 0, 60, step_years=0.5)
+
+    def test_ages_and_shapes(self):
+        assert len(self.series) == 121
+        assert self.series.ages[-1] == 60
+        assert self.series.times[-1] == self.natal.datetime_utc + datetime.timedelta(days=60)
+        assert self.series.body_names[-4:] == ANGLES
+        assert self.series.directed_names == list(self.natal.bodies_dict)
+        assert len(self.series.longitudes) == 121
+        assert len(self.series.directed_longitudes[0]) == len(self.natal.bodies_dict)
+
+    def test_progressed_bodies_match_charts(self):
+        """Progressed bodies are the chart N days after birth, and aspects match get_aspects."""
+        aspects = self.series.progressed_aspects(chunk_size=7)
+        for index in (0, 33, 120):
+            chart = NatalChart("Progressed", self.series.times[index], self.natal.latitude, self.natal.longitude, engine=self.engine)
+            positions = self.series.progressed_at(index)
+            bodies = {name: body for name, body in chart.bodies_dict.items() if name not in ANGLES}
+            for name, body in bodies.items():
+                assert positions[name] == pytest.approx(body.longitude, abs=1e-9)
+            expected = cross_product_aspects(self.engine.aspect_table, positions, self.natal)
+            assert [a[:3] for a in aspects[index]] == expected
+
+    def test_contacts_with_own_natal_position(self):
+        """Progressed and directed points aspect their own natal positions, in both pair orders."""
+        found = {(p, n): aspect for p, n, aspect, _, _ in self.series.progressed_aspects()[0]}
+        assert found[("Moon", "Moon")] == "Conjunction"
+        assert found[("Sun", "Sun")] == "Conjunction"
+        directed = {(p, n): aspect for p, n, aspect, _, _ in self.series.directed_aspects()[0]}
+        assert all(directed[(name, name)] == "Conjunction" for name in self.natal.bodies_dict)
+        # The progressed Moon returns to its natal place after about 27 years
+        moon = self.series.body_names.index("Moon")
+        natal_moon = self.natal.bodies_dict["Moon"].longitude
+        index = min(range(40, 70), key=lambda i: separation(self.series.longitudes[i][moon], natal_moon))
+        assert ("Moon", "Moon", "Conjunction") in [a[:3] for a in self.series.progressed_aspects()[index]]
+        # At age 0 every natal aspect is found as directed X to natal Y and directed Y to natal X
+        orbs = self.engine.aspect_table.orbs
+        index_of = self.engine.aspect_table.index_of
+        pairs = [
+            (a.body1.name, a.body2.name) for a in self.natal.aspects
+            if orbs[index_of(a.body1.name)][index_of(a.body2.name)] == orbs[index_of(a.body2.name)][index_of(a.body1.name)]
+        ]
+        assert pairs
+        for name1, name2 in pairs:
+            assert (name1, name2) in directed and (name2, name1) in directed
+
+    def test_solar_arc(self):
+        assert self.series.solar_arcs[0] == pytest.approx(0.0, abs=1e-9)
+        sun = self.series.body_names.index("Sun")
+        for index in (10, 120):
+            arc = self.series.solar_arcs[index]
+            assert 0.9 * self.series.ages[index] < arc < 1.05 * self.series.ages[index]
+            assert separation(self.series.longitudes[index][sun], self.natal.bodies_dict["Sun"].longitude + arc) < 1e-9
+            directed = self.series.directed_at(index)
+            for name, body in self.natal.bodies_dict.items():
+                assert separation(directed[name], body.longitude + arc) < 1e-9
+
+    def test_progressed_angles(self):
+        """At age 0 the angles are the natal ones; the MC then advances by about the arc."""
+        start = self.series.progressed_at(0)
+        for name in ANGLES:
+            assert start[name] == pytest.approx(self.natal.bodies_dict[name].longitude, abs=1e-6)
+        later = self.series.progressed_at(120)
+        assert separation(later["MC"], self.natal.bodies_dict["MC"].longitude + self.series.solar_arcs[120]) < 5
+        assert separation(later["IC"], later["MC"] + 180) < 1e-9
+        naibod = ProgressionSeries(self.natal, 0, 60, step_years=60, angle_method="naibod")
+        assert separation(naibod.progressed_at(1)["MC"], later["MC"]) < 3
+
+    def test_directed_aspects(self):
+        results = list(self.series.iter_directed_aspects(chunk_size=16))
+        aspects = self.series.directed_aspects()
+        assert [age for age, _ in results] == self.series.ages
+        assert [found for _, found in results] == aspects
+        index = 40
+        directed = self.series.directed_at(index)
+        assert [a[:3] for a in aspects[index]] == cross_product_aspects(self.engine.aspect_table, directed, self.natal)
+        # Every reported orb is the directed separation minus the aspect angle
+        for body, natal_body, aspect_type, orb, _ in aspects[index]:
+            angle = ASPECT_DATA[aspect_type]["angle"]
+            assert abs(separation(directed[body], self.natal.bodies_dict[natal_body].longitude) - angle) == pytest.approx(abs(orb), abs=1e-6)
+
+    def test_selected_bodies(self):
+        series = ProgressionSeries(self.natal, 10, 20, bodies=["Moon", "Venus"])
+        assert series.body_names == ["Moon", "Venus"] + ANGLES
+        assert series.solar_arcs[0] == pytest.approx(self.series.solar_arcs[20], abs=1e-9)
+
+    def test_natal_chart_without_sun(self):
+        """A natal chart of selected bodies without the Sun still gives the solar arcs of the full chart."""
+        natal = NatalChart("User", self.natal.datetime_utc, self.natal.latitude, self.natal.longitude, engine=self.engine, bodies=["Moon"])
+        series = ProgressionSeries(natal, 0, 60, step_years=0.5)
+        assert series.body_names == ["Moon"]
+        assert list(series.solar_arcs) == pytest.approx(list(self.series.solar_arcs), abs=1e-9)
+        assert series.directed_names == ["Moon"]
+        assert [(p, n, aspect) for p, n, aspect, _, _ in series.progressed_aspects()[0]] == [("Moon", "Moon", "Conjunction")]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            ProgressionSeries(self.natal, 0, 10, step_years=0)
+        with pytest.raises(ValueError):
+            ProgressionSeries(self.natal, 10, 0)
+        with pytest.raises(ValueError):
+            ProgressionSeries(self.natal, 0, 10, angle_method="placidus")
@@ -0,0 +1,103 @@
+"""
+Tests for the rectification search of the nataly library.
+"""
+
+import datetime
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, RectificationSearch, RectificationConstraint
+from nataly.context import datetime_to_jd
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+LAT, LON = 38.4167, 27.150
+START = datetime.datetime(1990, 2, 26, 12)
+END = datetime.datetime(1990, 2, 28, 12)
+
+
+def separation(lon1, lon2):
+    return abs((lon1 - lon2 + 180) % 360 - 180)
+
+
+class TestRectificationSearch:
+    """Test cases for RectificationSearch."""
+
+    def setup_method(self):
+        self.engine = AstroEngine(ephe_path=ephe_path)
+        self.search = RectificationSearch(START, END, LAT, LON, engine=self.engine)
+
+    def chart(self, dt_utc):
+        return NatalChart("Candidate", dt_utc, LAT, LON, engine=self.engine)
+
+    def test_matches_full_charts(self):
+        """Angles, cusps and interpolated bodies agree with full charts."""
+        rng = random.Random(0)
+        for _ in range(10):
+            dt_utc = START + datetime.timedelta(seconds=rng.uniform(0, (END - START).total_seconds()))
+            chart = self.chart(dt_utc)
+            jd = datetime_to_jd(dt_utc)
+            cusps, angles = self.search.houses_at(jd)
+            for name in ("AC", "MC", "IC", "DC"):
+                assert separation(angles[name], chart.bodies_dict[name].longitude) < 1e-5
+            for cusp, house in zip(cusps, chart.houses):
+                assert separation(cusp, house.cusp_longitude) < 1e-5
+            for name in self.search.body_names:
+                assert separation(self.search.longitude_at(name, jd), chart.bodies_dict[name].longitude) < 1e-5
+
+    def test_window_boundaries(self):
+        """Just inside every window the constraints hold; just outside they do not."""
+        windows = self.search.find_windows(["AC in Virgo", "Jupiter in house 10"])
+        assert len(windows) == 2
+        margin = datetime.timedelta(seconds=3)
+        for start, end in windows:
+            assert datetime.timedelta(hours=2) < end - start < datetime.timedelta(hours=3)
+            for dt_utc, inside in ((start - margin, False), (start + margin, True), (end - margin, True), (end + margin, False)):
+                chart = self.chart(dt_utc)
+                holds = chart.bodies_dict["AC"].sign.name == "Virgo" and chart.bodies_dict["Jupiter"].house == 10
+                assert holds == inside
+
+    def test_moon_constraints(self):
+        windows = self.search.find_windows([RectificationConstraint("Moon", house=1), RectificationConstraint("Moon", sign="Aries")])
+        assert windows
+        for start, end in windows:
+            middle = self.chart(start + (end - start) / 2).bodies_dict["Moon"]
+            assert middle.house == 1 and middle.sign.name == "Aries"
+
+    def test_no_constraints_and_impossible_constraints(self):
+        assert self.search.find_windows([]) == [(START, END)]
+        assert self.search.find_windows(["Sun in Leo"]) == []
+
+    def test_parse(self):
+        assert RectificationConstraint.parse("Jupiter in house 10") == RectificationConstraint("Jupiter", house=10)
+        assert RectificationConstraint.parse("True Node in leo") == RectificationConstraint("True Node", sign="Leo")
+        for text in ("Jupiter house 10", "AC in Vulcan", "Moon in house 13"):
+            with pytest.raises(ValueError):
+                RectificationConstraint.parse(text)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            self.search.find_windows(["Vulcan in Leo"])
+        with pytest.raises(ValueError):
+            self.search.find_windows(["AC in Leo"], step=datetime.timedelta(0))
+        with pytest.raises(ValueError):
+            RectificationSearch(END, START, LAT, LON, engine=self.engine)
+        with pytest.raises(ValueError):
+            RectificationConstraint("Moon")
@@ -0,0 +1,97 @@
+"""
+Tests for the return finder of the nataly library.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, ReturnFinder
+from nataly.context import datetime_to_jd
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+
+def separation(lon1, lon2):
+    return abs((lon1 - lon2 + 180) % 360 - 180)
+
+
+class TestReturnFinder:
+    """Test cases for ReturnFinder."""
+
+    def setup_method(self):
+        self.engine = AstroEngine(ephe_path=ephe_path)
+        self.finder = ReturnFinder(self.engine)
+        self.natal = NatalChart("Test", datetime.datetime(1990, 2, 27, 7, 15), 38.4167, 27.150, engine=self.engine)
+
+    def test_solar_return(self):
+        """The solar return chart has the natal Sun longitude, near the birthday."""
+        chart = self.finder.solar_return(self.natal, 2024)
+        assert separation(chart.bodies_dict["Sun"].longitude, self.natal.bodies_dict["Sun"].longitude) < 1e-6
+        assert abs(chart.datetime_utc - datetime.datetime(2024, 2, 27)) < datetime.timedelta(days=2)
+        assert (chart.latitude, chart.longitude) == (self.natal.latitude, self.natal.longitude)
+
+    def test_leap_day_birthday(self):
+        """Births on February 29 still get a return in common years."""
+        natal = NatalChart("Leap", datetime.datetime(2000, 2, 29, 12, 0), 0.0, 0.0, engine=self.engine)
+        chart = self.finder.solar_return(natal, 2023)
+        assert chart.datetime_utc.year == 2023
+        assert separation(chart.bodies_dict["Sun"].longitude, natal.bodies_dict["Sun"].longitude) < 1e-6
+
+    def test_relocated_lunar_return(self):
+        """Lunar returns can be relocated; only the houses and angles change."""
+        near = datetime.datetime(2024, 5, 1)
+        home = self.finder.lunar_return(self.natal, near)
+        away = self.finder.lunar_return(self.natal, near, location=(40.7128, -74.0060))
+        assert home.datetime_utc == away.datetime_utc
+        assert separation(away.bodies_dict["Moon"].longitude, self.natal.bodies_dict["Moon"].longitude) < 1e-6
+        assert (away.latitude, away.longitude) == (40.7128, -74.0060)
+        assert away.bodies_dict["AC"].longitude != home.bodies_dict["AC"].longitude
+
+    def test_batch_matches_single_returns(self):
+        """A year of batch lunar returns equals the returns solved one by one."""
+        start, end = datetime.datetime(2024, 1, 1), datetime.datetime(2025, 1, 1)
+        natals = [self.natal, NatalChart("Other", datetime.datetime(1975, 8, 3, 22, 40), -33.87, 151.21, engine=self.engine)]
+        batches = self.finder.lunar_returns_batch(natals, start, end, locations=[None, (10.0, 20.0)])
+        for natal, charts in zip(natals, batches):
+            assert len(charts) == 13
+            moon = natal.bodies_dict["Moon"].longitude
+            for chart in charts:
+                assert start <= chart.datetime_utc <= end
+                single = self.finder.find_return_jd("Moon", moon, datetime_to_jd(chart.datetime_utc) + 3)
+                assert abs(single - datetime_to_jd(chart.datetime_utc)) < 1e-5
+            gaps = [(b.datetime_utc - a.datetime_utc).days for a, b in zip(charts, charts[1:])]
+            assert all(26 <= gap <= 28 for gap in gaps)
+        assert batches[1][0].latitude == 10.0
+
+    def test_batch_empty_locations(self):
+        """An empty location list gives no returns for no charts and is rejected for any chart."""
+        start, end = datetime.datetime(2024, 1, 1), datetime.datetime(2025, 1, 1)
+        assert self.finder.returns_batch("Sun", [], start, end, locations=[]) == []
+        with pytest.raises(ValueError):
+            self.finder.returns_batch("Sun", [self.natal], start, end, locations=[])
+
+    def test_invalid_body(self):
+        """Bodies that turn retrograde are rejected."""
+        with pytest.raises(ValueError):
+            self.finder.find_return("Mars", 0.0, datetime.datetime(2024, 1, 1))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,84 @@
+"""
+Tests for the sign ingress index of the nataly library.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, SignIndex
+from nataly.aspects import np
+from nataly.context import datetime_to_jd
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+
+class TestSignIndex:
+    """Test cases for SignIndex."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.engine = AstroEngine(ephe_path=ephe_path)
+        cls.start, cls.end = datetime.datetime(2019, 1, 1), datetime.datetime(2021, 1, 1)
+        cls.index = SignIndex.build(cls.start, cls.end, ["Sun", "Moon", "Mercury", "True Node", "South Node"], engine=cls.engine)
+
+    def test_matches_charts(self):
+        """Lookups return the signs of full charts."""
+        for i in range(40):
+            dt_utc = self.start + datetime.timedelta(hours=i * 431.3)
+            chart = NatalChart("Test", dt_utc, 38.4167, 27.150, engine=self.engine)
+            for body in self.index.bodies:
+                assert self.index.sign_at(body, dt_utc) == chart.bodies_dict[body].sign
+
+    def test_bulk_lookup(self):
+        """Bulk lookups agree with single lookups."""
+        jd_start = datetime_to_jd(self.start)
+        jds = [jd_start + i * 1.37 for i in range(500)]
+        bulk = self.index.sign_indexes("Moon", jds)
+        assert [int(i) for i in bulk] == [self.index.sign_index_at("Moon", jd) for jd in jds]
+        signs = self.index.signs("Mercury", [self.start, self.start + datetime.timedelta(days=100)])
+        assert [s.name for s in signs] == [self.index.sign_at("Mercury", t).name for t in (jds[0], jds[0] + 100)]
+
+    def test_validate(self):
+        """The index agrees with the engine, also right around each ingress."""
+        assert self.index.validate(self.engine, samples=200) == []
+
+    def test_save_and_load(self, tmp_path):
+        """A saved index loads back unchanged."""
+        path = tmp_path / "signs.json"
+        assert self.index.save(path)
+        loaded = SignIndex.load(path)
+        assert loaded.ingress_jds == self.index.ingress_jds
+        assert loaded.sign_at("Moon", self.start + datetime.timedelta(days=3)) == self.index.sign_at("Moon", self.start + datetime.timedelta(days=3))
+        with pytest.raises(ValueError):
+            SignIndex.load(tmp_path / "missing.json")
+
+    def test_out_of_range(self):
+        """Instants outside the range and unknown bodies are rejected."""
+        with pytest.raises(ValueError):
+            self.index.sign_at("Sun", datetime.datetime(2022, 1, 1))
+        with pytest.raises(ValueError):
+            self.index.sign_at("Pluto", self.start)
+        if np is not None:
+            with pytest.raises(ValueError):
+                self.index.sign_indexes("Sun", [datetime_to_jd(self.end) + 1])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
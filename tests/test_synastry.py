@@ -0,0 +1,94 @@
+"""
+Tests for the synastry batch engine of the nataly library.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, SynastryBatch, stack_positions
+from nataly.aspects import np
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+
+def engine_tuples(engine, natal, candidate):
+    return [(a.body1.name, a.body2.name, a.aspect_type, a.orb, a.is_applying) for a in engine.get_aspects(natal, candidate)]
+
+
+class TestSynastryBatch:
+    """Test cases for SynastryBatch."""
+
+    def setup_method(self):
+        self.engine = AstroEngine(ephe_path=ephe_path)
+        start = datetime.datetime(1950, 1, 1)
+        self.natal = NatalChart("User", datetime.datetime(1990, 2, 27, 7, 15), 38.4167, 27.150, engine=self.engine)
+        self.candidates = [
+            NatalChart(f"C{i}", start + datetime.timedelta(days=i * 611.7), -40 + i * 5, -150 + i * 17, engine=self.engine)
+            for i in range(15)
+        ]
+        self.names = list(self.candidates[0].bodies_dict)
+
+    @pytest.mark.parametrize("vectorized", [
+        False, pytest.param(True, marks=pytest.mark.skipif(np is None, reason="NumPy is not installed"))
+    ])
+    def test_matches_get_aspects(self, vectorized):
+        """Per-candidate aspects equal one get_aspects call per candidate."""
+        batch = SynastryBatch(self.natal, self.names, self.engine.orb_config, vectorized=vectorized)
+        results = batch.aspects(stack_positions(self.candidates, self.names), chunk_size=4)
+        assert len(results) == len(self.candidates)
+        for candidate, result in zip(self.candidates, results):
+            assert result == engine_tuples(self.engine, self.natal.bodies_dict, candidate.bodies_dict)
+
+    def test_scores(self):
+        """Scores count aspects by default and sum the given weights otherwise."""
+        batch = SynastryBatch(self.natal, self.names)
+        rows = stack_positions(self.candidates, self.names)
+        results = batch.aspects(rows)
+        assert batch.scores(rows) == [float(len(result)) for result in results]
+        weights = {"Trine": 2.0, "Square": -1.0}
+        expected = [sum(weights.get(a[2], 0.0) for a in result) for result in results]
+        assert batch.scores(rows, weights, chunk_size=7) == pytest.approx(expected)
+        assert SynastryBatch(self.natal, self.names, vectorized=False).scores(rows, weights) == pytest.approx(expected)
+        with pytest.raises(ValueError):
+            batch.scores(rows, {"Handshake": 1.0})
+
+    def test_streaming_generator(self):
+        """Candidates can come from a generator and results are streamed in order."""
+        batch = SynastryBatch(self.natal.bodies_dict, self.names)
+        rows = ([c.bodies_dict[name].longitude for name in self.names] for c in self.candidates)
+        stream = batch.iter_aspects(rows, chunk_size=2)
+        first = next(stream)
+        assert first == engine_tuples(self.engine, self.natal.bodies_dict, self.candidates[0].bodies_dict)
+        assert len(list(stream)) == len(self.candidates) - 1
+        with pytest.raises(ValueError):
+            list(batch.iter_aspects([], chunk_size=0))
+
+    def test_missing_bodies(self):
+        """Bodies missing from a candidate (NaN) never form aspects; other pairs are unchanged."""
+        full = self.candidates[0].bodies_dict
+        partial = {name: body for name, body in full.items() if name != "Moon"}
+        expected = [a for a in engine_tuples(self.engine, self.natal.bodies_dict, full) if a[1] != "Moon"]
+        rows = stack_positions([partial], self.names)
+        for vectorized in ([False, True] if np is not None else [False]):
+            batch = SynastryBatch(self.natal, self.names, vectorized=vectorized)
+            assert batch.aspects(rows) == [expected]
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,123 @@
+"""
+Tests for the shared transit timeline of the nataly library.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nataly import AstroEngine, NatalChart, TransitTimeline, EphemerisCache
+
+# === USER MUST SET THIS ===
+# Path to directory containing Swiss Ephemeris .se1 files (e.g. seas_18.se1, sepl_18.se1, ...)
+ephe_path = "./ephe"
+
+# Check ephemeris directory and files
+required_files = [
+    "seas_18.se1", "sepl_18.se1", "semo_18.se1", "seplm18.se1", "semom18.se1"
+]
+if not os.path.isdir(ephe_path):
+    raise RuntimeError(f"Ephemeris directory not found: {ephe_path}")
+missing = [f for f in required_files if not os.path.isfile(os.path.join(ephe_path, f))]
+if missing:
+    raise RuntimeError(f"Missing ephemeris files in {ephe_path}: {missing}\nPlease download from https://www.astro.com/ftp/swisseph/ephe/")
+
+
+def cross_product_aspects(table, transit_positions, natal):
+    """Brute-force oracle: the first aspect within orb of every transit x natal body pair."""
+    aspects = []
+    for transit_name, transit_lon in transit_positions.items():
+        for natal_name, natal_body in natal.bodies_dict.items():
+            diff = abs(natal_body.longitude - transit_lon)
+            separation = min(diff, 360 - diff)
+            buckets = table.candidates[table.index_of(transit_name)][table.index_of(natal_name)]
+            for k, angle, orb_limit in buckets[int(separation)]:
+                orb_diff = separation - angle
+                if abs(orb_diff) <= orb_limit:
+                    aspects.append((transit_name, natal_name, table.aspect_names[k], orb_diff, orb_diff < 0))
+                    break
+    return aspects
+
+
+class TestTransitTimeline:
+    """Test cases for TransitTimeline."""
+
+    def setup_method(self):
+        self.engine = AstroEngine(ephe_path=ephe_path)
+        self.start = datetime.datetime(2024, 1, 1)
+        self.timeline = TransitTimeline(self.start, datetime.datetime(2024, 1, 10), datetime.timedelta(hours=12), engine=self.engine)
+        self.natals = [
+            NatalChart("A", datetime.datetime(1990, 2, 27, 7, 15), 38.4167, 27.150, engine=self.engine),
+            NatalChart("B", datetime.datetime(1975, 8, 3, 22, 40), -33.87, 151.21, engine=self.engine),
+        ]
+
+    def test_steps_and_bodies(self):
+        """Steps include both ends and chart angles are left out."""
+        assert len(self.timeline) == 19
+        assert self.timeline.times[-1] == datetime.datetime(2024, 1, 10)
+        assert not set(self.timeline.body_names) & {"AC", "MC", "IC", "DC"}
+        assert len(self.timeline.longitudes) == 19
+        assert len(self.timeline.speeds[0]) == len(self.timeline.body_names)
+
+    def test_matches_cross_product(self):
+        """Per-step aspects cover every transit x natal pair, in transit body order."""
+        results = list(self.timeline.evaluate(self.natals, chunk_size=5))
+        for index in (0, 7, 18):
+            transit = NatalChart("Transit", self.timeline.times[index], 0.0, 0.0, engine=self.engine, bodies=self.timeline.body_names)
+            positions = self.timeline.positions_at(index)
+            for name, body in transit.bodies_dict.items():
+                assert positions[name] == pytest.approx(body.longitude, abs=1e-9)
+            for natal, result in zip(self.natals, results):
+                expected = cross_product_aspects(self.engine.aspect_table, positions, natal)
+                assert [a[:3] for a in result[index]] == [a[:3] for a in expected]
+                assert [a[3] for a in result[index]] == pytest.approx([a[3] for a in expected], abs=1e-9)
+
+    def test_returns_and_both_directions(self):
+        """A transiting body aspects its own natal position, and X->Y and Y->X are separate pairs."""
+        natal = self.natals[0]
+        timeline = TransitTimeline(datetime.datetime(2020, 1, 6), datetime.datetime(2020, 1, 6), engine=self.engine)
+        found = {(t, n): aspect for t, n, aspect, _, _ in timeline.aspects(natal)[0]}
+        assert found[("Saturn", "Saturn")] == "Conjunction"
+        # At the birth instant every natal aspect is found in both directions
+        timeline = TransitTimeline(natal.datetime_utc, natal.datetime_utc, engine=self.engine)
+        found = {(t, n): aspect for t, n, aspect, _, _ in timeline.aspects(natal)[0]}
+        assert all(found[(n, n)] == "Conjunction" for n in timeline.body_names if n in natal.bodies_dict)
+        table = self.engine.aspect_table
+        pairs = [
+            (a.body1.name, a.body2.name) for a in natal.aspects
+            if a.body1.name in timeline.body_names and a.body2.name in timeline.body_names
+            and table.orbs[table.index_of(a.body1.name)][table.index_of(a.body2.name)] == table.orbs[table.index_of(a.body2.name)][table.index_of(a.body1.name)]
+        ]
+        assert pairs
+        for name1, name2 in pairs:
+            assert (name1, name2) in found and (name2, name1) in found
+
+    def test_iter_aspects(self):
+        """Streamed results carry the step time."""
+        streamed = list(self.timeline.iter_aspects(self.natals[0]))
+        assert [t for t, _ in streamed] == self.timeline.times
+        assert [a for _, a in streamed] == self.timeline.aspects(self.natals[0])
+
+    def test_no_ephemeris_calls_per_natal(self):
+        """Evaluating natal charts reuses the timeline positions."""
+        cache = EphemerisCache()
+        engine = AstroEngine(ephe_path=ephe_path, cache=cache)
+        timeline = TransitTimeline(self.start, self.start + datetime.timedelta(days=3), bodies=["Sun", "Moon"], engine=engine)
+        lookups = cache.hits + cache.misses
+        list(timeline.evaluate(self.natals * 3))
+        assert cache.hits + cache.misses == lookups
+
+    def test_invalid_range(self):
+        """Non-positive steps and reversed ranges are rejected."""
+        with pytest.raises(ValueError):
+            TransitTimeline(self.start, self.start, datetime.timedelta(0), engine=self.engine)
+        with pytest.raises(ValueError):
+            TransitTimeline(self.start, self.start - datetime.timedelta(days=1), engine=self.engine)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])